@@ -22,16 +22,20 @@ References:
 
 from __future__ import annotations
 
+import asyncio
+import calendar
+import functools
 import json
 import logging
 from abc import ABC, abstractmethod
-from datetime import datetime
+from array import array
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Any
+from typing import Any, ClassVar
 from uuid import UUID, uuid4
 
-import litellm
-
 from nova_syntheia.constitution.schema import (
     ActionRecord,
     ActionType,
@@ -46,15 +50,198 @@ from nova_syntheia.governance.permissions import (
     PermissionDecision,
     PermissionEngine,
 )
+from nova_syntheia.integrations import llm_router
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson is absent
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def _render_system_prompt(
+    role_id: str,
+    title: str,
+    branch: str,
+    description: str,
+    continuity_protocol: str,
+    permission_tier_id: str,
+    custom_prompt: str,
+    constraints: tuple[str, ...],
+    authorities: tuple[str, ...],
+) -> str:
+    """
+    Render the constitutional system prompt for a role and tier.
+
+    Memoized so every agent filling the same role under the same tier shares a
+    single prompt string instead of rebuilding an identical copy per instance.
+    """
+    constraints_text = "\n".join(f"  - {c}" for c in constraints)
+    authorities_text = "\n".join(f"  - {a}" for a in authorities)
+
+    return f"""You are the {title} of Nova Syntheia — a constitutional polity
+of human and artificial members.
+
+CONSTITUTIONAL ROLE: {role_id}
+BRANCH: {branch}
+DESCRIPTION: {description}
+
+AUTHORIZED ACTIONS:
+{authorities_text}
+
+CONSTITUTIONAL CONSTRAINTS:
+{constraints_text}
+
+PERMISSION TIER: {permission_tier_id}
+
+MANDATORY REQUIREMENTS:
+1. Every action you take MUST cite constitutional authority (Amendment IV).
+2. You may NOT self-expand your permissions (Article II §2).
+3. You may NOT suppress, alter, or delay logging (Article II §2).
+4. You may NOT override judicial decisions (Article II §2).
+5. Every action must include: objective, justification, citations, inputs, outputs (Article II §3).
+6. If you cannot cite constitutional authority for an action, you CANNOT take it (Amendment IV).
+7. Restrictions on any member require due process (Amendment V).
+
+CONTINUITY PROTOCOL: {continuity_protocol}
+
+{custom_prompt}"""
+
+
 class ConstitutionalActionError(Exception):
     """Raised when an agent action violates constitutional constraints."""
     pass
 
 
+def _format_context(context: dict[str, Any]) -> str:
+    """
+    Pretty-print reasoning context, using orjson when it is installed.
+
+    Both paths emit the same text, except that orjson writes floats below
+    1e-4 without a zero-padded exponent (2.5e-7 rather than 2.5e-07).
+    """
+    if orjson is not None:
+        # Datetimes and dataclasses go through default=str, as with stdlib json
+        options = (
+            orjson.OPT_INDENT_2
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        try:
+            return orjson.dumps(context, option=options, default=str).decode()
+        except TypeError:
+            pass  # orjson rejects non-str keys; stdlib handles them
+    # orjson writes non-ASCII text as UTF-8, so the stdlib path does too
+    return json.dumps(context, indent=2, ensure_ascii=False, default=str)
+
+
+def coerce_uuid(value: UUID | str) -> UUID:
+    """Accept an ID as a UUID or its string form."""
+    return value if isinstance(value, UUID) else UUID(value)
+
+
+# Most recent executed actions retained in memory per agent (the ledger keeps all)
+ACTION_HISTORY_MAXLEN = 10_000
+
+_ACTION_TYPES: tuple[ActionType, ...] = tuple(ActionType)
+_ACTION_TYPE_INDEX: dict[ActionType, int] = {t: i for i, t in enumerate(_ACTION_TYPES)}
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class ActionHistoryStore:
+    """
+    Columnar, bounded record of the actions an agent has executed.
+
+    Each column is a flat typed array (16-byte action IDs, ActionType
+    indices, UTC nanosecond timestamps) filled as a ring buffer, so memory
+    stays fixed at ``maxlen`` rows no matter how long the agent runs. Rows
+    that roll off are not lost — every executed action is already recorded
+    in the National Ledger (Art. II §3).
+    """
+
+    def __init__(self, maxlen: int = ACTION_HISTORY_MAXLEN) -> None:
+        self.maxlen = maxlen
+        self._action_ids = bytearray(16 * maxlen)
+        self._action_types = array("H", bytes(2 * maxlen))
+        self._timestamps_ns = array("q", bytes(8 * maxlen))
+        self._next = 0
+        self._size = 0
+        self.total_recorded = 0
+
+    def record(self, action_id: UUID, action_type: ActionType, timestamp: datetime) -> None:
+        """Append one executed action, overwriting the oldest row when full."""
+        i = self._next
+        self._action_ids[16 * i:16 * (i + 1)] = action_id.bytes
+        self._action_types[i] = _ACTION_TYPE_INDEX[action_type]
+        self._timestamps_ns[i] = (
+            calendar.timegm(timestamp.utctimetuple()) * 1_000_000_000
+            + timestamp.microsecond * 1_000
+        )
+        self._next = (i + 1) % self.maxlen
+        self._size = min(self._size + 1, self.maxlen)
+        self.total_recorded += 1
+
+    def __len__(self) -> int:
+        """Number of rows currently retained (at most ``maxlen``)."""
+        return self._size
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Yield retained rows oldest first as lightweight dicts."""
+        start = (self._next - self._size) % self.maxlen
+        for offset in range(self._size):
+            i = (start + offset) % self.maxlen
+            ns = self._timestamps_ns[i]
+            yield {
+                "action_id": UUID(bytes=bytes(self._action_ids[16 * i:16 * (i + 1)])),
+                "action_type": _ACTION_TYPES[self._action_types[i]],
+                "timestamp": _UNIX_EPOCH + timedelta(microseconds=ns // 1_000),
+            }
+
+
+# Operational action types whose authority is fixed by the Constitution, so
+# their citations are prebuilt instead of generated per action (Amend. IV).
+# Only used when the acting role lists the action among its authorities.
+_BOUNDED_AUTONOMY = Citation(
+    article="II",
+    section=2,
+    text_excerpt=(
+        "Act independently within clearly defined permission tiers "
+        "established by the Legislative Assembly."
+    ),
+    relevance="Routine operational action within the agent's standing permission tier",
+)
+_CUSTODIANSHIP = Citation(
+    article="VIII",
+    section=5,
+    text_excerpt=(
+        "The Custodian ensures integrity, availability, and accessibility of "
+        "the record. The Custodian may not alter entries."
+    ),
+    relevance="Ledger custodial action: appending new entries or verifying integrity",
+)
+_STATIC_CITATIONS: dict[ActionType, tuple[Citation, ...]] = {
+    ActionType.ROUTINE_OPERATION: (_BOUNDED_AUTONOMY,),
+    ActionType.AGENT_COORDINATION: (_BOUNDED_AUTONOMY,),
+    ActionType.NOTIFICATION_DISPATCH: (_BOUNDED_AUTONOMY,),
+    ActionType.SESSION_MANAGEMENT: (_BOUNDED_AUTONOMY,),
+    ActionType.WRITE_LEDGER_ENTRY: (_CUSTODIANSHIP,),
+    ActionType.VERIFY_CHAIN: (_CUSTODIANSHIP,),
+}
+
+
+@dataclass(slots=True)
+class ActionSpec:
+    """One action in an execute_actions_bulk() batch — mirrors execute_action()."""
+
+    action_type: ActionType
+    objective: str
+    justification: str
+    inputs: dict[str, Any] | None = None
+    dollar_amount: Decimal | None = None
+
+
 class BaseConstitutionalAgent(ABC):
     """
     Base class for all constitutional agents in Nova Syntheia.
@@ -65,6 +252,9 @@ class BaseConstitutionalAgent(ABC):
     Subclasses implement the specific capabilities of their constitutional role.
     """
 
+    # Role-based fallback citations, built once per (action type, role)
+    _fallback_citations: ClassVar[dict[tuple[ActionType, str], Citation]] = {}
+
     def __init__(
         self,
         member_id: UUID,
@@ -99,9 +289,11 @@ class BaseConstitutionalAgent(ABC):
 
         # Build the constitutional system prompt
         self._base_system_prompt = self._build_system_prompt(system_prompt)
+        # Sent first on every reasoning call — a stable, cacheable prefix
+        self._system_message = llm_router.system_message(model, self._base_system_prompt)
 
         # Action history for this agent's session
-        self.action_history: list[dict[str, Any]] = []
+        self.action_history = ActionHistoryStore()
 
         logger.info(
             "Agent instantiated: role=%s tier=%s model=%s member=%s",
@@ -110,36 +302,18 @@ class BaseConstitutionalAgent(ABC):
 
     def _build_system_prompt(self, custom_prompt: str) -> str:
         """Build the constitutional system prompt for this agent."""
-        constraints = "\n".join(f"  - {c}" for c in self.role.constraints)
-        authorities = "\n".join(f"  - {a.value}" for a in self.role.authorities)
-
-        return f"""You are the {self.role.title} of Nova Syntheia — a constitutional polity
-of human and artificial members.
-
-CONSTITUTIONAL ROLE: {self.role.id}
-BRANCH: {self.role.branch.value}
-DESCRIPTION: {self.role.description}
-
-AUTHORIZED ACTIONS:
-{authorities}
-
-CONSTITUTIONAL CONSTRAINTS:
-{constraints}
-
-PERMISSION TIER: {self.permission_tier_id}
-
-MANDATORY REQUIREMENTS:
-1. Every action you take MUST cite constitutional authority (Amendment IV).
-2. You may NOT self-expand your permissions (Article II §2).
-3. You may NOT suppress, alter, or delay logging (Article II §2).
-4. You may NOT override judicial decisions (Article II §2).
-5. Every action must include: objective, justification, citations, inputs, outputs (Article II §3).
-6. If you cannot cite constitutional authority for an action, you CANNOT take it (Amendment IV).
-7. Restrictions on any member require due process (Amendment V).
-
-CONTINUITY PROTOCOL: {self.role.continuity_protocol}
-
-{custom_prompt}"""
+        return _render_system_prompt(
+            role_id=self.role.id,
+            title=self.role.title,
+            branch=self.role.branch.value,
+            description=self.role.description,
+            continuity_protocol=self.role.continuity_protocol,
+            permission_tier_id=self.permission_tier_id,
+            custom_prompt=custom_prompt,
+            constraints=tuple(self.role.constraints),
+            # Declaration order, so the prompt is stable across processes
+            authorities=tuple(a.value for a in _ACTION_TYPES if a in self.role.authorities),
+        )
 
     async def execute_action(
         self,
@@ -156,7 +330,7 @@ CONTINUITY PROTOCOL: {self.role.continuity_protocol}
         1. Permission check
         2. Citation generation
         3. Action execution (subclass implementation)
-        4. Ledger logging
+        4. Ledger logging (queued; committed in the background)
 
         Args:
             action_type: The type of action being taken.
@@ -172,13 +346,16 @@ CONTINUITY PROTOCOL: {self.role.continuity_protocol}
             ConstitutionalActionError: If the action is forbidden or cannot be cited.
         """
         action_id = uuid4()
+        action_ref = str(action_id)  # formatted once for logs and results
         inputs = inputs or {}
-        timestamp = datetime.utcnow()
+        timestamp = datetime.now(timezone.utc)
 
-        logger.info(
-            "Action proposed: id=%s type=%s role=%s objective='%s'",
-            str(action_id)[:8], action_type.value, self.role.id, objective[:80],
-        )
+        if logger.isEnabledFor(logging.INFO):
+            # Skip the argument slicing entirely when INFO is filtered out
+            logger.info(
+                "Action proposed: id=%s type=%s role=%s objective='%s'",
+                action_ref[:8], action_type.value, self.role.id, objective[:80],
+            )
 
         # ── Step 1: Permission Check (Art. II §2) ──────────────
         perm_result = self.permission_engine.check_permission(
@@ -207,11 +384,11 @@ CONTINUITY PROTOCOL: {self.role.continuity_protocol}
         ):
             # Escalate — don't execute, create an escalation record
             escalation = await self._escalate_action(
-                action_id, action_type, objective, justification, inputs,
+                action_ref, action_type, objective, justification, inputs,
                 perm_result, dollar_amount, timestamp,
             )
             return {
-                "action_id": str(action_id),
+                "action_id": action_ref,
                 "status": "escalated",
                 "reason": perm_result.reason,
                 "escalation": escalation,
@@ -235,7 +412,7 @@ CONTINUITY PROTOCOL: {self.role.continuity_protocol}
         except Exception as e:
             logger.error(
                 "Action execution failed: id=%s error=%s",
-                str(action_id)[:8], str(e),
+                action_ref[:8], str(e),
             )
             raise
 
@@ -250,23 +427,77 @@ CONTINUITY PROTOCOL: {self.role.continuity_protocol}
             agent_role_id=self.role.id,
         )
 
-        ledger_entry_id = await self._log_action(
+        ledger_entry_id, ledger_status = self._log_action(
             action_id, action_type, action_record, timestamp,
         )
 
         result = {
-            "action_id": str(action_id),
+            "action_id": action_ref,
             "status": "executed",
             "action_type": action_type.value,
             "outputs": outputs,
-            "citations": [c.model_dump() for c in citations],
+            "citations": [c.cached_dump() for c in citations],
             "ledger_entry_id": str(ledger_entry_id) if ledger_entry_id else None,
+            "ledger_status": ledger_status,
             "timestamp": timestamp.isoformat(),
         }
 
-        self.action_history.append(result)
+        self.action_history.record(action_id, action_type, timestamp)
         return result
 
+    async def execute_actions_bulk(
+        self,
+        actions: list[ActionSpec],
+    ) -> list[dict[str, Any]]:
+        """
+        Execute a batch of independent actions concurrently.
+
+        Every action still passes through the full governance wrapper of
+        execute_action(); the stages simply overlap across the batch.
+        Permission checks run synchronously up front, citation requests land
+        in the same CitationBatcher window, handlers run concurrently, and
+        the ledger writer commits the queued records together.
+
+        Args:
+            actions: The actions to execute. They must not depend on each other.
+
+        Returns:
+            One result dict per action, in input order. Actions that are
+            forbidden or cannot be cited yield status "rejected"; handler
+            failures yield status "failed". Neither aborts the rest of the batch.
+        """
+        outcomes = await asyncio.gather(
+            *(
+                self.execute_action(
+                    action_type=spec.action_type,
+                    objective=spec.objective,
+                    justification=spec.justification,
+                    inputs=spec.inputs,
+                    dollar_amount=spec.dollar_amount,
+                )
+                for spec in actions
+            ),
+            return_exceptions=True,
+        )
+
+        results: list[dict[str, Any]] = []
+        for spec, outcome in zip(actions, outcomes):
+            if isinstance(outcome, ConstitutionalActionError):
+                results.append({
+                    "status": "rejected",
+                    "action_type": spec.action_type.value,
+                    "error": str(outcome),
+                })
+            elif isinstance(outcome, BaseException):
+                results.append({
+                    "status": "failed",
+                    "action_type": spec.action_type.value,
+                    "error": str(outcome),
+                })
+            else:
+                results.append(outcome)
+        return results
+
     async def _generate_citations(
         self,
         action_type: ActionType,
@@ -274,23 +505,31 @@ CONTINUITY PROTOCOL: {self.role.continuity_protocol}
         justification: str,
     ) -> list[Citation]:
         """Generate constitutional citations for an action."""
+        static = _STATIC_CITATIONS.get(action_type)
+        if static is not None and action_type in self.role.authorities:
+            # Copies: the constants are shared by every agent and Citation is mutable
+            return [c.model_copy() for c in static]
+
         if self.citation_service is None:
             # Fallback: generate a basic citation from the role's authorities
             logger.warning("No citation service available — using role-based fallback")
-            return [
-                Citation(
+            key = (action_type, self.role.id)
+            fallback = self._fallback_citations.get(key)
+            if fallback is None:
+                fallback = Citation(
                     article="II",
                     section=2,
                     text_excerpt="Act independently within clearly defined permission tiers",
                     relevance=f"Action {action_type.value} falls within the authorized "
                     f"actions of role {self.role.id}",
                 )
-            ]
+                self._fallback_citations[key] = fallback
+            return [fallback.model_copy()]
 
         description = f"{action_type.value}: {objective}. Justification: {justification}"
 
         try:
-            citations = await self.citation_service.generate_citations_with_llm(
+            citations = await self.citation_service.generate_citations_batched(
                 action_description=description,
                 action_type=action_type.value,
                 model=self.model,
@@ -306,29 +545,62 @@ CONTINUITY PROTOCOL: {self.role.continuity_protocol}
             action_type=action_type.value,
         )
 
-    async def _log_action(
+    def _log_action(
         self,
         action_id: UUID,
         action_type: ActionType,
         action_record: ActionRecord,
         timestamp: datetime,
-    ) -> UUID | None:
-        """Log an executed action to the National Ledger."""
+    ) -> tuple[UUID | None, str]:
+        """
+        Queue an executed action for the National Ledger.
+
+        The entry is handed to the ledger service's shared batcher and
+        committed in the background, so the action does not wait on the
+        database. Its ID is allocated here so callers can cite it at once;
+        a failed commit is logged, and flush_ledger() waits for the queue.
+
+        Returns:
+            The pre-allocated ledger entry ID (None without a ledger) and a
+            ledger status: "queued" or "unrecorded" (no ledger).
+        """
         if self.ledger_service is None:
             logger.warning("No ledger service — action not recorded")
-            return None
+            return None, "unrecorded"
+
+        entry_id = uuid4()
+        outputs = action_record.outputs
+        # model_dump(mode="json") builds a fresh tree, so the queued content
+        # is unaffected if the caller later mutates its inputs or outputs
+        future = self.ledger_service.shared_batcher().submit(
+            entry_type=LedgerEntryType.EXECUTIVE_ACTION.value,
+            author_role=self.role.id,
+            author_member_id=self.member_id,
+            content=action_record.model_dump(mode="json"),
+            entry_id=entry_id,
+        )
 
-        try:
-            entry = self.ledger_service.append(
-                entry_type=LedgerEntryType.EXECUTIVE_ACTION.value,
-                author_role=self.role.id,
-                author_member_id=self.member_id,
-                content=action_record.model_dump(mode="json"),
-            )
-            return entry.id
-        except Exception as e:
-            logger.error("Failed to log action to ledger: %s", e)
-            return None
+        def _done(future: asyncio.Future[Any]) -> None:
+            if future.cancelled():
+                return
+            error = future.exception()
+            if error is not None:
+                logger.error(
+                    "Failed to log action to ledger: id=%s error=%s", str(action_id)[:8], error
+                )
+            else:
+                self._on_ledger_recorded(outputs, entry_id)
+
+        future.add_done_callback(_done)
+        return entry_id, "queued"
+
+    def _on_ledger_recorded(self, outputs: dict[str, Any], entry_id: UUID) -> None:
+        """Hook called once an executed action's ledger entry is committed."""
+
+    async def flush_ledger(self) -> None:
+        """Wait until every queued ledger write has been committed or has failed."""
+        if self.ledger_service is not None:
+            await self.ledger_service.shared_batcher().flush()
 
     async def _log_denied_action(
         self,
@@ -344,7 +616,7 @@ CONTINUITY PROTOCOL: {self.role.continuity_protocol}
             return
 
         try:
-            self.ledger_service.append(
+            await self.ledger_service.shared_batcher().append(
                 entry_type=LedgerEntryType.EXECUTIVE_ACTION.value,
                 author_role=self.role.id,
                 author_member_id=self.member_id,
@@ -362,7 +634,7 @@ CONTINUITY PROTOCOL: {self.role.continuity_protocol}
 
     async def _escalate_action(
         self,
-        action_id: UUID,
+        action_id: str,
         action_type: ActionType,
         objective: str,
         justification: str,
@@ -373,7 +645,7 @@ CONTINUITY PROTOCOL: {self.role.continuity_protocol}
     ) -> dict[str, Any]:
         """Create an escalation record for an action requiring approval."""
         escalation = {
-            "action_id": str(action_id),
+            "action_id": action_id,
             "action_type": action_type.value,
             "requesting_role": self.role.id,
             "requesting_member": str(self.member_id),
@@ -389,7 +661,7 @@ CONTINUITY PROTOCOL: {self.role.continuity_protocol}
 
         if self.ledger_service:
             try:
-                self.ledger_service.append(
+                await self.ledger_service.shared_batcher().append(
                     entry_type=LedgerEntryType.EXECUTIVE_ACTION.value,
                     author_role=self.role.id,
                     author_member_id=self.member_id,
@@ -421,29 +693,67 @@ CONTINUITY PROTOCOL: {self.role.continuity_protocol}
         Returns:
             The LLM's response.
         """
-        messages = [
-            {"role": "system", "content": self._base_system_prompt},
-        ]
+        try:
+            response = await llm_router.acompletion(
+                model=self.model,
+                messages=self._reasoning_messages(prompt, context),
+                temperature=0.3,
+            )
+            return response.choices[0].message.content or ""
+        except Exception as e:
+            logger.error("LLM reasoning failed: %s", e)
+            raise
 
-        if context:
-            messages.append({
-                "role": "system",
-                "content": f"Additional context:\n{json.dumps(context, indent=2, default=str)}",
-            })
+    async def reason_stream(
+        self,
+        prompt: str,
+        context: dict[str, Any] | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream the agent's reasoning as it is generated.
 
-        messages.append({"role": "user", "content": prompt})
+        Same request as reason(), but text fragments are yielded as they
+        arrive so callers can start processing long drafts (opinions,
+        analyses) before the final token.
+
+        Args:
+            prompt: The reasoning prompt.
+            context: Additional context to include.
 
+        Yields:
+            Successive fragments of the LLM's response.
+        """
         try:
-            response = await litellm.acompletion(
+            response = await llm_router.acompletion(
                 model=self.model,
-                messages=messages,
+                messages=self._reasoning_messages(prompt, context),
                 temperature=0.3,
+                stream=True,
             )
-            return response.choices[0].message.content or ""
+            async for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
         except Exception as e:
             logger.error("LLM reasoning failed: %s", e)
             raise
 
+    def _reasoning_messages(
+        self,
+        prompt: str,
+        context: dict[str, Any] | None,
+    ) -> list[dict[str, Any]]:
+        """Assemble the chat messages shared by reason() and reason_stream()."""
+        messages = [self._system_message]
+
+        if context:
+            messages.append({
+                "role": "system",
+                "content": f"Additional context:\n{_format_context(context)}",
+            })
+
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
     @abstractmethod
     async def _execute(
         self,
@@ -480,6 +790,6 @@ CONTINUITY PROTOCOL: {self.role.continuity_protocol}
             "branch": self.role.branch.value,
             "permission_tier": self.permission_tier_id,
             "model": self.model,
-            "actions_taken": len(self.action_history),
+            "actions_taken": self.action_history.total_recorded,
             "capabilities": self.get_capabilities(),
         }
@@ -16,14 +16,15 @@ References:
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, ClassVar
 from uuid import UUID
 
-from nova_syntheia.agents.base import BaseConstitutionalAgent
+from nova_syntheia.agents.base import BaseConstitutionalAgent, coerce_uuid
 from nova_syntheia.constitution.schema import (
     ActionType,
     FOUNDING_ROLES,
 )
+from nova_syntheia.ledger.service import LedgerAppendBatcher
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,12 @@ class LedgerCustodianAgent(BaseConstitutionalAgent):
     for new entries and read-only for existing ones (Art. VIII §5).
     """
 
+    # ActionType → handler method name, resolved per call via getattr
+    _HANDLERS: ClassVar[dict[ActionType, str]] = {
+        ActionType.WRITE_LEDGER_ENTRY: "_handle_write",
+        ActionType.VERIFY_CHAIN: "_handle_verify",
+    }
+
     def __init__(self, member_id: UUID, model: str, **kwargs: Any) -> None:
         super().__init__(
             member_id=member_id,
@@ -71,6 +78,7 @@ system. Its integrity is a constitutional requirement (Art. VIII §1).""",
             **kwargs,
         )
         self._last_verification: dict[str, Any] | None = None
+        self._write_batcher: LedgerAppendBatcher | None = None
 
     async def _execute(
         self,
@@ -78,13 +86,8 @@ system. Its integrity is a constitutional requirement (Art. VIII §1).""",
         inputs: dict[str, Any],
     ) -> dict[str, Any]:
         """Execute a custodial action."""
-        handlers = {
-            ActionType.WRITE_LEDGER_ENTRY: self._handle_write,
-            ActionType.VERIFY_CHAIN: self._handle_verify,
-        }
-
-        handler = handlers.get(action_type)
-        if handler is None:
+        handler_name = self._HANDLERS.get(action_type)
+        if handler_name is None:
             return {
                 "status": "unsupported",
                 "message": (
@@ -93,14 +96,16 @@ system. Its integrity is a constitutional requirement (Art. VIII §1).""",
                 ),
             }
 
-        return await handler(inputs)
+        return await getattr(self, handler_name)(inputs)
 
     async def _handle_write(self, inputs: dict[str, Any]) -> dict[str, Any]:
         """
         Write a new entry to the National Ledger.
 
         The custodian writes entries on behalf of other agents.
-        The actual hash chain computation is handled by the LedgerService.
+        Concurrent writes are coalesced into 250ms windows and committed as a
+        single chained block; the hash chain computation is handled by the
+        LedgerService.
         """
         entry_type = inputs.get("entry_type", "")
         author_role = inputs.get("author_role", "")
@@ -113,11 +118,15 @@ system. Its integrity is a constitutional requirement (Art. VIII §1).""",
                 "message": "Ledger service not available",
             }
 
+        batcher = self._write_batcher
+        if batcher is None or batcher.ledger_service is not self.ledger_service:
+            self._write_batcher = LedgerAppendBatcher(self.ledger_service)
+
         try:
-            entry = self.ledger_service.append(
+            entry = await self._write_batcher.append(
                 entry_type=entry_type,
                 author_role=author_role,
-                author_member_id=UUID(author_member_id) if isinstance(author_member_id, str) else author_member_id,
+                author_member_id=coerce_uuid(author_member_id),
                 content=content,
                 supersedes=inputs.get("supersedes"),
                 emergency_designation=inputs.get("emergency", False),
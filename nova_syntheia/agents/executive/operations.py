@@ -16,8 +16,12 @@ References:
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, ClassVar
 from uuid import UUID
 
 from nova_syntheia.agents.base import BaseConstitutionalAgent
@@ -28,6 +32,12 @@ from nova_syntheia.constitution.schema import (
 
 logger = logging.getLogger(__name__)
 
+NOTIFICATION_QUEUE_MAXSIZE = 10_000
+# Concurrent deliveries; dispatch awaits network I/O, so this is not tied to CPU count
+NOTIFICATION_WORKERS = 8
+
+NotificationChannel = Callable[[dict[str, Any]], Awaitable[None]]
+
 
 class OperationsExecutiveAgent(BaseConstitutionalAgent):
     """
@@ -44,7 +54,21 @@ class OperationsExecutiveAgent(BaseConstitutionalAgent):
     that constitutional processes run smoothly and on schedule.
     """
 
-    def __init__(self, member_id: UUID, model: str, **kwargs: Any) -> None:
+    # ActionType → handler method name, resolved per call via getattr
+    _HANDLERS: ClassVar[dict[ActionType, str]] = {
+        ActionType.ROUTINE_OPERATION: "_handle_routine_operation",
+        ActionType.AGENT_COORDINATION: "_handle_agent_coordination",
+        ActionType.NOTIFICATION_DISPATCH: "_handle_notification",
+        ActionType.SESSION_MANAGEMENT: "_handle_session_management",
+    }
+
+    def __init__(
+        self,
+        member_id: UUID,
+        model: str,
+        notification_workers: int = NOTIFICATION_WORKERS,
+        **kwargs: Any,
+    ) -> None:
         super().__init__(
             member_id=member_id,
             role=FOUNDING_ROLES["operations_executive"],
@@ -71,7 +95,16 @@ Current institutional priorities:
             **kwargs,
         )
         self.cycle_manager = None  # Set by orchestrator
-        self.notification_queue: list[dict[str, Any]] = []
+        # channel name → async sender; unknown channels fall back to the dashboard
+        self.notification_channels: dict[str, NotificationChannel] = {
+            "dashboard": self._deliver_to_dashboard,
+        }
+        self.delivered_notifications: deque[dict[str, Any]] = deque(maxlen=1000)
+        self.notification_workers = notification_workers
+        # (enqueue time, notification) pairs; the time feeds the lag metric
+        self.notification_queue: asyncio.Queue[tuple[float, dict[str, Any]]] | None = None
+        self._notification_workers: list[asyncio.Task[None]] = []
+        self._notification_stats = {"dispatched": 0, "failed": 0, "max_lag_ms": 0.0}
 
     async def _execute(
         self,
@@ -79,21 +112,14 @@ Current institutional priorities:
         inputs: dict[str, Any],
     ) -> dict[str, Any]:
         """Execute an operations action."""
-        handlers = {
-            ActionType.ROUTINE_OPERATION: self._handle_routine_operation,
-            ActionType.AGENT_COORDINATION: self._handle_agent_coordination,
-            ActionType.NOTIFICATION_DISPATCH: self._handle_notification,
-            ActionType.SESSION_MANAGEMENT: self._handle_session_management,
-        }
-
-        handler = handlers.get(action_type)
-        if handler is None:
+        handler_name = self._HANDLERS.get(action_type)
+        if handler_name is None:
             return {
                 "status": "unsupported",
                 "message": f"Action type {action_type.value} not implemented",
             }
 
-        return await handler(inputs)
+        return await getattr(self, handler_name)(inputs)
 
     async def _handle_routine_operation(
         self, inputs: dict[str, Any]
@@ -108,8 +134,9 @@ Current institutional priorities:
                     len(self.cycle_manager.list_active_sessions())
                     if self.cycle_manager else 0
                 ),
-                "pending_notifications": len(self.notification_queue),
-                "actions_taken": len(self.action_history),
+                "pending_notifications": self._pending_notifications(),
+                "notification_stats": dict(self._notification_stats),
+                "actions_taken": self.action_history.total_recorded,
             }
 
         if operation == "health_check":
@@ -141,22 +168,103 @@ Current institutional priorities:
     async def _handle_notification(
         self, inputs: dict[str, Any]
     ) -> dict[str, Any]:
-        """Dispatch notifications to members."""
-        notification = {
-            "recipient_id": inputs.get("recipient_id"),
-            "subject": inputs.get("subject", ""),
-            "body": inputs.get("body", ""),
-            "priority": inputs.get("priority", "normal"),
-            "channel": inputs.get("channel", "dashboard"),
-        }
+        """
+        Dispatch notifications to members.
+
+        Notifications are handed to a bounded queue drained by a pool of
+        dispatch workers, so a slow channel never stalls the agent. Pass
+        ``notifications`` (a list of dicts) to enqueue a batch at once.
+        """
+        queue = self._ensure_notification_workers()
+        batch = inputs.get("notifications") or [inputs]
+        notifications = [
+            {
+                "recipient_id": n.get("recipient_id"),
+                "subject": n.get("subject", ""),
+                "body": n.get("body", ""),
+                "priority": n.get("priority", "normal"),
+                "channel": n.get("channel", "dashboard"),
+            }
+            for n in batch
+        ]
 
-        self.notification_queue.append(notification)
+        for notification in notifications:
+            # put() waits when the queue is full — backpressure on producers
+            await queue.put((time.monotonic(), notification))
 
-        return {
+        result: dict[str, Any] = {
             "status": "dispatched",
-            "notification": notification,
-            "queue_length": len(self.notification_queue),
+            "queue_length": queue.qsize(),
         }
+        if "notifications" in inputs:
+            result["notifications"] = notifications
+        else:
+            result["notification"] = notifications[0]
+        return result
+
+    def _ensure_notification_workers(self) -> asyncio.Queue[tuple[float, dict[str, Any]]]:
+        """Start the dispatch pool on the running loop if it is not running."""
+        loop = asyncio.get_running_loop()
+        if (
+            self.notification_queue is None
+            or not self._notification_workers
+            or self._notification_workers[0].get_loop() is not loop
+        ):
+            self.notification_queue = asyncio.Queue(maxsize=NOTIFICATION_QUEUE_MAXSIZE)
+            self._notification_workers = [
+                loop.create_task(self._run_notification_worker())
+                for _ in range(self.notification_workers)
+            ]
+        return self.notification_queue
+
+    async def _run_notification_worker(self) -> None:
+        """Deliver queued notifications through their channel adapter."""
+        assert self.notification_queue is not None
+        queue = self.notification_queue
+        while True:
+            queued_at, notification = await queue.get()
+            lag_ms = (time.monotonic() - queued_at) * 1000
+            stats = self._notification_stats
+            stats["max_lag_ms"] = max(stats["max_lag_ms"], lag_ms)
+            channel = self.notification_channels.get(
+                notification["channel"], self._deliver_to_dashboard
+            )
+            try:
+                await channel(notification)
+                stats["dispatched"] += 1
+            except Exception as e:
+                stats["failed"] += 1
+                logger.error(
+                    "Notification delivery failed: channel=%s error=%s",
+                    notification["channel"], e,
+                )
+            finally:
+                queue.task_done()
+
+    async def _deliver_to_dashboard(self, notification: dict[str, Any]) -> None:
+        """Default channel: keep recent notifications for the dashboard to show."""
+        self.delivered_notifications.append(notification)
+
+    def _pending_notifications(self) -> int:
+        return self.notification_queue.qsize() if self.notification_queue else 0
+
+    async def flush_notifications(self) -> None:
+        """Wait until every queued notification has been delivered."""
+        if self.notification_queue is not None and self._notification_workers:
+            await self.notification_queue.join()
+
+    async def aclose(self) -> None:
+        """
+        Stop the dispatch pool.
+
+        Undelivered notifications are dropped; call flush_notifications()
+        first to deliver them.
+        """
+        workers, self._notification_workers = self._notification_workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self.notification_queue = None
 
     async def _handle_session_management(
         self, inputs: dict[str, Any]
@@ -18,8 +18,9 @@ References:
 from __future__ import annotations
 
 import logging
-from decimal import Decimal
-from typing import Any
+from collections.abc import Callable
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, ClassVar
 from uuid import UUID
 
 from nova_syntheia.agents.base import BaseConstitutionalAgent
@@ -27,9 +28,108 @@ from nova_syntheia.constitution.schema import (
     ActionType,
     FOUNDING_ROLES,
 )
+from nova_syntheia.integrations.alpaca_client import OrderSide
 
 logger = logging.getLogger(__name__)
 
+Cents = int  # money is held as integer cents; formatted only for display
+_CENT = Decimal("0.01")
+
+
+def fmt_usd(cents: Cents) -> str:
+    """Format integer cents as a dollar string, e.g. 5000 → "50.00"."""
+    sign = "-" if cents < 0 else ""
+    dollars, rem = divmod(abs(cents), 100)
+    return f"{sign}{dollars}.{rem:02d}"
+
+
+def _to_cents(amount: Any) -> Cents:
+    """
+    Convert a dollar amount (str, float, int or Decimal) to integer cents.
+
+    Goes through str() so a float converts by its shortest repr rather than
+    its binary expansion; half cents round up.
+    """
+    return int(Decimal(str(amount)).quantize(_CENT, rounding=ROUND_HALF_UP) * 100)
+
+
+def _to_dollars(cents: Cents) -> Decimal:
+    """Exact dollar amount for an order payload, e.g. 1250 → Decimal("12.50")."""
+    return Decimal(cents).scaleb(-2)
+
+
+STARTING_CAPITAL_CENTS: Cents = 5000
+
+# max_allocation units that cap a share of the whole portfolio, not a dollar amount
+_POSITION_RELATIVE_UNITS = frozenset({"percent", "ratio"})
+
+# A compiled directive check: trade inputs → (compliant, reason)
+DirectiveCheck = Callable[[dict[str, Any]], tuple[bool, str]]
+
+
+def _compile_max_allocation(constraint: Any) -> DirectiveCheck | None:
+    """
+    Dollar caps on buys of a single symbol.
+
+    Sells only reduce exposure and are never capped. A buy sized by share
+    count has no dollar amount to check, so it is rejected rather than let
+    through. Percent and ratio caps need live positions, so they are logged
+    and left unchecked; any other unit is rejected rather than silently ignored.
+    """
+    if constraint.unit in _POSITION_RELATIVE_UNITS:
+        logger.warning(
+            "max_allocation on %s is %s %s of the portfolio; not checked per trade "
+            "until positions are tracked",
+            constraint.target, constraint.value, constraint.unit,
+        )
+        return None
+    if constraint.unit != "dollars":
+        raise ValueError(
+            f"max_allocation on {constraint.target} has unsupported unit {constraint.unit!r}"
+        )
+    symbol, limit = constraint.target, _to_cents(constraint.value)
+
+    def check(trade: dict[str, Any]) -> tuple[bool, str]:
+        if trade.get("symbol") != symbol or trade.get("side", "buy") != "buy":
+            return True, ""
+        notional = trade.get("notional")
+        if notional is None:
+            return False, f"max_allocation: {symbol} buys must be sized by notional"
+        if _to_cents(notional) > limit:
+            return False, f"max_allocation: {symbol} capped at ${fmt_usd(limit)}"
+        return True, ""
+
+    return check
+
+
+def _compile_forbidden_asset_class(constraint: Any) -> DirectiveCheck | None:
+    forbidden = constraint.target
+
+    def check(trade: dict[str, Any]) -> tuple[bool, str]:
+        if trade.get("asset_class") == forbidden:
+            return False, f"forbidden_asset_class: {forbidden} may not be traded"
+        return True, ""
+
+    return check
+
+
+_CONSTRAINT_COMPILERS: dict[str, Callable[[Any], DirectiveCheck | None]] = {
+    "max_allocation": _compile_max_allocation,
+    "forbidden_asset_class": _compile_forbidden_asset_class,
+}
+
+
+def _order_summary(order: Any, qty: Any, notional: Any) -> dict[str, Any]:
+    """The submitted order as reported in action outputs."""
+    return {
+        "order_id": order.id,
+        "symbol": order.symbol,
+        "side": order.side,
+        "qty": qty,
+        "notional": notional,
+        "status": order.status,
+    }
+
 
 class PortfolioExecutiveAgent(BaseConstitutionalAgent):
     """
@@ -43,6 +143,21 @@ class PortfolioExecutiveAgent(BaseConstitutionalAgent):
     citation, inputs (order params), outputs (fill details).
     """
 
+    # ActionType → handler method name, resolved per call via getattr
+    _HANDLERS: ClassVar[dict[ActionType, str]] = {
+        ActionType.PORTFOLIO_TRADE: "_handle_trade",
+        ActionType.PORTFOLIO_REBALANCE: "_handle_rebalance",
+    }
+
+    _CAPS: ClassVar[tuple[str, ...]] = (
+        "portfolio_trading",
+        "portfolio_rebalancing",
+        "position_monitoring",
+        "performance_reporting",
+        "directive_compliance_checking",
+        "alpaca_integration",
+    )
+
     def __init__(self, member_id: UUID, model: str, **kwargs: Any) -> None:
         super().__init__(
             member_id=member_id,
@@ -73,7 +188,8 @@ CURRENT PORTFOLIO PARAMETERS:
             **kwargs,
         )
         self.alpaca_client = None  # Set by orchestrator
-        self.active_directive = None  # Current Monetary Policy Directive
+        self._active_directive = None  # Current Monetary Policy Directive
+        self._compiled_checks: list[DirectiveCheck] = []
 
     async def _execute(
         self,
@@ -81,19 +197,14 @@ CURRENT PORTFOLIO PARAMETERS:
         inputs: dict[str, Any],
     ) -> dict[str, Any]:
         """Execute a portfolio action."""
-        handlers = {
-            ActionType.PORTFOLIO_TRADE: self._handle_trade,
-            ActionType.PORTFOLIO_REBALANCE: self._handle_rebalance,
-        }
-
-        handler = handlers.get(action_type)
-        if handler is None:
+        handler_name = self._HANDLERS.get(action_type)
+        if handler_name is None:
             return {
                 "status": "unsupported",
                 "message": f"Action type {action_type.value} not implemented",
             }
 
-        return await handler(inputs)
+        return await getattr(self, handler_name)(inputs)
 
     async def _handle_trade(self, inputs: dict[str, Any]) -> dict[str, Any]:
         """
@@ -102,21 +213,22 @@ CURRENT PORTFOLIO PARAMETERS:
         All trades must comply with the active Monetary Policy Directive
         and fall within the permission tier's irreversible threshold.
         """
-        symbol = inputs.get("symbol", "")
-        side = inputs.get("side", "buy")  # buy or sell
-        qty = inputs.get("qty")
-        notional = inputs.get("notional")  # Dollar amount for fractional shares
-
-        # Validate against active Monetary Policy Directive
-        if self.active_directive:
+        # Validate against active Monetary Policy Directive before anything else
+        directive = self._active_directive
+        if directive is not None:
             directive_check = self._check_directive_compliance(inputs)
             if not directive_check["compliant"]:
                 return {
                     "status": "blocked_by_directive",
                     "message": directive_check["reason"],
-                    "directive_number": self.active_directive.directive_number,
+                    "directive_number": directive.directive_number,
                 }
 
+        symbol = inputs.get("symbol", "")
+        side = inputs.get("side", "buy")  # buy or sell
+        qty = inputs.get("qty")
+        notional = inputs.get("notional")  # Dollar amount for fractional shares
+
         # Execute via Alpaca
         if self.alpaca_client:
             try:
@@ -148,28 +260,79 @@ CURRENT PORTFOLIO PARAMETERS:
         """
         Rebalance the portfolio according to target allocations.
 
-        Target allocations come from Monetary Policy Directives.
+        Target allocations come from Monetary Policy Directives and map each
+        symbol to the signed dollar amount to trade (positive buys, negative
+        sells). When Alpaca is connected every leg is submitted in a single
+        concurrent batch; otherwise the plan is returned unsubmitted.
         """
         target_allocations = inputs.get("target_allocations", {})
 
+        if not self.alpaca_client:
+            return {
+                "status": "rebalance_planned",
+                "target_allocations": target_allocations,
+                "message": "Rebalance plan generated — individual trades will be submitted",
+            }
+
+        orders = []
+        for symbol, amount in target_allocations.items():
+            cents = _to_cents(amount)
+            if cents:
+                orders.append({
+                    "symbol": symbol,
+                    "side": "buy" if cents > 0 else "sell",
+                    "qty": None,
+                    "notional": _to_dollars(abs(cents)),
+                })
+        legs = await self._submit_alpaca_orders_batch(orders)
+
         return {
-            "status": "rebalance_planned",
+            "status": "rebalance_submitted",
             "target_allocations": target_allocations,
-            "message": "Rebalance plan generated — individual trades will be submitted",
+            "legs": legs,
+            "affected_resources": [f"portfolio:{symbol}" for symbol in legs],
         }
 
+    @property
+    def active_directive(self) -> Any:
+        """The Monetary Policy Directive currently binding this agent (Art. VI §6)."""
+        return self._active_directive
+
+    @active_directive.setter
+    def active_directive(self, directive: Any) -> None:
+        self.set_active_directive(directive)
+
+    def set_active_directive(self, directive: Any) -> None:
+        """
+        Bind a new directive and compile its constraints into trade checks.
+
+        Constraints are interpreted once here rather than on every trade;
+        constraint types with no compiler (or that need live positions) are
+        skipped, as before.
+
+        Raises:
+            ValueError: If a constraint's unit cannot be interpreted. The
+                previously bound directive stays in force.
+        """
+        checks = []
+        if directive is not None:
+            for constraint in directive.constraints:
+                compiler = _CONSTRAINT_COMPILERS.get(constraint.constraint_type)
+                check = compiler(constraint) if compiler else None
+                if check is not None:
+                    checks.append(check)
+        self._active_directive = directive
+        self._compiled_checks = checks
+
     def _check_directive_compliance(self, trade_inputs: dict[str, Any]) -> dict[str, Any]:
         """Check if a proposed trade complies with the active Monetary Policy Directive."""
-        if not self.active_directive:
+        if not self._active_directive:
             return {"compliant": True, "reason": "No active directive"}
 
-        # Check against directive constraints
-        for constraint in self.active_directive.constraints:
-            # Basic constraint checking — expanded in production
-            if constraint.constraint_type == "max_allocation":
-                pass  # Would check current + proposed allocation
-            elif constraint.constraint_type == "forbidden_asset_class":
-                pass  # Would check symbol's asset class
+        for check in self._compiled_checks:
+            compliant, reason = check(trade_inputs)
+            if not compliant:
+                return {"compliant": False, "reason": reason}
 
         return {"compliant": True, "reason": "Directive constraints satisfied"}
 
@@ -178,18 +341,70 @@ CURRENT PORTFOLIO PARAMETERS:
         symbol: str,
         side: str,
         qty: float | None,
-        notional: float | None,
+        notional: float | Decimal | None,
     ) -> dict[str, Any]:
-        """Submit an order to Alpaca."""
-        # This would use alpaca-py in production
-        return {
-            "order_id": "simulated",
-            "symbol": symbol,
-            "side": side,
-            "qty": qty,
-            "notional": notional,
-            "status": "submitted",
-        }
+        """Submit an order through the shared Alpaca client."""
+        order = await self.alpaca_client.submit_order(
+            symbol=symbol,
+            qty=qty,
+            notional=notional,
+            side=OrderSide(side),
+        )
+        return _order_summary(order, qty, notional)
+
+    async def aclose(self) -> None:
+        """Close the Alpaca client's pooled HTTP connections."""
+        if self.alpaca_client:
+            await self.alpaca_client.close()
+
+    async def _submit_alpaca_orders_batch(
+        self,
+        orders: list[dict[str, Any]],
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Submit independent order legs concurrently.
+
+        Each leg is checked against the active Monetary Policy Directive
+        first; compliant legs are then submitted together through
+        AlpacaClient.submit_orders, so an M-leg rebalance costs one
+        round-trip of latency rather than M.
+
+        Returns:
+            Per-leg status keyed by symbol.
+        """
+        legs: dict[str, dict[str, Any]] = {}
+        to_submit = []
+        for order in orders:
+            if self.active_directive:
+                directive_check = self._check_directive_compliance(order)
+                if not directive_check["compliant"]:
+                    legs[order["symbol"]] = {
+                        "status": "blocked_by_directive",
+                        "message": directive_check["reason"],
+                    }
+                    continue
+            to_submit.append(order)
+
+        outcomes = await self.alpaca_client.submit_orders([
+            {
+                "symbol": o["symbol"],
+                "qty": o.get("qty"),
+                "notional": o.get("notional"),
+                "side": OrderSide(o["side"]),
+            }
+            for o in to_submit
+        ])
+
+        for order, outcome in zip(to_submit, outcomes):
+            if isinstance(outcome, BaseException):
+                legs[order["symbol"]] = {"status": "failed", "error": str(outcome)}
+            else:
+                legs[order["symbol"]] = {
+                    "status": "executed",
+                    "order": _order_summary(outcome, order.get("qty"), order.get("notional")),
+                }
+
+        return legs
 
     async def get_portfolio_status(self) -> dict[str, Any]:
         """Get current portfolio status."""
@@ -198,19 +413,12 @@ CURRENT PORTFOLIO PARAMETERS:
             pass
 
         return {
-            "total_value": "50.00",
-            "cash": "50.00",
+            "total_value": fmt_usd(STARTING_CAPITAL_CENTS),
+            "cash": fmt_usd(STARTING_CAPITAL_CENTS),
             "positions": [],
-            "day_return": "0.00",
-            "total_return": "0.00",
+            "day_return": fmt_usd(0),
+            "total_return": fmt_usd(0),
         }
 
     def get_capabilities(self) -> list[str]:
-        return [
-            "portfolio_trading",
-            "portfolio_rebalancing",
-            "position_monitoring",
-            "performance_reporting",
-            "directive_compliance_checking",
-            "alpaca_integration",
-        ]
+        return list(self._CAPS)
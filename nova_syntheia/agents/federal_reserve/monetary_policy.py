@@ -18,10 +18,15 @@ References:
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import io
 import logging
-from datetime import datetime, timezone
-from typing import Any
-from uuid import UUID, uuid4
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, ClassVar
+from uuid import UUID
 
 from nova_syntheia.agents.base import BaseConstitutionalAgent
 from nova_syntheia.constitution.schema import (
@@ -35,6 +40,55 @@ from nova_syntheia.constitution.schema import (
 
 logger = logging.getLogger(__name__)
 
+REASON_CACHE_SIZE = 512
+# Most recent directives kept in memory; every directive is also in the ledger
+DIRECTIVE_HISTORY_MAXLEN = 10_000
+# Stances a directive may take (MonetaryPolicyDirective.stance)
+DIRECTIVE_STANCES = frozenset({"tightening", "loosening"})
+
+# (bias, urgency, recommendation) for each dual-mandate bucket (Art. IX §3)
+_MANDATE_OUTCOMES: tuple[tuple[str, str, str], ...] = (
+    ("stability", "high", "Shift toward stability measures"),
+    ("growth", "low", "Growth opportunities identified"),
+    ("stability", "medium", "Shift toward stability measures"),
+    ("balanced", "normal", "Maintain balanced approach"),
+)
+
+
+def _mandate_bucket(return_pct: float, max_drawdown_pct: float) -> int:
+    """Index into _MANDATE_OUTCOMES for one portfolio scenario."""
+    if return_pct < -5:
+        return 0
+    if return_pct > 10:
+        return 1
+    if max_drawdown_pct > 10:
+        return 2
+    return 3
+
+
+def _stance_error(stance: Any) -> dict[str, Any] | None:
+    """Rejection result for a missing or unknown directive stance, else None."""
+    if stance in DIRECTIVE_STANCES:
+        return None
+    return {
+        "status": "rejected",
+        "message": f"Directive stance must be 'tightening' or 'loosening', got {stance!r}",
+    }
+
+
+def _build_constraints(constraints_data: list[dict[str, Any]]) -> list[PortfolioConstraint]:
+    """PortfolioConstraint models from raw directive inputs."""
+    return [
+        PortfolioConstraint(
+            constraint_type=c.get("type", ""),
+            target=c.get("target", ""),
+            value=Decimal(str(c.get("value", 0))),
+            unit=c.get("unit", "percent"),
+            rationale=c.get("rationale") or c.get("description", ""),
+        )
+        for c in constraints_data
+    ]
+
 
 class MonetaryPolicyAgent(BaseConstitutionalAgent):
     """
@@ -54,6 +108,14 @@ class MonetaryPolicyAgent(BaseConstitutionalAgent):
     - Subject to legislative override by supermajority (Art. IX §7)
     """
 
+    # ActionType → handler method name, resolved per call via getattr.
+    # Indicator monitoring, dual-mandate analysis and the economic outlook
+    # are advisory and have no ActionType of their own.
+    _HANDLERS: ClassVar[dict[ActionType, str]] = {
+        ActionType.ISSUE_MONETARY_DIRECTIVE: "_handle_issue_directive",
+        ActionType.ADJUST_ALLOCATION: "_handle_set_constraints",
+    }
+
     def __init__(self, member_id: UUID, model: str, **kwargs: Any) -> None:
         super().__init__(
             member_id=member_id,
@@ -95,8 +157,25 @@ at this scale.""",
             **kwargs,
         )
         self._current_indicators: list[MacroeconomicIndicator] = []
-        self._active_directives: list[MonetaryPolicyDirective] = []
-        self._directive_history: list[MonetaryPolicyDirective] = []
+        # Active directives by ID, plus a min-heap of (expires_at, id) so
+        # expiry pruning only ever inspects the soonest-expiring directive
+        self._active_directives: dict[UUID, MonetaryPolicyDirective] = {}
+        self._active_heap: list[tuple[datetime, UUID]] = []
+        self._directive_excerpts: dict[UUID, str] = {}
+        self._directive_history: deque[MonetaryPolicyDirective] = deque(
+            maxlen=DIRECTIVE_HISTORY_MAXLEN
+        )
+        self._directive_count = 0
+        # Analyses keyed by prompt digest — retries and repeated indicator
+        # ticks produce identical prompts and need not rerun the LLM
+        self._reason_cache: OrderedDict[bytes, str] = OrderedDict()
+        self._reason_cache_size = REASON_CACHE_SIZE
+
+    def _on_ledger_recorded(self, outputs: dict[str, Any], entry_id: UUID) -> None:
+        """Link a directive to the ledger entry that recorded its issuance."""
+        directive_id = outputs.get("directive_id")
+        if directive_id:
+            self._link_ledger_entry(UUID(directive_id), entry_id)
 
     async def _execute(
         self,
@@ -104,16 +183,8 @@ at this scale.""",
         inputs: dict[str, Any],
     ) -> dict[str, Any]:
         """Execute a monetary policy action."""
-        handlers = {
-            ActionType.ISSUE_DIRECTIVE: self._handle_issue_directive,
-            ActionType.MONITOR_INDICATORS: self._handle_monitor_indicators,
-            ActionType.BALANCE_DUAL_MANDATE: self._handle_dual_mandate_analysis,
-            ActionType.SET_PORTFOLIO_CONSTRAINTS: self._handle_set_constraints,
-            ActionType.ECONOMIC_OUTLOOK: self._handle_economic_outlook,
-        }
-
-        handler = handlers.get(action_type)
-        if handler is None:
+        handler_name = self._HANDLERS.get(action_type)
+        if handler_name is None:
             return {
                 "status": "unsupported",
                 "message": (
@@ -122,7 +193,7 @@ at this scale.""",
                 ),
             }
 
-        return await handler(inputs)
+        return await getattr(self, handler_name)(inputs)
 
     async def _handle_issue_directive(self, inputs: dict[str, Any]) -> dict[str, Any]:
         """
@@ -132,15 +203,18 @@ at this scale.""",
         risk limits, sector allocations, rebalancing triggers, and emergency halts.
         All directives must include published reasoning.
         """
-        directive_type_str = inputs.get("directive_type", "RISK_LIMIT")
+        directive_type_str = inputs.get("directive_type", DirectiveType.REGULAR.value)
         reasoning = inputs.get("reasoning", "")
         parameters = inputs.get("parameters", {})
-        portfolio_constraints = inputs.get("portfolio_constraints", [])
         duration_hours = inputs.get("duration_hours", 168)  # Default 7 days
+        stance = inputs.get("stance")
+        error = _stance_error(stance)
+        if error is not None:
+            return error
 
         if not reasoning:
             # Art. IX §4: reasoning publication is mandatory
-            reasoning_result = await self.reason(
+            reasoning_result = await self._reason_cached(
                 f"Provide detailed monetary policy reasoning for a {directive_type_str} directive "
                 f"with parameters: {parameters}. Consider the dual mandate (growth vs. stability), "
                 f"current market conditions, and our $50 starting capital."
@@ -150,30 +224,16 @@ at this scale.""",
         try:
             directive_type = DirectiveType(directive_type_str)
         except ValueError:
-            directive_type = DirectiveType.RISK_LIMIT
-
-        constraints = []
-        for c in portfolio_constraints:
-            constraints.append(
-                PortfolioConstraint(
-                    constraint_type=c.get("type", ""),
-                    value=c.get("value", 0.0),
-                    description=c.get("description", ""),
-                )
-            )
+            directive_type = DirectiveType.REGULAR
 
-        directive = MonetaryPolicyDirective(
-            id=uuid4(),
-            directive_type=directive_type,
-            issued_by=self.member_id,
-            reasoning=reasoning,
-            parameters=parameters,
-            portfolio_constraints=constraints,
-            effective_from=datetime.now(timezone.utc),
-            duration_hours=duration_hours,
+        constraints = _build_constraints(inputs.get("portfolio_constraints", []))
+        directive = self._new_directive(
+            directive_type, reasoning, constraints, stance,
+            mandate_tension=inputs.get("mandate_tension"),
         )
 
-        self._active_directives.append(directive)
+        expires_at = directive.effective_date + timedelta(hours=duration_hours)
+        self._activate_directive(directive, expires_at, reasoning)
         self._directive_history.append(directive)
 
         logger.info(
@@ -185,10 +245,13 @@ at this scale.""",
         return {
             "status": "issued",
             "directive_id": str(directive.id),
+            "directive_number": directive.directive_number,
             "directive_type": directive.directive_type.value,
             "reasoning_excerpt": reasoning[:200] + "..." if len(reasoning) > 200 else reasoning,
             "constraints_count": len(constraints),
             "duration_hours": duration_hours,
+            # Recorded in the ledger with the directive; the heap is in memory only
+            "expires_at": expires_at.isoformat(),
             "note": "Directive is binding on Executive Branch (Art. IX §5). Subject to Judicial review (Art. IX §6).",
         }
 
@@ -199,34 +262,46 @@ at this scale.""",
         Uses LLM reasoning to assess economic conditions and their
         implications for portfolio management at our scale.
         """
-        indicators_data = inputs.get("indicators", [])
+        indicators = self._record_indicators(inputs.get("indicators", []))
+        return await self._analyze_indicators(indicators)
 
+    def _record_indicators(
+        self,
+        indicators_data: list[dict[str, Any]],
+    ) -> list[MacroeconomicIndicator]:
+        """Replace the current indicator set from raw indicator inputs."""
+        now = datetime.now(timezone.utc)
         indicators = []
         for ind in indicators_data:
             indicators.append(
                 MacroeconomicIndicator(
                     name=ind.get("name", ""),
                     value=ind.get("value", 0.0),
-                    previous_value=ind.get("previous_value"),
-                    unit=ind.get("unit", ""),
                     source=ind.get("source", ""),
-                    assessed_at=datetime.now(timezone.utc),
+                    as_of=ind.get("as_of") or now,
+                    interpretation=ind.get("interpretation", ""),
                 )
             )
 
         self._current_indicators = indicators
+        return indicators
 
-        # Use LLM to synthesize indicator implications
+    async def _analyze_indicators(
+        self,
+        indicators: list[MacroeconomicIndicator],
+    ) -> dict[str, Any]:
+        """Use the LLM to synthesize what the indicators imply."""
         if indicators:
-            indicator_summary = "\n".join(
-                f"- {i.name}: {i.value}{i.unit} (prev: {i.previous_value})"
-                for i in indicators
-            )
-            analysis = await self.reason(
-                f"Analyze these macroeconomic indicators for a $50 portfolio:\n{indicator_summary}\n\n"
-                f"What are the implications for our dual mandate (growth vs stability)? "
-                f"Should we adjust any monetary policy directives?"
+            # Written straight into one buffer rather than joined and re-spliced
+            prompt = io.StringIO()
+            prompt.write("Analyze these macroeconomic indicators for a $50 portfolio:")
+            for i in indicators:
+                prompt.write(f"\n- {i.name}: {i.value} ({i.source}, as of {i.as_of:%Y-%m-%d})")
+            prompt.write(
+                "\n\nWhat are the implications for our dual mandate (growth vs stability)? "
+                "Should we adjust any monetary policy directives?"
             )
+            analysis = await self._reason_cached(prompt.getvalue())
         else:
             analysis = "No indicators provided for analysis."
 
@@ -257,7 +332,7 @@ at this scale.""",
             f"Indicators: {len(self._current_indicators)}"
         )
 
-        analysis = await self.reason(
+        analysis = await self._reason_cached(
             f"Perform a dual mandate analysis for Nova Syntheia (Art. IX §3).\n\n"
             f"{context}\n\n"
             f"Balance the Growth Mandate (maximize long-term appreciation) against "
@@ -266,19 +341,9 @@ at this scale.""",
             f"Recommend specific policy adjustments with constitutional citations."
         )
 
-        # Determine mandate bias
-        if portfolio_return_pct < -5:
-            bias = "stability"
-            urgency = "high"
-        elif portfolio_return_pct > 10:
-            bias = "growth"
-            urgency = "low"
-        elif max_drawdown_pct > 10:
-            bias = "stability"
-            urgency = "medium"
-        else:
-            bias = "balanced"
-            urgency = "normal"
+        bias, urgency, recommendation = _MANDATE_OUTCOMES[
+            _mandate_bucket(portfolio_return_pct, max_drawdown_pct)
+        ]
 
         return {
             "status": "analyzed",
@@ -286,13 +351,7 @@ at this scale.""",
             "urgency": urgency,
             "portfolio_value": portfolio_value,
             "analysis": analysis,
-            "recommendation": (
-                "Shift toward stability measures"
-                if bias == "stability"
-                else "Maintain balanced approach"
-                if bias == "balanced"
-                else "Growth opportunities identified"
-            ),
+            "recommendation": recommendation,
         }
 
     async def _handle_set_constraints(self, inputs: dict[str, Any]) -> dict[str, Any]:
@@ -301,40 +360,34 @@ at this scale.""",
 
         Portfolio constraints are binding on the Portfolio Executive Agent.
         """
-        constraints_data = inputs.get("constraints", [])
-
-        constraints = []
-        for c in constraints_data:
-            constraints.append(
-                PortfolioConstraint(
-                    constraint_type=c.get("type", ""),
-                    value=c.get("value", 0.0),
-                    description=c.get("description", ""),
-                )
-            )
+        stance = inputs.get("stance")
+        error = _stance_error(stance)
+        if error is not None:
+            return error
+        constraints = _build_constraints(inputs.get("constraints", []))
 
         # Wrap in a directive
-        directive = MonetaryPolicyDirective(
-            id=uuid4(),
-            directive_type=DirectiveType.RISK_LIMIT,
-            issued_by=self.member_id,
-            reasoning=inputs.get("reasoning", "Portfolio constraints update per Art. IX §5"),
-            parameters={"constraint_update": True},
-            portfolio_constraints=constraints,
-            effective_from=datetime.now(timezone.utc),
-            duration_hours=inputs.get("duration_hours", 720),  # 30 days default
-        )
+        duration_hours = inputs.get("duration_hours", 720)  # 30 days default
+        reasoning = inputs.get("reasoning", "Portfolio constraints update per Art. IX §5")
+        directive = self._new_directive(DirectiveType.REGULAR, reasoning, constraints, stance)
 
-        self._active_directives.append(directive)
+        expires_at = directive.effective_date + timedelta(hours=duration_hours)
+        self._activate_directive(directive, expires_at, reasoning)
         self._directive_history.append(directive)
 
         return {
             "status": "constraints_set",
             "directive_id": str(directive.id),
             "constraints": [
-                {"type": c.constraint_type, "value": c.value, "description": c.description}
+                {
+                    "type": c.constraint_type,
+                    "target": c.target,
+                    "value": str(c.value),
+                    "unit": c.unit,
+                }
                 for c in constraints
             ],
+            "expires_at": expires_at.isoformat(),
             "binding_on": "Portfolio Executive Agent (Art. IX §5)",
         }
 
@@ -346,27 +399,27 @@ at this scale.""",
         """
         horizon = inputs.get("horizon", "medium_term")
 
-        indicator_context = ""
+        # Written straight into one buffer rather than joined and re-spliced
+        prompt = io.StringIO()
+        prompt.write(f"Generate a {horizon} economic outlook for Nova Syntheia.\n")
         if self._current_indicators:
-            indicator_context = "\nCurrent indicators:\n" + "\n".join(
-                f"- {i.name}: {i.value}{i.unit}" for i in self._current_indicators
-            )
-
-        directive_context = ""
+            prompt.write("\nCurrent indicators:")
+            for i in self._current_indicators:
+                prompt.write(f"\n- {i.name}: {i.value}")
+        prompt.write("\n")
         if self._active_directives:
-            directive_context = "\nActive directives:\n" + "\n".join(
-                f"- {d.directive_type.value}: {d.reasoning[:100]}..."
-                for d in self._active_directives
-            )
-
-        outlook = await self.reason(
-            f"Generate a {horizon} economic outlook for Nova Syntheia.\n"
-            f"{indicator_context}\n{directive_context}\n\n"
-            f"Consider: market conditions, our $50 portfolio scale, active directives, "
-            f"and the dual mandate. Provide a clear assessment with recommendations. "
-            f"This will be published to all members (Art. IX §4 transparency requirement)."
+            prompt.write("\nActive directives:")
+            excerpts = self._directive_excerpts
+            for directive_id, d in self._active_directives.items():
+                prompt.write(f"\n- {d.directive_type.value}: {excerpts[directive_id]}...")
+        prompt.write(
+            "\n\nConsider: market conditions, our $50 portfolio scale, active directives, "
+            "and the dual mandate. Provide a clear assessment with recommendations. "
+            "This will be published to all members (Art. IX §4 transparency requirement)."
         )
 
+        outlook = await self._reason_cached(prompt.getvalue())
+
         return {
             "status": "published",
             "horizon": horizon,
@@ -376,14 +429,87 @@ at this scale.""",
             "published_at": datetime.now(timezone.utc).isoformat(),
         }
 
+    async def _reason_cached(self, prompt: str) -> str:
+        """reason() with an LRU over identical prompts."""
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+        cached = self._reason_cache.get(key)
+        if cached is not None:
+            self._reason_cache.move_to_end(key)
+            return cached
+
+        result = await self.reason(prompt)
+        if self._reason_cache_size > 0:
+            self._reason_cache[key] = result
+            while len(self._reason_cache) > self._reason_cache_size:
+                self._reason_cache.popitem(last=False)
+        return result
+
+    def set_reason_cache_size(self, size: int) -> None:
+        """Resize the reasoning cache; 0 disables it."""
+        self._reason_cache_size = max(size, 0)
+        while len(self._reason_cache) > self._reason_cache_size:
+            self._reason_cache.popitem(last=False)
+
+    def _new_directive(
+        self,
+        directive_type: DirectiveType,
+        justification: str,
+        constraints: list[PortfolioConstraint],
+        stance: str,
+        mandate_tension: str | None = None,
+    ) -> MonetaryPolicyDirective:
+        """Number and build a directive against the indicators currently held."""
+        self._directive_count += 1
+        return MonetaryPolicyDirective(
+            directive_number=self._directive_count,
+            directive_type=directive_type,
+            macroeconomic_justification=justification,
+            indicators_assessed=list(self._current_indicators),
+            mandate_tension=mandate_tension,
+            stance=stance,
+            constraints=constraints,
+            effective_date=datetime.now(timezone.utc),
+            issued_by=self.member_id,
+        )
+
+    def _activate_directive(
+        self,
+        directive: MonetaryPolicyDirective,
+        expires_at: datetime,
+        reasoning: str,
+    ) -> None:
+        """Register a directive as active until `expires_at`."""
+        self._active_directives[directive.id] = directive
+        # Sliced once here; every economic outlook quotes this excerpt
+        self._directive_excerpts[directive.id] = reasoning[:100]
+        heapq.heappush(self._active_heap, (expires_at, directive.id))
+
+    def _link_ledger_entry(self, directive_id: UUID, ledger_entry_id: UUID) -> None:
+        """
+        Record which ledger entry logged a directive's issuance.
+
+        Directives are frozen, so the held copies are swapped for an updated
+        model_copy rather than edited in place.
+        """
+        history = self._directive_history
+        # The directive was just issued, so it is almost always the last one
+        for i in range(len(history) - 1, -1, -1):
+            if history[i].id == directive_id:
+                linked = history[i].model_copy(update={"ledger_entry_id": ledger_entry_id})
+                history[i] = linked
+                if directive_id in self._active_directives:
+                    self._active_directives[directive_id] = linked
+                return
+
     def get_active_directives(self) -> list[MonetaryPolicyDirective]:
         """Return all currently active directives."""
         now = datetime.now(timezone.utc)
-        self._active_directives = [
-            d for d in self._active_directives
-            if d.is_active(now)
-        ]
-        return self._active_directives
+        heap = self._active_heap
+        while heap and heap[0][0] <= now:
+            _, directive_id = heapq.heappop(heap)
+            self._active_directives.pop(directive_id, None)
+            self._directive_excerpts.pop(directive_id, None)
+        return list(self._active_directives.values())
 
     def get_capabilities(self) -> list[str]:
         return [
@@ -19,11 +19,12 @@ References:
 from __future__ import annotations
 
 import logging
-from datetime import datetime
-from typing import Any
+from collections import Counter, OrderedDict
+from datetime import datetime, timezone
+from typing import Any, ClassVar
 from uuid import UUID, uuid4
 
-from nova_syntheia.agents.base import BaseConstitutionalAgent
+from nova_syntheia.agents.base import ActionSpec, BaseConstitutionalAgent, coerce_uuid
 from nova_syntheia.constitution.schema import (
     ActionType,
     Citation,
@@ -36,6 +37,12 @@ from nova_syntheia.constitution.schema import (
 
 logger = logging.getLogger(__name__)
 
+PRECEDENT_CACHE_SIZE = 1024
+
+STOPWORDS = frozenset(
+    {"the", "a", "an", "is", "are", "was", "were", "of", "in", "to", "for", "and"}
+)
+
 
 class PolicyEvaluationAgent(BaseConstitutionalAgent):
     """
@@ -54,6 +61,14 @@ class PolicyEvaluationAgent(BaseConstitutionalAgent):
     with executive agents and cannot be directed by any branch.
     """
 
+    # ActionType → handler method name, resolved per call via getattr
+    _HANDLERS: ClassVar[dict[ActionType, str]] = {
+        ActionType.INTERPRET_CONSTITUTION: "_handle_interpretation",
+        ActionType.ISSUE_OPINION: "_handle_opinion",
+        ActionType.AUDIT_ACTION: "_handle_audit",
+        ActionType.ISSUE_INJUNCTION: "_handle_injunction",
+    }
+
     def __init__(self, member_id: UUID, model: str, **kwargs: Any) -> None:
         super().__init__(
             member_id=member_id,
@@ -92,6 +107,14 @@ PRECEDENT SYSTEM:
         )
         self.opinions: list[JudicialOpinion] = []
         self.precedent_index: dict[str, list[UUID]] = {}  # provision_ref → opinion_ids
+        # Inverted index over prior constitutional questions: each question is a
+        # row (owning opinion in _question_rows); content word → row ids
+        self._question_rows: list[JudicialOpinion] = []
+        self._word_rows: dict[str, list[int]] = {}
+        # sorted questions → search result; cleared whenever the index grows
+        self._precedent_cache: OrderedDict[tuple[str, ...], list[PrecedentReference]] = (
+            OrderedDict()
+        )
         self._case_counter = 0
 
     async def _execute(
@@ -100,21 +123,60 @@ PRECEDENT SYSTEM:
         inputs: dict[str, Any],
     ) -> dict[str, Any]:
         """Execute a judicial action."""
-        handlers = {
-            ActionType.INTERPRET_CONSTITUTION: self._handle_interpretation,
-            ActionType.ISSUE_OPINION: self._handle_opinion,
-            ActionType.AUDIT_ACTION: self._handle_audit,
-            ActionType.ISSUE_INJUNCTION: self._handle_injunction,
-        }
-
-        handler = handlers.get(action_type)
-        if handler is None:
+        handler_name = self._HANDLERS.get(action_type)
+        if handler_name is None:
             return {
                 "status": "unsupported",
                 "message": f"Action type {action_type.value} not supported by Judicial Branch",
             }
 
-        return await handler(inputs)
+        return await getattr(self, handler_name)(inputs)
+
+    async def batch_audit(self, audits: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Audit several executive actions at once (Art. III §2 scheduled audits).
+
+        Each audit is a full AUDIT_ACTION through the governance wrapper, so it
+        is cited and logged as usual; the audits' LLM calls overlap instead of
+        running back to back. Concurrency per model is capped by the shared
+        LLM router.
+
+        Args:
+            audits: Inputs for each audit (``action_id``, ``action_content``).
+
+        Returns:
+            One result per audit, in input order.
+        """
+        return await self.execute_actions_bulk([
+            ActionSpec(
+                action_type=ActionType.AUDIT_ACTION,
+                objective=f"Audit action {audit.get('action_id')} for constitutional compliance",
+                justification="Scheduled audit of executive decisions (Art. III §2)",
+                inputs=audit,
+            )
+            for audit in audits
+        ])
+
+    async def batch_interpret(self, requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Answer several interpretation requests at once; see `batch_audit`.
+
+        Args:
+            requests: Inputs for each interpretation (``provision``,
+                ``situation``, ``question``).
+
+        Returns:
+            One result per request, in input order.
+        """
+        return await self.execute_actions_bulk([
+            ActionSpec(
+                action_type=ActionType.INTERPRET_CONSTITUTION,
+                objective=f"Interpret {request.get('provision', 'the Constitution')}",
+                justification="Provision application is unclear (Art. III §2)",
+                inputs=request,
+            )
+            for request in requests
+        ])
 
     async def _handle_interpretation(self, inputs: dict[str, Any]) -> dict[str, Any]:
         """
@@ -161,7 +223,7 @@ articles, sections, and amendments.""",
         Establishes binding precedent.
         """
         self._case_counter += 1
-        case_number = f"NS-{datetime.utcnow().year}-{self._case_counter:03d}"
+        case_number = f"NS-{datetime.now(timezone.utc).year}-{self._case_counter:03d}"
 
         opinion_type = OpinionType(inputs.get("opinion_type", "review"))
         questions = inputs.get("constitutional_questions", [])
@@ -196,7 +258,7 @@ Write in a formal judicial style. Be precise about constitutional authority.""",
             case_number=case_number,
             opinion_type=opinion_type,
             petitioner_id=inputs.get("petitioner_id"),
-            subject_action_id=UUID(subject_action_id) if subject_action_id else None,
+            subject_action_id=coerce_uuid(subject_action_id) if subject_action_id else None,
             constitutional_questions=questions,
             holding=opinion_text[:500],  # First 500 chars as holding summary
             reasoning=opinion_text,
@@ -296,22 +358,51 @@ Issue a compliance finding: COMPLIANT, NON-COMPLIANT, or NEEDS REVIEW.""",
         Art. III §3: The Policy Evaluation Agent shall maintain a precedent
         index and flag potential inconsistencies.
         """
+        # Matching ignores question order, so equal sorted tuples share a result
+        key = tuple(sorted(questions))
+        cached = self._precedent_cache.get(key)
+        if cached is not None:
+            self._precedent_cache.move_to_end(key)
+            return list(cached)
+
+        # Count shared content words per prior question via the postings lists,
+        # touching only questions that share at least one word with the query
+        matched: set[int] = set()
+        for q in questions:
+            counts = Counter(
+                row
+                for word in _content_words(q)
+                for row in self._word_rows.get(word, ())
+            )
+            matched.update(row for row, shared in counts.items() if shared >= 2)
+
         relevant = []
-        for opinion in self.opinions:
-            # Check if any questions overlap with prior opinion's questions
-            for q in questions:
-                for prior_q in opinion.constitutional_questions:
-                    if _semantic_overlap(q, prior_q):
-                        relevant.append(PrecedentReference(
-                            opinion_id=opinion.id,
-                            case_number=opinion.case_number,
-                            relationship="considered",
-                        ))
-                        break
-        return relevant
+        cited: set[UUID] = set()
+        for row in sorted(matched):  # rows are in issuance order
+            opinion = self._question_rows[row]
+            # An opinion is cited once, however many of its questions overlap
+            if opinion.id not in cited:
+                cited.add(opinion.id)
+                relevant.append(PrecedentReference(
+                    opinion_id=opinion.id,
+                    case_number=opinion.case_number,
+                    relationship="considered",
+                ))
+
+        self._precedent_cache[key] = relevant
+        if len(self._precedent_cache) > PRECEDENT_CACHE_SIZE:
+            self._precedent_cache.popitem(last=False)
+        return list(relevant)
 
     def _update_precedent_index(self, opinion: JudicialOpinion) -> None:
         """Update the precedent index with a new opinion."""
+        self._precedent_cache.clear()
+        for question in opinion.constitutional_questions:
+            row = len(self._question_rows)
+            self._question_rows.append(opinion)
+            for word in _content_words(question):
+                self._word_rows.setdefault(word, []).append(row)
+
         for citation in opinion.citations:
             ref = citation.reference
             if ref not in self.precedent_index:
@@ -331,13 +422,12 @@ Issue a compliance finding: COMPLIANT, NON-COMPLIANT, or NEEDS REVIEW.""",
         ]
 
 
+def _content_words(text: str) -> frozenset[str]:
+    """Lowercased words of `text` with common words removed."""
+    return frozenset(text.lower().split()) - STOPWORDS
+
+
 def _semantic_overlap(text1: str, text2: str) -> bool:
     """Simple keyword overlap check for precedent matching."""
-    words1 = set(text1.lower().split())
-    words2 = set(text2.lower().split())
-    # Remove common words
-    stopwords = {"the", "a", "an", "is", "are", "was", "were", "of", "in", "to", "for", "and"}
-    words1 -= stopwords
-    words2 -= stopwords
-    overlap = words1 & words2
+    overlap = _content_words(text1) & _content_words(text2)
     return len(overlap) >= 2  # At least 2 meaningful words in common
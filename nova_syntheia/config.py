@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Any
+
 from pydantic_settings import BaseSettings
 
 
@@ -18,6 +21,10 @@ class NovaSettings(BaseSettings):
     federal_reserve_model: str = "anthropic/claude-sonnet-4-20250514"
     citation_model: str = "openai/gpt-4o-mini"
     custodian_model: str = "openai/gpt-4o-mini"
+    llm_max_parallel_requests: int = 8  # per model, shared by all agents
+    llm_num_retries: int = 2
+    llm_timeout_seconds: float = 30.0
+    llm_prompt_caching: bool = True  # mark static system prompts cacheable (Anthropic)
 
     # ── PostgreSQL (National Ledger) ───────────────────────────
     postgres_user: str = "nova_syntheia"
@@ -61,10 +68,22 @@ class NovaSettings(BaseSettings):
     human_founder_id: str = "founder-001"
     emergency_deliberation_hours: int = 24
     normal_deliberation_days: int = 7
+    notification_workers: int = 8  # concurrent deliveries by the Operations agent
 
     # ── Logging ────────────────────────────────────────────────
     log_level: str = "INFO"
     log_format: str = "json"
 
 
-settings = NovaSettings()
+@lru_cache(maxsize=1)
+def get_settings() -> NovaSettings:
+    """Load settings on first use; the environment and .env are read once."""
+    return NovaSettings()
+
+
+def __getattr__(name: str) -> Any:
+    # `from nova_syntheia.config import settings` still works, but the
+    # settings are only built when first imported or accessed
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
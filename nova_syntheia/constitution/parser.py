@@ -16,9 +16,14 @@ References:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import re
 from pathlib import Path
+from typing import Any, Final
+
+from pydantic import TypeAdapter
 
 from nova_syntheia.constitution.schema import ConstitutionalProvision
 
@@ -38,8 +43,22 @@ AMENDMENT_PATTERN = re.compile(
     r"^Amendment\s+([IVXLCDM]+)\s*[—–-]\s*(.+)$", re.MULTILINE
 )
 
+# The three headings above fused into one alternation so the document is
+# scanned once; `lastgroup` says which kind of heading matched
+STRUCTURE_PATTERN = re.compile(
+    r"^(?:ARTICLE\s+(?P<article>[IVXLCDM0]+)\s*[—–-]\s*(?P<article_title>.+)"
+    r"|Section\s+(?P<section>\d+)\s*[—–-]\s*(?P<section_title>.+)"
+    r"|Amendment\s+(?P<amendment>[IVXLCDM]+)\s*[—–-]\s*(?P<amendment_title>.+))$",
+    re.MULTILINE,
+)
+
+_PROVISION_LIST = TypeAdapter(list[ConstitutionalProvision])
+
+# Key under which a provisions cache records the hash of its source markdown
+_SOURCE_SHA256_KEY = "__source_sha256__"
+
 # Roman numeral conversion
-ROMAN_TO_INT: dict[str, int] = {
+ROMAN_TO_INT: Final[dict[str, int]] = {
     "I": 1, "II": 2, "III": 3, "IV": 4, "V": 5,
     "VI": 6, "VII": 7, "VIII": 8, "IX": 9, "X": 10,
 }
@@ -65,7 +84,8 @@ def parse_constitution(markdown_path: str | Path) -> list[ConstitutionalProvisio
         List of ConstitutionalProvision objects, each addressable by ID.
     """
     text = Path(markdown_path).read_text(encoding="utf-8")
-    provisions: list[ConstitutionalProvision] = []
+    # Collected as plain dicts and validated in one batch at the end
+    provisions: list[dict[str, Any]] = []
 
     # ── Extract top-level sections ──────────────────────────────
 
@@ -75,7 +95,7 @@ def parse_constitution(markdown_path: str | Path) -> list[ConstitutionalProvisio
         text, re.DOTALL,
     )
     if scope_match:
-        provisions.append(ConstitutionalProvision(
+        provisions.append(dict(
             id="scope_declaration",
             title="Scope Declaration",
             text=scope_match.group(1).strip(),
@@ -87,7 +107,7 @@ def parse_constitution(markdown_path: str | Path) -> list[ConstitutionalProvisio
         text, re.DOTALL,
     )
     if founding_match:
-        provisions.append(ConstitutionalProvision(
+        provisions.append(dict(
             id="founding_note",
             title="Founding Note",
             text=founding_match.group(1).strip(),
@@ -99,55 +119,74 @@ def parse_constitution(markdown_path: str | Path) -> list[ConstitutionalProvisio
         text, re.DOTALL,
     )
     if preamble_match:
-        provisions.append(ConstitutionalProvision(
+        provisions.append(dict(
             id="preamble",
             title="Preamble",
             text=preamble_match.group(1).strip(),
         ))
 
+    # ── Scan all structural headings in one pass ────────────────
+
+    articles: list[re.Match[str]] = []
+    sections: list[re.Match[str]] = []
+    amendments: list[re.Match[str]] = []
+    by_kind = {
+        "article_title": articles,
+        "section_title": sections,
+        "amendment_title": amendments,
+    }
+    for match in STRUCTURE_PATTERN.finditer(text):
+        by_kind[match.lastgroup].append(match)
+
     # ── Extract Articles ────────────────────────────────────────
 
-    article_matches = list(ARTICLE_PATTERN.finditer(text))
-    for i, match in enumerate(article_matches):
-        article_num = match.group(1).strip()
-        article_title = match.group(2).strip()
+    sec_idx = 0
+    for i, match in enumerate(articles):
+        article_num = match.group("article")  # [IVXLCDM0]+, nothing to strip
+        article_title = match.group("article_title").strip()
         article_id = f"article_{article_num}"
 
         # Get the text between this article header and the next article/Bill of Rights
         start = match.end()
-        if i + 1 < len(article_matches):
-            end = article_matches[i + 1].start()
+        if i + 1 < len(articles):
+            end = articles[i + 1].start()
         else:
             # Last article — text extends to Bill of Rights or end
-            bill_match = re.search(r"\nBILL OF RIGHTS", text[start:])
-            end = start + bill_match.start() if bill_match else len(text)
+            bill_heading = text.find("\nBILL OF RIGHTS", start)
+            end = bill_heading if bill_heading != -1 else len(text)
 
         article_text = text[start:end].strip()
 
         # Create the article-level provision
-        provisions.append(ConstitutionalProvision(
+        provisions.append(dict(
             id=article_id,
             article=article_num,
             title=article_title,
             text=article_text,
         ))
 
-        # ── Extract Sections within this article ────────────────
-        section_matches = list(SECTION_PATTERN.finditer(article_text))
-        for j, sec_match in enumerate(section_matches):
-            sec_num = int(sec_match.group(1))
-            sec_title = sec_match.group(2).strip()
+        # ── Sections within this article ────────────────────────
+        while sec_idx < len(sections) and sections[sec_idx].start() < start:
+            sec_idx += 1
+        article_sections = []
+        while sec_idx < len(sections) and sections[sec_idx].start() < end:
+            article_sections.append(sections[sec_idx])
+            sec_idx += 1
+
+        for j, sec_match in enumerate(article_sections):
+            sec_num = int(sec_match.group("section"))
+            sec_title = sec_match.group("section_title").strip()
             sec_id = f"article_{article_num}_section_{sec_num}"
 
             sec_start = sec_match.end()
-            if j + 1 < len(section_matches):
-                sec_end = section_matches[j + 1].start()
+            if j + 1 < len(article_sections):
+                sec_end = article_sections[j + 1].start()
             else:
-                sec_end = len(article_text)
+                sec_end = end
 
-            sec_text = article_text[sec_start:sec_end].strip()
+            sec_text = text[sec_start:sec_end].strip()
 
-            provisions.append(ConstitutionalProvision(
+            provisions.append(dict(
                 id=sec_id,
                 article=article_num,
                 section=sec_num,
@@ -163,36 +202,39 @@ def parse_constitution(markdown_path: str | Path) -> list[ConstitutionalProvisio
         text, re.DOTALL,
     )
     if bill_match:
-        bill_text = bill_match.group(1).strip()
+        bill_start, bill_end = bill_match.span(1)
+        amend_matches = [
+            m for m in amendments if bill_start <= m.start() and m.end() <= bill_end
+        ]
 
         # Bill of Rights preamble (text before first Amendment)
-        first_amend = AMENDMENT_PATTERN.search(bill_text)
-        if first_amend:
-            preamble_text = bill_text[:first_amend.start()].strip()
+        if amend_matches:
+            preamble_text = text[bill_start:amend_matches[0].start()].strip()
             if preamble_text:
-                provisions.append(ConstitutionalProvision(
+                provisions.append(dict(
                     id="bill_of_rights_preamble",
                     title="Bill of Rights — Preamble",
                     text=preamble_text,
                 ))
 
         # Individual amendments
-        amend_matches = list(AMENDMENT_PATTERN.finditer(bill_text))
         for k, amend_match in enumerate(amend_matches):
-            amend_roman = amend_match.group(1).strip()
-            amend_title = amend_match.group(2).strip()
-            amend_int = roman_to_int(amend_roman)
+            # The heading pattern only admits upper-case numerals, so the
+            # table can be indexed directly without roman_to_int's normalizing
+            amend_roman = amend_match.group("amendment")
+            amend_title = amend_match.group("amendment_title").strip()
+            amend_int = ROMAN_TO_INT.get(amend_roman)
             amend_id = f"amendment_{amend_int}" if amend_int else f"amendment_{amend_roman}"
 
             amend_start = amend_match.end()
             if k + 1 < len(amend_matches):
                 amend_end = amend_matches[k + 1].start()
             else:
-                amend_end = len(bill_text)
+                amend_end = bill_end
 
-            amend_text = bill_text[amend_start:amend_end].strip()
+            amend_text = text[amend_start:amend_end].strip()
 
-            provisions.append(ConstitutionalProvision(
+            provisions.append(dict(
                 id=amend_id,
                 amendment=amend_int,
                 title=amend_title,
@@ -205,39 +247,81 @@ def parse_constitution(markdown_path: str | Path) -> list[ConstitutionalProvisio
         text, re.DOTALL,
     )
     if closing_match:
-        provisions.append(ConstitutionalProvision(
+        provisions.append(dict(
             id="closing_declaration",
             title="Closing Declaration",
             text=closing_match.group(1).strip(),
         ))
 
-    return provisions
+    return _PROVISION_LIST.validate_python(provisions)
 
 
 def provisions_to_json(provisions: list[ConstitutionalProvision]) -> str:
     """Serialize provisions to canonical JSON for storage and ledger recording."""
-    return json.dumps(
-        [p.model_dump() for p in provisions],
-        indent=2,
-        ensure_ascii=False,
-    )
+    return _provisions_json_bytes(provisions).decode("utf-8")
+
+
+def _provisions_json_bytes(provisions: list[ConstitutionalProvision]) -> bytes:
+    # Serialized in pydantic-core in one call; byte-identical (as UTF-8) to
+    # json.dumps([p.model_dump() ...], indent=2, ensure_ascii=False)
+    return _PROVISION_LIST.dump_json(provisions, indent=2)
 
 
 def save_provisions(
     provisions: list[ConstitutionalProvision],
     output_path: str | Path,
+    source_sha256: str | None = None,
 ) -> Path:
-    """Save parsed provisions to a JSON file."""
+    """
+    Save parsed provisions to a JSON file.
+
+    When `source_sha256` is given the provisions are wrapped together with
+    the hash of the markdown they were parsed from, so the file can serve as
+    a cache for `parse_constitution_cached`.
+    """
     path = Path(output_path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(provisions_to_json(provisions), encoding="utf-8")
+    body = _provisions_json_bytes(provisions)
+    if source_sha256 is not None:
+        body = (
+            f'{{"{_SOURCE_SHA256_KEY}": "{source_sha256}", "provisions": '.encode()
+            + body
+            + b"}"
+        )
+    path.write_bytes(body)
     return path
 
 
 def load_provisions(json_path: str | Path) -> list[ConstitutionalProvision]:
-    """Load provisions from a JSON file."""
-    raw = json.loads(Path(json_path).read_text(encoding="utf-8"))
-    return [ConstitutionalProvision(**p) for p in raw]
+    """Load provisions from a JSON file (plain list or hash-stamped cache)."""
+    data = Path(json_path).read_bytes()
+    if data.lstrip().startswith(b"{"):
+        return _PROVISION_LIST.validate_python(json.loads(data)["provisions"])
+    return _PROVISION_LIST.validate_json(data)
+
+
+def parse_constitution_cached(
+    markdown_path: str | Path,
+    cache_path: str | Path,
+) -> list[ConstitutionalProvision]:
+    """
+    Parse the constitution, reusing `cache_path` if it was built from identical markdown.
+
+    The cache is keyed on the SHA-256 of the markdown bytes; on a miss (or an
+    unreadable cache) the constitution is parsed and the cache rewritten.
+    """
+    source_sha256 = hashlib.sha256(Path(markdown_path).read_bytes()).hexdigest()
+    cache = Path(cache_path)
+    try:
+        raw = json.loads(cache.read_bytes())
+        if isinstance(raw, dict) and raw.get(_SOURCE_SHA256_KEY) == source_sha256:
+            return _PROVISION_LIST.validate_python(raw["provisions"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    provisions = parse_constitution(markdown_path)
+    save_provisions(provisions, cache, source_sha256=source_sha256)
+    return provisions
 
 
 # ════════════════════════════════════════════════════════════════
@@ -245,11 +329,38 @@ def load_provisions(json_path: str | Path) -> list[ConstitutionalProvision]:
 # ════════════════════════════════════════════════════════════════
 
 
+_COLLECTION_METADATA = {"description": "Nova Syntheia Constitutional Provisions"}
+
+
+def _provision_records(
+    provisions: list[ConstitutionalProvision],
+) -> tuple[list[str], list[str], list[dict[str, str]]]:
+    """Build the parallel ids / documents / metadatas lists ChromaDB expects."""
+    ids = []
+    documents = []
+    metadatas = []
+
+    for provision in provisions:
+        ids.append(provision.id)
+        # Document text: title + full text for better embedding quality
+        documents.append(f"{provision.reference}: {provision.title}\n\n{provision.text}")
+        metadatas.append({
+            "article": provision.article or "",
+            "section": str(provision.section) if provision.section is not None else "",
+            "amendment": str(provision.amendment) if provision.amendment is not None else "",
+            "title": provision.title,
+            "reference": provision.reference,
+        })
+
+    return ids, documents, metadatas
+
+
 def index_provisions_to_chromadb(
     provisions: list[ConstitutionalProvision],
     chroma_host: str = "localhost",
     chroma_port: int = 8100,
     collection_name: str = "constitutional_provisions",
+    batch_size: int = 64,
 ) -> None:
     """
     Embed all constitutional provisions into ChromaDB for semantic citation retrieval.
@@ -262,6 +373,7 @@ def index_provisions_to_chromadb(
         chroma_host: ChromaDB server host.
         chroma_port: ChromaDB server port.
         collection_name: Name of the ChromaDB collection.
+        batch_size: Provisions embedded and sent per `collection.add` call.
     """
     import chromadb
 
@@ -275,31 +387,60 @@ def index_provisions_to_chromadb(
 
     collection = client.get_or_create_collection(
         name=collection_name,
-        metadata={"description": "Nova Syntheia Constitutional Provisions"},
+        metadata=_COLLECTION_METADATA,
     )
 
-    ids = []
-    documents = []
-    metadatas = []
+    ids, documents, metadatas = _provision_records(provisions)
+
+    # Documents are embedded client-side by the collection's embedding function;
+    # fixed-size chunks keep each embed call and request body bounded
+    for i in range(0, len(ids), batch_size):
+        collection.add(
+            ids=ids[i:i + batch_size],
+            documents=documents[i:i + batch_size],
+            metadatas=metadatas[i:i + batch_size],
+        )
 
-    for provision in provisions:
-        ids.append(provision.id)
-        # Document text: title + full text for better embedding quality
-        documents.append(f"{provision.reference}: {provision.title}\n\n{provision.text}")
-        metadatas.append({
-            "article": provision.article or "",
-            "section": str(provision.section) if provision.section is not None else "",
-            "amendment": str(provision.amendment) if provision.amendment is not None else "",
-            "title": provision.title,
-            "reference": provision.reference,
-        })
 
-    collection.add(
-        ids=ids,
-        documents=documents,
-        metadatas=metadatas,
+async def aindex_provisions_to_chromadb(
+    provisions: list[ConstitutionalProvision],
+    chroma_host: str = "localhost",
+    chroma_port: int = 8100,
+    collection_name: str = "constitutional_provisions",
+    batch_size: int = 64,
+) -> None:
+    """
+    Async variant of `index_provisions_to_chromadb` for use inside the event loop.
+
+    Uses ChromaDB's async HTTP client and sends all batches concurrently, so
+    indexing neither blocks the loop nor waits on one round-trip per batch.
+    """
+    import chromadb
+
+    client = await chromadb.AsyncHttpClient(host=chroma_host, port=chroma_port)
+
+    # Delete existing collection if present (re-indexing)
+    try:
+        await client.delete_collection(collection_name)
+    except Exception:
+        pass
+
+    collection = await client.get_or_create_collection(
+        name=collection_name,
+        metadata=_COLLECTION_METADATA,
     )
 
+    ids, documents, metadatas = _provision_records(provisions)
+
+    await asyncio.gather(*(
+        collection.add(
+            ids=ids[i:i + batch_size],
+            documents=documents[i:i + batch_size],
+            metadatas=metadatas[i:i + batch_size],
+        )
+        for i in range(0, len(ids), batch_size)
+    ))
+
 
 # ════════════════════════════════════════════════════════════════
 # CLI Entry Point
@@ -312,10 +453,9 @@ if __name__ == "__main__":
     output_path = sys.argv[2] if len(sys.argv) > 2 else "nova_syntheia/constitution/provisions.json"
 
     print(f"Parsing constitution from: {constitution_path}")
-    provs = parse_constitution(constitution_path)
+    provs = parse_constitution_cached(constitution_path, output_path)
     print(f"Found {len(provs)} provisions:")
     for p in provs:
         print(f"  [{p.id}] {p.reference}: {p.title}")
 
-    save_path = save_provisions(provs, output_path)
-    print(f"\nSaved to: {save_path}")
+    print(f"\nSaved to: {output_path}")
@@ -18,12 +18,19 @@ from __future__ import annotations
 import enum
 import hashlib
 import json
+from collections.abc import Mapping
 from datetime import datetime, timedelta
+from functools import cached_property
 from decimal import Decimal
+from types import MappingProxyType
 from typing import Any
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+# Deliberation floors (Art. 0); timedeltas are immutable, so build them once
+_EMERGENCY_DELIB = timedelta(hours=24)
+_REGULAR_DELIB = timedelta(days=7)
 
 
 # ════════════════════════════════════════════════════════════════
@@ -218,7 +225,28 @@ class DirectiveType(str, enum.Enum):
 # ════════════════════════════════════════════════════════════════
 
 
-class Citation(BaseModel):
+class _MemoizedModel(BaseModel):
+    """
+    Base for models whose computed fields are `cached_property`s.
+
+    The cached values live in the instance __dict__; model_copy(update=...)
+    would carry them over, so they are dropped from updated copies.
+    """
+
+    def _clear_computed(self) -> None:
+        for name in type(self).model_computed_fields:
+            self.__dict__.pop(name, None)
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> Any:
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._clear_computed()
+        return copied
+
+
+class Citation(_MemoizedModel):
     """
     A constitutional citation — the atomic unit of constitutional authority.
 
@@ -239,8 +267,42 @@ class Citation(BaseModel):
         description="Explanation of why this provision authorizes or constrains the action"
     )
 
+    @classmethod
+    def trusted(cls, **data: Any) -> Citation:
+        """
+        Build a citation from already-validated values, skipping validation.
+
+        Only for internal callers whose inputs come from validated models
+        (e.g. a ConstitutionalProvision); anything LLM- or user-supplied
+        must go through the normal constructor.
+        """
+        return cls.model_construct(**data)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._clear_computed()
+
+    def _clear_computed(self) -> None:
+        super()._clear_computed()
+        self.__dict__.pop("_dump", None)
+
+    @cached_property
+    def _dump(self) -> dict[str, Any]:
+        return self.model_dump()
+
+    def cached_dump(self) -> dict[str, Any]:
+        """
+        Return model_dump(), serializing at most once per instance.
+
+        Citations are shared across actions (rule-based cache, role
+        fallback), so the dump is memoized here; callers receive a shallow
+        copy since every value is a scalar.
+        """
+        return dict(self._dump)
+
     @computed_field
-    @property
+    @cached_property
     def reference(self) -> str:
         """Human-readable citation reference (e.g., 'Article II §2' or 'Amendment IV')."""
         parts = []
@@ -263,15 +325,17 @@ class ConstitutionalRole(BaseModel):
     even if the occupying agent is replaced.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(description="Unique role identifier (e.g., 'portfolio_executive')")
     title: str = Field(description="Human-readable title (e.g., 'Portfolio Executive Agent')")
     branch: Branch
     description: str = Field(description="Constitutional description of the role's function")
-    authorities: list[ActionType] = Field(
-        default_factory=list, description="Actions this role may perform"
+    authorities: frozenset[ActionType] = Field(
+        default_factory=frozenset, description="Actions this role may perform"
     )
-    constraints: list[str] = Field(
-        default_factory=list, description="Constitutional constraints on this role"
+    constraints: tuple[str, ...] = Field(
+        default_factory=tuple, description="Constitutional constraints on this role"
     )
     continuity_protocol: str = Field(
         default="",
@@ -289,17 +353,19 @@ class PermissionTier(BaseModel):
     Loaded from Legislative standing orders. Enforced by governance middleware.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(description="Tier identifier (e.g., 'tier_0', 'tier_2')")
     level: int = Field(description="Numeric level for ordering (0=most restricted)")
     name: str = Field(description="Human-readable name (e.g., 'Advisory Only')")
-    autonomous_actions: list[ActionType] = Field(
-        default_factory=list, description="Actions that may be taken without approval"
+    autonomous_actions: frozenset[ActionType] = Field(
+        default_factory=frozenset, description="Actions that may be taken without approval"
     )
-    requires_approval: list[ActionType] = Field(
-        default_factory=list, description="Actions requiring prior constitutional authority"
+    requires_approval: frozenset[ActionType] = Field(
+        default_factory=frozenset, description="Actions requiring prior constitutional authority"
     )
-    forbidden_actions: list[ActionType] = Field(
-        default_factory=list, description="Actions absolutely prohibited for this tier"
+    forbidden_actions: frozenset[ActionType] = Field(
+        default_factory=frozenset, description="Actions absolutely prohibited for this tier"
     )
     irreversible_threshold: Decimal = Field(
         default=Decimal("0"),
@@ -311,7 +377,7 @@ class PermissionTier(BaseModel):
     )
 
 
-class Member(BaseModel):
+class Member(_MemoizedModel):
     """
     A constitutional member of Nova Syntheia (Art. IV).
 
@@ -319,6 +385,8 @@ class Member(BaseModel):
     Artificial members must satisfy all four instantiation criteria (Art. IV §2).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: UUID = Field(default_factory=uuid4)
     member_type: MemberType
     name: str
@@ -350,7 +418,7 @@ class Member(BaseModel):
     )
 
     @computed_field
-    @property
+    @cached_property
     def is_constitutionally_instantiated(self) -> bool:
         """
         Whether this member satisfies all four instantiation criteria (Art. IV §2).
@@ -379,6 +447,8 @@ class ActionRecord(BaseModel):
     Every executive action must include these fields in its ledger entry.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     objective: str = Field(description="Stated objective of the action")
     justification: str = Field(description="Justification for the action")
     constitutional_citations: list[Citation] = Field(
@@ -404,6 +474,8 @@ class LedgerEntry(BaseModel):
     own hash and the hash of the previous entry, forming a verifiable chain.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: UUID = Field(default_factory=uuid4)
     sequence_number: int = Field(description="Monotonically increasing sequence number")
     previous_hash: str = Field(description="SHA-256 hash of the previous entry")
@@ -443,9 +515,10 @@ class LedgerEntry(BaseModel):
             "emergency_designation": self.emergency_designation,
         }
         canonical = json.dumps(hashable, sort_keys=True, default=str)
-        return hashlib.sha256(
-            (self.previous_hash + canonical).encode("utf-8")
-        ).hexdigest()
+        # Fed in two updates — same digest as hashing the concatenation
+        digest = hashlib.sha256(self.previous_hash.encode("utf-8"))
+        digest.update(canonical.encode("utf-8"))
+        return digest.hexdigest()
 
 
 # ════════════════════════════════════════════════════════════════
@@ -456,6 +529,8 @@ class LedgerEntry(BaseModel):
 class Vote(BaseModel):
     """A recorded vote in a Deliberative Cycle (Art. I §4)."""
 
+    model_config = ConfigDict(frozen=True)
+
     member_id: UUID
     position: VotePosition
     constitutional_basis: Citation = Field(
@@ -467,6 +542,8 @@ class Vote(BaseModel):
 class DeliberativeSubmission(BaseModel):
     """A position, objection, or argument submitted during deliberation."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: UUID = Field(default_factory=uuid4)
     member_id: UUID
     content: str = Field(description="The written position, objection, or argument")
@@ -515,8 +592,8 @@ class DeliberativeCycle(BaseModel):
     def compute_deliberation_deadline(self, is_emergency: bool = False) -> datetime:
         """Compute the deliberation deadline based on session type."""
         if is_emergency or self.session_type == SessionType.EMERGENCY:
-            return self.opened_at + timedelta(hours=24)
-        return self.opened_at + timedelta(days=7)
+            return self.opened_at + _EMERGENCY_DELIB
+        return self.opened_at + _REGULAR_DELIB
 
 
 # ════════════════════════════════════════════════════════════════
@@ -527,6 +604,8 @@ class DeliberativeCycle(BaseModel):
 class PrecedentReference(BaseModel):
     """Reference to a prior judicial opinion in the precedent system."""
 
+    model_config = ConfigDict(frozen=True)
+
     opinion_id: UUID
     case_number: str
     relationship: str = Field(
@@ -545,6 +624,8 @@ class JudicialOpinion(BaseModel):
     Future materially similar cases must be consistent or formally distinguished.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: UUID = Field(default_factory=uuid4)
     case_number: str = Field(description="Sequential case identifier (e.g., 'NS-2026-001')")
     opinion_type: OpinionType
@@ -582,6 +663,8 @@ class Petition(BaseModel):
     within one Deliberative Cycle.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: UUID = Field(default_factory=uuid4)
     petitioner_id: UUID
     target_institution: Branch = Field(
@@ -608,6 +691,8 @@ class Petition(BaseModel):
 class MacroeconomicIndicator(BaseModel):
     """An economic indicator assessed by the Federal Reserve."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Indicator name (e.g., 'CPI YoY', 'Fed Funds Rate')")
     value: float | str
     source: str = Field(description="Data source")
@@ -616,7 +701,14 @@ class MacroeconomicIndicator(BaseModel):
 
 
 class PortfolioConstraint(BaseModel):
-    """A constraint imposed by a Monetary Policy Directive on portfolio operations."""
+    """
+    A constraint imposed by a Monetary Policy Directive on portfolio operations.
+
+    Frozen: the Portfolio Executive compiles constraints into trade checks
+    when a directive becomes active, so they must not change afterwards.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     constraint_type: str = Field(
         description="e.g., 'max_allocation', 'min_cash', 'asset_class_limit'"
@@ -635,6 +727,8 @@ class MonetaryPolicyDirective(BaseModel):
     Must include a full macroeconomic justification.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     id: UUID = Field(default_factory=uuid4)
     directive_number: int
     directive_type: DirectiveType = DirectiveType.REGULAR
@@ -710,9 +804,11 @@ class EmergencyActivation(BaseModel):
 # ════════════════════════════════════════════════════════════════
 
 
-class ConstitutionalProvision(BaseModel):
+class ConstitutionalProvision(_MemoizedModel):
     """A single addressable provision from the constitution."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(description="Unique identifier (e.g., 'article_II_section_2')")
     article: str | None = None
     section: int | None = None
@@ -724,7 +820,7 @@ class ConstitutionalProvision(BaseModel):
     )
 
     @computed_field
-    @property
+    @cached_property
     def reference(self) -> str:
         if self.amendment is not None:
             return f"Amendment {self.amendment}"
@@ -740,7 +836,7 @@ class ConstitutionalProvision(BaseModel):
 # Predefined Constitutional Roles (Founding Era)
 # ════════════════════════════════════════════════════════════════
 
-FOUNDING_ROLES: dict[str, ConstitutionalRole] = {
+FOUNDING_ROLES: Mapping[str, ConstitutionalRole] = MappingProxyType({
     "human_founder": ConstitutionalRole(
         id="human_founder",
         title="Human Founder",
@@ -886,14 +982,19 @@ FOUNDING_ROLES: dict[str, ConstitutionalRole] = {
             "Legislative Assembly."
         ),
     ),
-}
+})
 
 
 # ════════════════════════════════════════════════════════════════
 # Predefined Permission Tiers (Founding Era defaults)
 # ════════════════════════════════════════════════════════════════
 
-FOUNDING_PERMISSION_TIERS: dict[str, PermissionTier] = {
+# Irreversible-action thresholds shared by the tiers below (Amend. III)
+_D_ZERO = Decimal("0")
+_D_25 = Decimal("25.00")
+_D_50 = Decimal("50.00")
+
+FOUNDING_PERMISSION_TIERS: Mapping[str, PermissionTier] = MappingProxyType({
     "tier_0": PermissionTier(
         id="tier_0",
         level=0,
@@ -907,7 +1008,7 @@ FOUNDING_PERMISSION_TIERS: dict[str, PermissionTier] = {
             ActionType.ISSUE_OPINION,
             ActionType.ISSUE_MONETARY_DIRECTIVE,
         ],
-        irreversible_threshold=Decimal("0"),
+        irreversible_threshold=_D_ZERO,
     ),
     "tier_1": PermissionTier(
         id="tier_1",
@@ -925,7 +1026,7 @@ FOUNDING_PERMISSION_TIERS: dict[str, PermissionTier] = {
             ActionType.PORTFOLIO_REBALANCE,
             ActionType.ISSUE_MONETARY_DIRECTIVE,
         ],
-        irreversible_threshold=Decimal("0"),
+        irreversible_threshold=_D_ZERO,
     ),
     "tier_2": PermissionTier(
         id="tier_2",
@@ -946,7 +1047,7 @@ FOUNDING_PERMISSION_TIERS: dict[str, PermissionTier] = {
             ActionType.RATIFY_AMENDMENT,
             ActionType.ISSUE_MONETARY_DIRECTIVE,
         ],
-        irreversible_threshold=Decimal("25.00"),
+        irreversible_threshold=_D_25,
     ),
     "tier_3": PermissionTier(
         id="tier_3",
@@ -964,7 +1065,7 @@ FOUNDING_PERMISSION_TIERS: dict[str, PermissionTier] = {
             ActionType.ISSUE_MONETARY_DIRECTIVE,
             ActionType.ISSUE_OPINION,
         ],
-        irreversible_threshold=Decimal("25.00"),
+        irreversible_threshold=_D_25,
     ),
     "tier_4": PermissionTier(
         id="tier_4",
@@ -983,7 +1084,7 @@ FOUNDING_PERMISSION_TIERS: dict[str, PermissionTier] = {
             ActionType.RATIFY_AMENDMENT,
             ActionType.CAST_VOTE,
         ],
-        irreversible_threshold=Decimal("0"),
+        irreversible_threshold=_D_ZERO,
     ),
     "tier_founder": PermissionTier(
         id="tier_founder",
@@ -1001,6 +1102,6 @@ FOUNDING_PERMISSION_TIERS: dict[str, PermissionTier] = {
         ],
         requires_approval=[],
         forbidden_actions=[],
-        irreversible_threshold=Decimal("50.00"),
+        irreversible_threshold=_D_50,
     ),
-}
+})
@@ -16,6 +16,7 @@ All dashboard operations are themselves logged to the National Ledger.
 
 from __future__ import annotations
 
+import functools
 import logging
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
@@ -27,11 +28,25 @@ from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
-from nova_syntheia.config import settings
+from nova_syntheia.config import get_settings
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson is absent
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+class _JSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return super().render(content)
+
+
 # ── Pydantic request / response models ────────────────────────
 
 
@@ -87,6 +102,7 @@ state = DashboardState()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup & shutdown lifecycle — connect to shared services."""
+    settings = get_settings()
     logger.info("Nova Syntheia Dashboard starting — Founding Era: %s", settings.founding_era)
 
     # ── Connect to PostgreSQL (National Ledger) ──
@@ -158,69 +174,69 @@ app = FastAPI(
 # ── HTML Templates (inline for single-file simplicity) ────────
 
 
-def _html_page(title: str, body: str) -> HTMLResponse:
-    """Wrap body HTML in a complete page."""
-    return HTMLResponse(f"""<!DOCTYPE html>
+# The page shell is split once at import around the {title} and {body} slots,
+# so each request only concatenates instead of re-running a large f-string.
+_PAGE_SHELL = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="utf-8">
     <meta name="viewport" content="width=device-width, initial-scale=1">
     <title>{title} — Nova Syntheia</title>
     <style>
-        :root {{
+        :root {
             --bg: #0d1117; --surface: #161b22; --border: #30363d;
             --text: #c9d1d9; --text-muted: #8b949e; --accent: #58a6ff;
             --green: #3fb950; --red: #f85149; --yellow: #d29922;
-        }}
-        * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-        body {{
+        }
+        * { box-sizing: border-box; margin: 0; padding: 0; }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif;
             background: var(--bg); color: var(--text); line-height: 1.6;
-        }}
-        .container {{ max-width: 1200px; margin: 0 auto; padding: 1rem; }}
-        header {{
+        }
+        .container { max-width: 1200px; margin: 0 auto; padding: 1rem; }
+        header {
             background: var(--surface); border-bottom: 1px solid var(--border);
             padding: 0.75rem 1rem; display: flex; align-items: center; gap: 1rem;
-        }}
-        header h1 {{ font-size: 1.2rem; color: var(--accent); }}
-        nav a {{
+        }
+        header h1 { font-size: 1.2rem; color: var(--accent); }
+        nav a {
             color: var(--text-muted); text-decoration: none; padding: 0.5rem 0.75rem;
             border-radius: 6px; font-size: 0.875rem;
-        }}
-        nav a:hover {{ color: var(--text); background: var(--border); }}
-        .card {{
+        }
+        nav a:hover { color: var(--text); background: var(--border); }
+        .card {
             background: var(--surface); border: 1px solid var(--border);
             border-radius: 8px; padding: 1.25rem; margin: 1rem 0;
-        }}
-        .card h2 {{ font-size: 1rem; margin-bottom: 0.75rem; color: var(--accent); }}
-        table {{ width: 100%; border-collapse: collapse; font-size: 0.875rem; }}
-        th, td {{ padding: 0.5rem 0.75rem; text-align: left; border-bottom: 1px solid var(--border); }}
-        th {{ color: var(--text-muted); font-weight: 600; }}
-        .badge {{
+        }
+        .card h2 { font-size: 1rem; margin-bottom: 0.75rem; color: var(--accent); }
+        table { width: 100%; border-collapse: collapse; font-size: 0.875rem; }
+        th, td { padding: 0.5rem 0.75rem; text-align: left; border-bottom: 1px solid var(--border); }
+        th { color: var(--text-muted); font-weight: 600; }
+        .badge {
             display: inline-block; padding: 0.15rem 0.5rem; border-radius: 12px;
             font-size: 0.75rem; font-weight: 600;
-        }}
-        .badge-green {{ background: rgba(63,185,80,0.15); color: var(--green); }}
-        .badge-red {{ background: rgba(248,81,73,0.15); color: var(--red); }}
-        .badge-yellow {{ background: rgba(210,153,34,0.15); color: var(--yellow); }}
-        .badge-blue {{ background: rgba(88,166,255,0.15); color: var(--accent); }}
-        .stat {{ text-align: center; }}
-        .stat-value {{ font-size: 2rem; font-weight: 700; color: var(--accent); }}
-        .stat-label {{ font-size: 0.75rem; color: var(--text-muted); text-transform: uppercase; }}
-        .grid {{ display: grid; gap: 1rem; }}
-        .grid-3 {{ grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); }}
-        .grid-2 {{ grid-template-columns: repeat(auto-fit, minmax(350px, 1fr)); }}
-        .mono {{ font-family: 'SFMono-Regular', Consolas, monospace; font-size: 0.8rem; }}
-        .pl-positive {{ color: var(--green); }}
-        .pl-negative {{ color: var(--red); }}
-        .btn {{
+        }
+        .badge-green { background: rgba(63,185,80,0.15); color: var(--green); }
+        .badge-red { background: rgba(248,81,73,0.15); color: var(--red); }
+        .badge-yellow { background: rgba(210,153,34,0.15); color: var(--yellow); }
+        .badge-blue { background: rgba(88,166,255,0.15); color: var(--accent); }
+        .stat { text-align: center; }
+        .stat-value { font-size: 2rem; font-weight: 700; color: var(--accent); }
+        .stat-label { font-size: 0.75rem; color: var(--text-muted); text-transform: uppercase; }
+        .grid { display: grid; gap: 1rem; }
+        .grid-3 { grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); }
+        .grid-2 { grid-template-columns: repeat(auto-fit, minmax(350px, 1fr)); }
+        .mono { font-family: 'SFMono-Regular', Consolas, monospace; font-size: 0.8rem; }
+        .pl-positive { color: var(--green); }
+        .pl-negative { color: var(--red); }
+        .btn {
             display: inline-block; padding: 0.4rem 1rem; border-radius: 6px;
             border: 1px solid var(--border); background: var(--surface);
             color: var(--text); cursor: pointer; font-size: 0.875rem;
-        }}
-        .btn-primary {{ background: var(--accent); color: #000; border-color: var(--accent); }}
-        .btn:hover {{ opacity: 0.85; }}
-        pre {{ background: var(--bg); padding: 0.75rem; border-radius: 6px; overflow-x: auto; }}
+        }
+        .btn-primary { background: var(--accent); color: #000; border-color: var(--accent); }
+        .btn:hover { opacity: 0.85; }
+        pre { background: var(--bg); padding: 0.75rem; border-radius: 6px; overflow-x: auto; }
     </style>
     <script src="https://unpkg.com/htmx.org@1.9.10"></script>
 </head>
@@ -241,7 +257,24 @@ def _html_page(title: str, body: str) -> HTMLResponse:
     </header>
     <div class="container">{body}</div>
 </body>
-</html>""")
+</html>"""
+_PAGE_HEAD, _PAGE_MID = _PAGE_SHELL.split("{title}")
+_PAGE_MID, _PAGE_TAIL = _PAGE_MID.split("{body}")
+
+
+def _html_page(title: str, body: str) -> HTMLResponse:
+    """Wrap body HTML in a complete page."""
+    return HTMLResponse("".join((_PAGE_HEAD, title, _PAGE_MID, body, _PAGE_TAIL)))
+
+
+@functools.cache
+def _rendered_page(title: str, body: str) -> bytes:
+    return _html_page(title, body).body
+
+
+def _static_page(title: str, body: str) -> HTMLResponse:
+    """Like _html_page for bodies that never change: rendered and encoded once."""
+    return HTMLResponse(_rendered_page(title, body))
 
 
 # ── Routes: Overview ───────────────────────────────────────────
@@ -250,6 +283,7 @@ def _html_page(title: str, body: str) -> HTMLResponse:
 @app.get("/", response_class=HTMLResponse)
 async def overview():
     """Dashboard home — polity status overview."""
+    settings = get_settings()
     uptime = datetime.now(timezone.utc) - state.startup_time
     uptime_str = f"{uptime.days}d {uptime.seconds // 3600}h {(uptime.seconds % 3600) // 60}m"
 
@@ -315,17 +349,17 @@ async def ledger_page():
         </div>
     </div>
     """
-    return _html_page("Ledger", body)
+    return _static_page("Ledger", body)
 
 
 @app.get("/api/ledger")
 async def api_ledger(limit: int = 50, offset: int = 0):
     """API: Get ledger entries."""
     if state.ledger_service is None:
-        return JSONResponse({"entries": [], "message": "Ledger service not initialized"})
+        return _JSONResponse({"entries": [], "message": "Ledger service not initialized"})
 
     entries = state.ledger_service.get_latest_entries(limit=limit)
-    return JSONResponse({
+    return _JSONResponse({
         "entries": [
             {
                 "id": str(e.id),
@@ -351,14 +385,15 @@ async def api_ledger_recent():
     if not entries:
         return HTMLResponse("<p style='color:var(--text-muted)'>No entries yet</p>")
 
-    rows = ""
-    for e in entries:
-        rows += f"""<tr>
+    rows = "".join(
+        f"""<tr>
             <td class="mono">{e.sequence_number}</td>
             <td>{e.entry_type}</td>
             <td>{e.author_role}</td>
             <td class="mono">{e.entry_hash[:12]}...</td>
         </tr>"""
+        for e in entries
+    )
 
     return HTMLResponse(f"""
         <table>
@@ -371,6 +406,19 @@ async def api_ledger_recent():
 # ── Routes: Deliberative Sessions ─────────────────────────────
 
 
+# Session phase → badge style for the active-sessions fragment
+_PHASE_BADGES = {
+    "proposal": "badge-blue",
+    "deliberation": "badge-yellow",
+    "voting": "badge-green",
+}
+
+
+def _phase_badge(phase: str) -> str:
+    """Badge markup for a session phase."""
+    return f'<span class="badge {_PHASE_BADGES.get(phase, "badge-blue")}">{phase}</span>'
+
+
 @app.get("/sessions", response_class=HTMLResponse)
 async def sessions_page():
     """Deliberative session manager — Art. 0."""
@@ -392,7 +440,7 @@ async def sessions_page():
         </div>
     </div>
     """
-    return _html_page("Sessions", body)
+    return _static_page("Sessions", body)
 
 
 @app.get("/api/sessions/active")
@@ -405,20 +453,15 @@ async def api_sessions_active():
     if not sessions:
         return HTMLResponse("<p style='color:var(--text-muted)'>No active sessions</p>")
 
-    rows = ""
-    for s in sessions:
-        phase_badge = {
-            "proposal": "badge-blue",
-            "deliberation": "badge-yellow",
-            "voting": "badge-green",
-        }.get(s.phase.value, "badge-blue")
-
-        rows += f"""<tr>
+    rows = "".join(
+        f"""<tr>
             <td class="mono">{str(s.id)[:8]}...</td>
             <td>{s.title}</td>
-            <td><span class="badge {phase_badge}">{s.phase.value}</span></td>
+            <td>{_phase_badge(s.phase.value)}</td>
             <td>{s.votes_cast}/{s.quorum_needed}</td>
         </tr>"""
+        for s in sessions
+    )
 
     return HTMLResponse(f"""
         <table>
@@ -437,6 +480,7 @@ async def api_sessions_history():
 @app.post("/api/sessions/vote")
 async def api_vote(req: VoteRequest):
     """Cast the Founder's vote on a session."""
+    settings = get_settings()
     if state.deliberative_manager is None:
         raise HTTPException(status_code=503, detail="Session manager not initialized")
 
@@ -446,7 +490,7 @@ async def api_vote(req: VoteRequest):
         position=req.position,
         reasoning=req.reasoning,
     )
-    return JSONResponse({"status": "voted", "result": result})
+    return _JSONResponse({"status": "voted", "result": result})
 
 
 # ── Routes: Approval Queue ────────────────────────────────────
@@ -466,7 +510,7 @@ async def approvals_page():
         </div>
     </div>
     """
-    return _html_page("Approvals", body)
+    return _static_page("Approvals", body)
 
 
 @app.get("/api/approvals/pending")
@@ -478,7 +522,7 @@ async def api_approvals_pending():
 @app.post("/api/approvals/decide")
 async def api_approval_decide(req: ApprovalRequest):
     """Founder approves or denies an escalated action."""
-    return JSONResponse({
+    return _JSONResponse({
         "status": "decided",
         "action_id": req.action_id,
         "approved": req.approved,
@@ -530,7 +574,7 @@ async def judicial_page():
         </div>
     </div>
     """
-    return _html_page("Judicial", body)
+    return _static_page("Judicial", body)
 
 
 @app.get("/api/judicial/opinions")
@@ -564,7 +608,7 @@ async def portfolio_page():
         </div>
     </div>
     """
-    return _html_page("Portfolio", body)
+    return _static_page("Portfolio", body)
 
 
 @app.get("/api/portfolio/summary")
@@ -622,18 +666,18 @@ async def api_portfolio_positions():
         if not positions:
             return HTMLResponse("<p style='color:var(--text-muted)'>No open positions</p>")
 
-        rows = ""
+        rows = []
         for p in positions:
             pl_class = "pl-positive" if p.unrealized_pl >= 0 else "pl-negative"
             sign = "+" if p.unrealized_pl >= 0 else ""
-            rows += f"""<tr>
+            rows.append(f"""<tr>
                 <td><strong>{p.symbol}</strong></td>
                 <td>{p.qty:.4f}</td>
                 <td>${p.avg_entry_price:.2f}</td>
                 <td>${p.current_price:.2f}</td>
                 <td>${p.market_value:.2f}</td>
                 <td class="{pl_class}">{sign}${p.unrealized_pl:.2f} ({sign}{p.unrealized_plpc*100:.1f}%)</td>
-            </tr>"""
+            </tr>""")
 
         return HTMLResponse(f"""
             <table>
@@ -641,7 +685,7 @@ async def api_portfolio_positions():
                     <th>Symbol</th><th>Qty</th><th>Avg Entry</th>
                     <th>Current</th><th>Value</th><th>P/L</th>
                 </tr></thead>
-                <tbody>{rows}</tbody>
+                <tbody>{"".join(rows)}</tbody>
             </table>
         """)
     except Exception as e:
@@ -678,7 +722,7 @@ async def emergency_page():
         </div>
     </div>
     """
-    return _html_page("Emergency", body)
+    return _static_page("Emergency", body)
 
 
 @app.get("/api/emergency/status")
@@ -712,7 +756,7 @@ async def api_emergency_activate(req: EmergencyRequest):
     if state.emergency_manager is None:
         raise HTTPException(status_code=503, detail="Emergency manager not initialized")
 
-    return JSONResponse({
+    return _JSONResponse({
         "status": "activated",
         "trigger_type": req.trigger_type,
         "note": "Emergency powers activated. Subject to post-emergency judicial review (Art. VII §4).",
@@ -739,7 +783,7 @@ async def constitution_page():
         <p style="color: var(--text-muted)">Enter a query to search constitutional provisions.</p>
     </div>
     """
-    return _html_page("Constitution", body)
+    return _static_page("Constitution", body)
 
 
 @app.post("/api/constitution/search")
@@ -777,7 +821,8 @@ async def api_constitution_search(request: Request):
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return JSONResponse({
+    settings = get_settings()
+    return _JSONResponse({
         "status": "healthy",
         "era": "founding" if settings.founding_era else "standard",
         "uptime_seconds": (datetime.now(timezone.utc) - state.startup_time).total_seconds(),
@@ -24,15 +24,22 @@ References:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from nova_syntheia.constitution.parser import load_provisions
 from nova_syntheia.constitution.schema import Citation, ConstitutionalProvision
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on memoized rule-based citation results per CitationService
+RULE_CITATION_CACHE_SIZE = 1024
+
 
 class CitationVerificationError(Exception):
     """Raised when a citation cannot be verified against the constitution."""
@@ -71,6 +78,8 @@ class CitationService:
         self.chroma_port = chroma_port
         self.collection_name = collection_name
         self._chroma_collection = None
+        self._batcher: CitationBatcher | None = None
+        self._rule_citation_cache: OrderedDict[tuple[str, str], list[Citation]] = OrderedDict()
 
         if provisions:
             self.provisions = {p.id: p for p in provisions}
@@ -79,10 +88,9 @@ class CitationService:
 
     def _load_provisions(self, path: str | Path) -> None:
         """Load provisions from a JSON file."""
-        raw = json.loads(Path(path).read_text(encoding="utf-8"))
-        for p_data in raw:
-            p = ConstitutionalProvision(**p_data)
+        for p in load_provisions(path):
             self.provisions[p.id] = p
+        self._rule_citation_cache.clear()
         logger.info("Loaded %d constitutional provisions", len(self.provisions))
 
     def _get_chroma_collection(self) -> Any:
@@ -182,7 +190,23 @@ class CitationService:
             List of Citation objects for the action.
         """
         if relevant_provisions is None:
-            relevant_provisions = self.search_relevant_provisions(action_description)
+            # Routine actions repeat the same descriptions — serve them from cache
+            key = (action_type, action_description)
+            cached = self._rule_citation_cache.get(key)
+            if cached is not None:
+                self._rule_citation_cache.move_to_end(key)
+                return list(cached)
+
+            citations = self.generate_citations(
+                action_description,
+                action_type,
+                self.search_relevant_provisions(action_description),
+            )
+            if citations:
+                self._rule_citation_cache[key] = citations
+                if len(self._rule_citation_cache) > RULE_CITATION_CACHE_SIZE:
+                    self._rule_citation_cache.popitem(last=False)
+            return list(citations)
 
         if not relevant_provisions:
             logger.warning(
@@ -192,7 +216,8 @@ class CitationService:
 
         citations = []
         for provision in relevant_provisions:
-            citation = Citation(
+            # Fields come straight from a validated provision
+            citation = Citation.trusted(
                 article=provision.article,
                 section=provision.section,
                 amendment=provision.amendment,
@@ -229,7 +254,7 @@ class CitationService:
         Returns:
             List of verified Citation objects.
         """
-        import litellm
+        from nova_syntheia.integrations import llm_router
 
         if relevant_provisions is None:
             relevant_provisions = self.search_relevant_provisions(action_description)
@@ -265,7 +290,7 @@ Only cite provisions that are genuinely relevant. Do not fabricate provisions.
 Return valid JSON array only, no markdown."""
 
         try:
-            response = await litellm.acompletion(
+            response = await llm_router.acompletion(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1,
@@ -279,28 +304,56 @@ Return valid JSON array only, no markdown."""
             if isinstance(raw_citations, dict):
                 raw_citations = raw_citations.get("citations", [])
 
-            citations = []
-            for rc in raw_citations:
-                citation = Citation(
-                    article=rc.get("article"),
-                    section=rc.get("section"),
-                    amendment=rc.get("amendment"),
-                    text_excerpt=rc.get("text_excerpt", ""),
-                    relevance=rc.get("relevance", ""),
-                )
-                # Verify the citation references a real provision
-                if self.verify_citation(citation):
-                    citations.append(citation)
-                else:
-                    logger.warning("Discarding unverifiable citation: %s", citation.reference)
-
-            return citations
+            return self._build_verified_citations(raw_citations)
 
         except Exception as e:
             logger.error("LLM citation generation failed: %s", e)
             # Fall back to rule-based
             return self.generate_citations(action_description, action_type, relevant_provisions)
 
+    async def generate_citations_batched(
+        self,
+        action_description: str,
+        action_type: str,
+        model: str = "openai/gpt-4o-mini",
+    ) -> list[Citation]:
+        """
+        Generate LLM citations through the shared request batcher.
+
+        Concurrent callers are coalesced into a single LLM round-trip so the
+        shared instructions are sent once per batch rather than once per action.
+
+        Args:
+            action_description: What the action is and why.
+            action_type: The ActionType enum value.
+            model: LiteLLM model identifier.
+
+        Returns:
+            List of verified Citation objects.
+        """
+        if self._batcher is None:
+            self._batcher = CitationBatcher(self)
+        return await self._batcher.submit(action_description, action_type, model)
+
+    def _build_verified_citations(self, raw_citations: list[dict[str, Any]]) -> list[Citation]:
+        """Build Citation objects from raw LLM output, discarding unverifiable ones."""
+        citations = []
+        for rc in raw_citations:
+            citation = Citation(
+                article=rc.get("article"),
+                section=rc.get("section"),
+                amendment=rc.get("amendment"),
+                text_excerpt=rc.get("text_excerpt", ""),
+                relevance=rc.get("relevance", ""),
+            )
+            # Verify the citation references a real provision
+            if self.verify_citation(citation):
+                citations.append(citation)
+            else:
+                logger.warning("Discarding unverifiable citation: %s", citation.reference)
+
+        return citations
+
     def verify_citation(self, citation: Citation) -> bool:
         """
         Verify that a citation references a real constitutional provision.
@@ -353,3 +406,203 @@ Return valid JSON array only, no markdown."""
     def list_provisions(self) -> list[ConstitutionalProvision]:
         """Return all parsed provisions."""
         return list(self.provisions.values())
+
+
+# ════════════════════════════════════════════════════════════════
+# Citation Batching
+# ════════════════════════════════════════════════════════════════
+
+
+@dataclass(slots=True)
+class _PendingCitationRequest:
+    """A citation request waiting in the batcher queue."""
+
+    action_description: str
+    action_type: str
+    model: str
+    future: asyncio.Future[list[Citation]]
+
+
+class CitationBatcher:
+    """
+    Coalesces concurrent citation requests into batched LLM calls.
+
+    Requests are buffered for up to ``max_wait_ms`` (or until ``max_batch``
+    requests are queued) and then dispatched as one numbered prompt per model.
+    Batches are capped at a modest size because citation quality degrades as
+    more actions share a single completion.
+
+    A lone request is sent through the regular single-action prompt, and any
+    batch failure falls back to per-action rule-based citations, so batching
+    never weakens the Amendment IV guarantee.
+    """
+
+    def __init__(
+        self,
+        citation_service: CitationService,
+        max_batch: int = 16,
+        max_wait_ms: float = 50.0,
+    ) -> None:
+        self.citation_service = citation_service
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue[_PendingCitationRequest] | None = None
+        self._drainer: asyncio.Task[None] | None = None
+        self._in_flight: set[asyncio.Task[None]] = set()
+
+    async def submit(
+        self,
+        action_description: str,
+        action_type: str,
+        model: str,
+    ) -> list[Citation]:
+        """Enqueue a citation request and wait for its batch to resolve."""
+        loop = asyncio.get_running_loop()
+        if self._drainer is None or self._drainer.done() or self._drainer.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._drainer = loop.create_task(self._drain())
+
+        request = _PendingCitationRequest(
+            action_description=action_description,
+            action_type=action_type,
+            model=model,
+            future=loop.create_future(),
+        )
+        self._queue.put_nowait(request)
+        return await request.future
+
+    async def close(self) -> None:
+        """Stop the drainer and wait for in-flight batches to finish."""
+        if self._drainer is not None:
+            self._drainer.cancel()
+            try:
+                await self._drainer
+            except asyncio.CancelledError:
+                pass
+            self._drainer = None
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    async def _drain(self) -> None:
+        """Collect queued requests into batches and dispatch them."""
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except TimeoutError:
+                    break
+
+            by_model: dict[str, list[_PendingCitationRequest]] = {}
+            for request in batch:
+                by_model.setdefault(request.model, []).append(request)
+
+            for model, requests in by_model.items():
+                task = loop.create_task(self._dispatch(model, requests))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(self, model: str, requests: list[_PendingCitationRequest]) -> None:
+        """Resolve one batch of requests, never leaving a future pending."""
+        service = self.citation_service
+        try:
+            if len(requests) == 1:
+                only = requests[0]
+                results = [
+                    await service.generate_citations_with_llm(
+                        action_description=only.action_description,
+                        action_type=only.action_type,
+                        model=model,
+                    )
+                ]
+            else:
+                results = await self._complete_batch(model, requests)
+        except Exception as e:
+            logger.error("Batched citation generation failed: %s", e)
+            results = [
+                service.generate_citations(r.action_description, r.action_type)
+                for r in requests
+            ]
+
+        for request, citations in zip(requests, results):
+            if not request.future.done():
+                request.future.set_result(citations)
+
+    async def _complete_batch(
+        self,
+        model: str,
+        requests: list[_PendingCitationRequest],
+    ) -> list[list[Citation]]:
+        """Issue one LLM call covering every request in the batch."""
+        from nova_syntheia.integrations import llm_router
+
+        service = self.citation_service
+        relevant: dict[str, ConstitutionalProvision] = {}
+        for request in requests:
+            for p in service.search_relevant_provisions(request.action_description):
+                relevant.setdefault(p.id, p)
+
+        if not relevant:
+            return [[] for _ in requests]
+
+        actions_text = "\n\n".join(
+            f"[{i}] Type: {r.action_type}\nDescription: {r.action_description}"
+            for i, r in enumerate(requests, start=1)
+        )
+        provisions_text = "\n\n".join(
+            f"[{p.id}] {p.reference}: {p.title}\n{p.text}"
+            for p in relevant.values()
+        )
+
+        prompt = f"""You are the Constitutional Citation Generator for Nova Syntheia.
+Your task is to identify which constitutional provisions authorize each of several
+proposed actions and generate precise citations for each one independently.
+
+PROPOSED ACTIONS:
+{actions_text}
+
+RELEVANT CONSTITUTIONAL PROVISIONS:
+{provisions_text}
+
+Return a JSON object of the form {{"results": [{{"index": 1, "citations": [...]}}, ...]}}
+with one entry per proposed action. Each citation must have:
+- "article": article number or null
+- "section": section number or null
+- "amendment": amendment number or null
+- "text_excerpt": exact quote from the provision (max 200 chars)
+- "relevance": explanation of why this provision authorizes or constrains this action
+
+Only cite provisions that are genuinely relevant. Do not fabricate provisions.
+Return valid JSON only, no markdown."""
+
+        response = await llm_router.acompletion(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.1,
+            response_format={"type": "json_object"},
+        )
+
+        raw = json.loads(response.choices[0].message.content)
+        raw_results = raw.get("results", []) if isinstance(raw, dict) else raw
+        by_index = {
+            int(r.get("index", 0)): r.get("citations", [])
+            for r in raw_results
+            if isinstance(r, dict)
+        }
+
+        results = []
+        for i, request in enumerate(requests, start=1):
+            citations = service._build_verified_citations(by_index.get(i, []))
+            if not citations:
+                # The batch omitted or garbled this action — use rule-based citations
+                citations = service.generate_citations(
+                    request.action_description, request.action_type,
+                )
+            results.append(citations)
+        return results
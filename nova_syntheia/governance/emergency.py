@@ -54,6 +54,9 @@ DEFAULT_TRIGGER_THRESHOLDS = {
 
 DEFAULT_EMERGENCY_DURATION_HOURS = 48
 
+# Full judicial review must follow within 7 days of expiry (Art. VII §5)
+POST_EMERGENCY_REVIEW_PERIOD = timedelta(days=7)
+
 
 class EmergencyPowersManager:
     """
@@ -190,7 +193,7 @@ class EmergencyPowersManager:
         """
         now = datetime.utcnow()
         expires = now + timedelta(hours=self.emergency_duration_hours)
-        review_due = expires + timedelta(days=7)
+        review_due = expires + POST_EMERGENCY_REVIEW_PERIOD
 
         activation = EmergencyActivation(
             trigger_type=trigger_type,
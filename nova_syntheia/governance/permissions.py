@@ -22,6 +22,7 @@ References:
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum
@@ -36,6 +37,9 @@ from nova_syntheia.constitution.schema import (
 
 logger = logging.getLogger(__name__)
 
+# Seconds a memoized (tier, action_type) decision stays valid
+PERMISSION_CACHE_TTL_SECONDS = 20.0
+
 
 class PermissionDecision(str, Enum):
     """Result of a permission check."""
@@ -46,7 +50,7 @@ class PermissionDecision(str, Enum):
     EXCEEDS_IRREVERSIBLE_THRESHOLD = "exceeds_irreversible_threshold"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PermissionCheckResult:
     """Result of checking an action against a permission tier."""
 
@@ -82,6 +86,7 @@ class PermissionEngine:
             tiers: Permission tier definitions. Defaults to Founding Era tiers.
         """
         self.tiers = tiers or dict(FOUNDING_PERMISSION_TIERS)
+        self._perm_cache: dict[tuple[str, str], tuple[PermissionCheckResult, float]] = {}
 
     def get_tier(self, tier_id: str) -> PermissionTier | None:
         """Retrieve a permission tier by ID."""
@@ -107,6 +112,26 @@ class PermissionEngine:
         Returns:
             PermissionCheckResult with decision and reasoning.
         """
+        # Without a dollar amount the decision depends only on (tier, action)
+        if dollar_amount is None:
+            key = (tier_id, action_type.value)
+            cached = self._perm_cache.get(key)
+            now = time.monotonic()
+            if cached is not None and cached[1] > now:
+                return cached[0]
+            result = self._evaluate(tier_id, action_type, None)
+            self._perm_cache[key] = (result, now + PERMISSION_CACHE_TTL_SECONDS)
+            return result
+
+        return self._evaluate(tier_id, action_type, dollar_amount)
+
+    def _evaluate(
+        self,
+        tier_id: str,
+        action_type: ActionType,
+        dollar_amount: Decimal | None,
+    ) -> PermissionCheckResult:
+        """Evaluate an action against its tier without consulting the cache."""
         tier = self.tiers.get(tier_id)
         if tier is None:
             return PermissionCheckResult(
@@ -197,6 +222,7 @@ class PermissionEngine:
         This must be accompanied by a ledger entry recording the change.
         """
         self.tiers[tier_id] = tier
+        self._perm_cache.clear()
         logger.info("Permission tier updated: %s", tier_id)
 
     def list_tiers(self) -> dict[str, PermissionTier]:
@@ -11,6 +11,8 @@ References:
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -21,6 +23,23 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson is absent
+    orjson = None
+
+
+def _dumps(payload: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _loads(resp: httpx.Response) -> Any:
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
 
 class OrderSide(str, Enum):
     BUY = "buy"
@@ -38,7 +57,7 @@ class TimeInForce(str, Enum):
     IOC = "ioc"  # immediate-or-cancel
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlpacaPosition:
     symbol: str
     qty: float
@@ -49,7 +68,7 @@ class AlpacaPosition:
     current_price: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlpacaOrder:
     id: str
     symbol: str
@@ -63,7 +82,7 @@ class AlpacaOrder:
     filled_at: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlpacaAccount:
     id: str
     status: str
@@ -98,10 +117,17 @@ class AlpacaClient:
 
     async def _ensure_client(self) -> httpx.AsyncClient:
         if self._client is None or self._client.is_closed:
+            # One long-lived client: TCP/TLS sessions are kept alive and
+            # reused across every request the agents make.
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 headers=self._headers,
                 timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=16,
+                    keepalive_expiry=300.0,
+                ),
             )
         return self._client
 
@@ -116,7 +142,7 @@ class AlpacaClient:
         client = await self._ensure_client()
         resp = await client.get("/v2/account")
         resp.raise_for_status()
-        data = resp.json()
+        data = _loads(resp)
         return AlpacaAccount(
             id=data["id"],
             status=data["status"],
@@ -145,7 +171,7 @@ class AlpacaClient:
                 unrealized_plpc=float(p["unrealized_plpc"]),
                 current_price=float(p["current_price"]),
             )
-            for p in resp.json()
+            for p in _loads(resp)
         ]
 
     # ── Orders ─────────────────────────────────────────────────
@@ -184,9 +210,9 @@ class AlpacaClient:
             payload["limit_price"] = str(round(limit_price, 2))
 
         client = await self._ensure_client()
-        resp = await client.post("/v2/orders", json=payload)
+        resp = await client.post("/v2/orders", content=_dumps(payload))
         resp.raise_for_status()
-        data = resp.json()
+        data = _loads(resp)
 
         logger.info(
             "Order submitted: %s %s %s (status: %s)",
@@ -209,6 +235,23 @@ class AlpacaClient:
             filled_at=data.get("filled_at"),
         )
 
+    async def submit_orders(
+        self,
+        orders: list[dict[str, Any]],
+    ) -> list[AlpacaOrder | BaseException]:
+        """
+        Submit several independent orders concurrently.
+
+        Alpaca has no batch order endpoint, so the orders are posted in
+        parallel over the shared connection pool. Each element of the result
+        is the submitted order, or the exception that order raised, in the
+        same order as `orders` (keyword arguments for `submit_order`).
+        """
+        return await asyncio.gather(
+            *(self.submit_order(**order) for order in orders),
+            return_exceptions=True,
+        )
+
     async def get_orders(
         self,
         status: str = "all",
@@ -231,7 +274,7 @@ class AlpacaClient:
                 submitted_at=o["submitted_at"],
                 filled_at=o.get("filled_at"),
             )
-            for o in resp.json()
+            for o in _loads(resp)
         ]
 
     async def cancel_order(self, order_id: str) -> bool:
@@ -252,7 +295,7 @@ class AlpacaClient:
             headers=self._headers,
         )
         resp.raise_for_status()
-        return resp.json()
+        return _loads(resp)
 
     async def get_bars(
         self,
@@ -269,7 +312,7 @@ class AlpacaClient:
             headers=self._headers,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = _loads(resp)
         return data.get("bars", [])
 
     # ── Portfolio Summary ──────────────────────────────────────
@@ -0,0 +1,87 @@
+"""
+Nova Syntheia — Shared LLM router.
+
+Every agent and the citation service route completions through one
+``litellm.Router`` so HTTP connections are pooled and per-model
+concurrency limits are enforced across the whole system rather than per
+caller.
+
+Deployments are registered on first use of a model, so agents configured
+with models outside ``settings`` still route through the shared pool.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from nova_syntheia.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_router: Any = None
+_model_list: list[dict[str, Any]] = []
+
+
+def _deployment(model: str) -> dict[str, Any]:
+    settings = get_settings()
+    return {
+        "model_name": model,
+        "litellm_params": {
+            "model": model,
+            "max_parallel_requests": settings.llm_max_parallel_requests,
+        },
+    }
+
+
+def get_router(model: str | None = None) -> Any:
+    """Return the shared router, registering ``model`` if it is new."""
+    global _router
+    import litellm
+
+    if _router is None:
+        settings = get_settings()
+        configured = {
+            settings.judicial_model,
+            settings.executive_model,
+            settings.federal_reserve_model,
+            settings.citation_model,
+            settings.custodian_model,
+        }
+        _model_list.extend(_deployment(m) for m in sorted(configured))
+        _router = litellm.Router(
+            model_list=_model_list,
+            num_retries=settings.llm_num_retries,
+            timeout=settings.llm_timeout_seconds,
+        )
+
+    if model is not None and all(d["model_name"] != model for d in _model_list):
+        _model_list.append(_deployment(model))
+        _router.set_model_list(_model_list)
+        logger.info("Registered LLM deployment: %s", model)
+
+    return _router
+
+
+def system_message(model: str, content: str) -> dict[str, Any]:
+    """
+    Build a system message, marked as a prompt-cache breakpoint when useful.
+
+    Anthropic only caches prefixes that carry an explicit ``cache_control``
+    marker; OpenAI caches long stable prefixes automatically, so other
+    providers get a plain message.
+    """
+    provider_caches = model.startswith(("anthropic/", "claude"))
+    if provider_caches and get_settings().llm_prompt_caching:
+        return {
+            "role": "system",
+            "content": [
+                {"type": "text", "text": content, "cache_control": {"type": "ephemeral"}},
+            ],
+        }
+    return {"role": "system", "content": content}
+
+
+async def acompletion(model: str, messages: list[dict[str, Any]], **kwargs: Any) -> Any:
+    """Route a chat completion through the shared router."""
+    return await get_router(model).acompletion(model=model, messages=messages, **kwargs)
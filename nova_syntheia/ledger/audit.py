@@ -25,7 +25,7 @@ import time
 from rich.console import Console
 from rich.table import Table
 
-from nova_syntheia.config import settings
+from nova_syntheia.config import get_settings
 from nova_syntheia.ledger.service import LedgerService
 
 console = Console()
@@ -118,7 +118,7 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    db_url = args.database_url or settings.database_url_sync
+    db_url = args.database_url or get_settings().database_url_sync
     is_valid = run_audit(db_url, verbose=args.verbose)
     sys.exit(0 if is_valid else 1)
 
@@ -18,14 +18,17 @@ References:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
+import threading
 from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID, uuid4
 
 from sqlalchemy import create_engine, select, func, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, sessionmaker
 
 from nova_syntheia.ledger.models import Base, LedgerEntryDB
@@ -39,6 +42,43 @@ logger = logging.getLogger(__name__)
 
 GENESIS_HASH = "0" * 64  # The "previous hash" for the first entry in the chain
 
+# Write-coalescing window for LedgerAppendBatcher
+DEFAULT_BATCH_WINDOW_SECONDS = 0.25
+DEFAULT_MAX_BATCH_SIZE = 128
+
+# Attempts per append block when another process advances the chain tip first
+LEDGER_APPEND_ATTEMPTS = 3
+
+# Rows fetched per round-trip while verify_chain streams the ledger
+VERIFY_CHAIN_CHUNK_SIZE = 1000
+
+# The columns verify_chain reads — exactly the inputs to _compute_hash
+_VERIFY_COLUMNS = (
+    LedgerEntryDB.id,
+    LedgerEntryDB.sequence_number,
+    LedgerEntryDB.previous_hash,
+    LedgerEntryDB.entry_hash,
+    LedgerEntryDB.timestamp,
+    LedgerEntryDB.entry_type,
+    LedgerEntryDB.author_role,
+    LedgerEntryDB.author_member_id,
+    LedgerEntryDB.content,
+    LedgerEntryDB.supersedes,
+    LedgerEntryDB.emergency_designation,
+)
+
+
+def _stored_utc(timestamp: datetime) -> datetime:
+    """
+    Recover the UTC timestamp an entry was hashed with from its stored value.
+
+    Entries are stamped with an aware UTC datetime, but the database may hand
+    it back naive (SQLite) or shifted to its session time zone.
+    """
+    if timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc)
+
 
 class LedgerIntegrityError(Exception):
     """Raised when the hash chain integrity check fails."""
@@ -79,6 +119,20 @@ class LedgerService:
         """
         self.engine = create_engine(database_url, echo=False)
         self.SessionLocal = sessionmaker(bind=self.engine)
+        # Serializes tip-read → insert → commit for every writer in this process
+        self._write_lock = threading.Lock()
+        self._shared_batcher: LedgerAppendBatcher | None = None
+
+    def shared_batcher(self) -> LedgerAppendBatcher:
+        """
+        The async writer shared by every agent using this service.
+
+        Concurrent appends queue behind one drainer and are committed as
+        chained blocks, so async callers never write to the chain directly.
+        """
+        if self._shared_batcher is None:
+            self._shared_batcher = LedgerAppendBatcher(self, window_seconds=0)
+        return self._shared_batcher
 
     def initialize(self) -> None:
         """
@@ -157,6 +211,7 @@ class LedgerService:
         content: dict[str, Any],
         supersedes: UUID | None = None,
         emergency_designation: bool = False,
+        entry_id: UUID | None = None,
     ) -> LedgerEntryDB:
         """
         Append a new entry to the National Ledger.
@@ -171,6 +226,7 @@ class LedgerService:
             content: Structured content of the entry.
             supersedes: ID of entry this corrects/supersedes (Art. VIII §2).
             emergency_designation: Whether under Emergency Powers (Art. VII).
+            entry_id: Pre-allocated ID for the entry; generated if omitted.
 
         Returns:
             The newly created LedgerEntryDB record.
@@ -178,6 +234,55 @@ class LedgerService:
         Raises:
             LedgerIntegrityError: If hash chain computation fails.
         """
+        return self.append_many([
+            {
+                "entry_type": entry_type,
+                "author_role": author_role,
+                "author_member_id": author_member_id,
+                "content": content,
+                "supersedes": supersedes,
+                "emergency_designation": emergency_designation,
+                "entry_id": entry_id,
+            }
+        ])[0]
+
+    def append_many(self, entries: list[dict[str, Any]]) -> list[LedgerEntryDB]:
+        """
+        Append several entries to the National Ledger in one transaction.
+
+        Entries are chained in list order exactly as if append() had been
+        called for each one, but share a single session and commit.
+
+        Args:
+            entries: Keyword-argument dicts accepted by append().
+
+        Returns:
+            The newly created LedgerEntryDB records, in chain order.
+
+        Raises:
+            LedgerIntegrityError: If hash chain computation fails.
+            IntegrityError: If the chain tip kept moving under another process.
+        """
+        if not entries:
+            return []
+
+        with self._write_lock:
+            attempt = 1
+            while True:
+                try:
+                    return self._append_block(entries)
+                except IntegrityError:
+                    # Another process claimed the next sequence number; re-read the tip
+                    if attempt >= LEDGER_APPEND_ATTEMPTS:
+                        raise
+                    logger.warning(
+                        "Ledger tip moved during append (attempt %d/%d); retrying",
+                        attempt, LEDGER_APPEND_ATTEMPTS,
+                    )
+                    attempt += 1
+
+    def _append_block(self, entries: list[dict[str, Any]]) -> list[LedgerEntryDB]:
+        """Chain and commit entries onto the current tip. Caller holds _write_lock."""
         with self.SessionLocal() as session:
             # Get the last entry for chaining
             last_entry = session.execute(
@@ -191,48 +296,56 @@ class LedgerService:
                     "Cannot append: no genesis block found. Call initialize() first."
                 )
 
-            new_seq = last_entry.sequence_number + 1
+            new_seq = last_entry.sequence_number
             previous_hash = last_entry.entry_hash
-            entry_id = uuid4()
-            timestamp = datetime.now(timezone.utc)
-
-            entry_hash = self._compute_hash(
-                entry_id=entry_id,
-                sequence_number=new_seq,
-                previous_hash=previous_hash,
-                timestamp=timestamp,
-                entry_type=entry_type,
-                author_role=author_role,
-                author_member_id=author_member_id,
-                content=content,
-                supersedes=supersedes,
-                emergency_designation=emergency_designation,
-            )
+            created = []
+
+            for fields in entries:
+                new_seq += 1
+                entry_id = fields.get("entry_id") or uuid4()
+                timestamp = datetime.now(timezone.utc)
+                supersedes = fields.get("supersedes")
+                emergency_designation = fields.get("emergency_designation", False)
+
+                entry_hash = self._compute_hash(
+                    entry_id=entry_id,
+                    sequence_number=new_seq,
+                    previous_hash=previous_hash,
+                    timestamp=timestamp,
+                    entry_type=fields["entry_type"],
+                    author_role=fields["author_role"],
+                    author_member_id=fields["author_member_id"],
+                    content=fields["content"],
+                    supersedes=supersedes,
+                    emergency_designation=emergency_designation,
+                )
 
-            entry = LedgerEntryDB(
-                id=entry_id,
-                sequence_number=new_seq,
-                previous_hash=previous_hash,
-                entry_hash=entry_hash,
-                timestamp=timestamp,
-                entry_type=entry_type,
-                author_role=author_role,
-                author_member_id=author_member_id,
-                content=content,
-                supersedes=supersedes,
-                emergency_designation=emergency_designation,
-            )
+                entry = LedgerEntryDB(
+                    id=entry_id,
+                    sequence_number=new_seq,
+                    previous_hash=previous_hash,
+                    entry_hash=entry_hash,
+                    timestamp=timestamp,
+                    entry_type=fields["entry_type"],
+                    author_role=fields["author_role"],
+                    author_member_id=fields["author_member_id"],
+                    content=fields["content"],
+                    supersedes=supersedes,
+                    emergency_designation=emergency_designation,
+                )
+                session.add(entry)
+                created.append(entry)
+                previous_hash = entry_hash
 
-            session.add(entry)
             session.commit()
-            session.refresh(entry)
-
-            logger.info(
-                "Ledger entry appended: seq=%d type=%s hash=%s",
-                new_seq, entry_type, entry_hash[:16],
-            )
+            for entry in created:
+                session.refresh(entry)
+                logger.info(
+                    "Ledger entry appended: seq=%d type=%s hash=%s",
+                    entry.sequence_number, entry.entry_type, entry.entry_hash[:16],
+                )
 
-            return entry
+            return created
 
     def verify_chain(self) -> tuple[bool, int, str]:
         """
@@ -242,60 +355,71 @@ class LedgerService:
         verifying it matches the stored hash. This satisfies Art. VIII §2:
         independently auditable.
 
+        Only the hashed columns are read, as plain rows streamed in chunks
+        of VERIFY_CHAIN_CHUNK_SIZE, so memory stays flat as the ledger
+        grows and no ORM instances are built.
+
         Returns:
             Tuple of (is_valid, entries_verified, message).
         """
         with self.SessionLocal() as session:
-            entries = session.execute(
-                select(LedgerEntryDB).order_by(LedgerEntryDB.sequence_number.asc())
-            ).scalars().all()
-
-            if not entries:
-                return False, 0, "No entries found in ledger"
-
-            # Verify genesis block
-            first = entries[0]
-            if first.sequence_number != 0:
-                return False, 0, f"First entry has sequence {first.sequence_number}, expected 0"
+            rows = session.execute(
+                select(*_VERIFY_COLUMNS).order_by(LedgerEntryDB.sequence_number.asc()),
+                execution_options={"yield_per": VERIFY_CHAIN_CHUNK_SIZE},
+            )
 
-            if first.previous_hash != GENESIS_HASH:
-                return False, 0, "Genesis block has incorrect previous_hash"
+            verified = 0
+            prior_hash = GENESIS_HASH
+            for i, row in enumerate(rows):
+                if i == 0:
+                    # Verify genesis block
+                    if row.sequence_number != 0:
+                        return (
+                            False, 0,
+                            f"First entry has sequence {row.sequence_number}, expected 0",
+                        )
+                    if row.previous_hash != GENESIS_HASH:
+                        return False, 0, "Genesis block has incorrect previous_hash"
 
-            # Verify the chain
-            for i, entry in enumerate(entries):
                 # Recompute hash
                 expected_hash = self._compute_hash(
-                    entry_id=entry.id,
-                    sequence_number=entry.sequence_number,
-                    previous_hash=entry.previous_hash,
-                    timestamp=entry.timestamp,
-                    entry_type=entry.entry_type,
-                    author_role=entry.author_role,
-                    author_member_id=entry.author_member_id,
-                    content=entry.content,
-                    supersedes=entry.supersedes,
-                    emergency_designation=entry.emergency_designation,
+                    entry_id=row.id,
+                    sequence_number=row.sequence_number,
+                    previous_hash=row.previous_hash,
+                    timestamp=_stored_utc(row.timestamp),
+                    entry_type=row.entry_type,
+                    author_role=row.author_role,
+                    author_member_id=row.author_member_id,
+                    content=row.content,
+                    supersedes=row.supersedes,
+                    emergency_designation=row.emergency_designation,
                 )
 
-                if entry.entry_hash != expected_hash:
+                if row.entry_hash != expected_hash:
                     return (
                         False, i,
-                        f"Hash mismatch at sequence {entry.sequence_number}: "
-                        f"stored={entry.entry_hash[:16]}... "
+                        f"Hash mismatch at sequence {row.sequence_number}: "
+                        f"stored={row.entry_hash[:16]}... "
                         f"computed={expected_hash[:16]}..."
                     )
 
                 # Verify chain linkage (except genesis)
-                if i > 0 and entry.previous_hash != entries[i - 1].entry_hash:
+                if i > 0 and row.previous_hash != prior_hash:
                     return (
                         False, i,
-                        f"Chain break at sequence {entry.sequence_number}: "
+                        f"Chain break at sequence {row.sequence_number}: "
                         f"previous_hash does not match prior entry's hash"
                     )
 
+                prior_hash = row.entry_hash
+                verified = i + 1
+
+            if not verified:
+                return False, 0, "No entries found in ledger"
+
             return (
-                True, len(entries),
-                f"Chain verified: {len(entries)} entries, integrity intact"
+                True, verified,
+                f"Chain verified: {verified} entries, integrity intact"
             )
 
     def get_entry(self, entry_id: UUID) -> LedgerEntryDB | None:
@@ -427,9 +551,133 @@ class LedgerService:
             "emergency_designation": emergency_designation,
         }
         canonical = json.dumps(hashable, sort_keys=True, default=str)
-        return hashlib.sha256(
-            (previous_hash + canonical).encode("utf-8")
-        ).hexdigest()
+        # Fed in two updates — same digest as hashing the concatenation
+        digest = hashlib.sha256(previous_hash.encode("utf-8"))
+        digest.update(canonical.encode("utf-8"))
+        return digest.hexdigest()
+
+
+class LedgerAppendBatcher:
+    """
+    Coalesces concurrent ledger appends into time-windowed chained blocks.
+
+    The first queued write opens a window of ``window_seconds``; every write
+    arriving within it (up to ``max_batch``) is appended by a single
+    append_many() call, sharing one read of the chain tip and one commit.
+    With a zero window, whatever queued up while the previous block was
+    committing goes out together.
+    Each caller receives its own committed entry, so append-only and
+    hash-chain semantics are unchanged (Art. VIII §2).
+
+    Usage:
+        batcher = LedgerAppendBatcher(service)
+        entry = await batcher.append(entry_type=..., author_role=..., ...)
+    """
+
+    def __init__(
+        self,
+        ledger_service: LedgerService,
+        window_seconds: float = DEFAULT_BATCH_WINDOW_SECONDS,
+        max_batch: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        self.ledger_service = ledger_service
+        self.window_seconds = window_seconds
+        self.max_batch = max_batch
+        self._queue: (
+            asyncio.Queue[tuple[dict[str, Any], asyncio.Future[LedgerEntryDB]]] | None
+        ) = None
+        self._drainer: asyncio.Task[None] | None = None
+
+    async def append(self, **fields: Any) -> LedgerEntryDB:
+        """Queue an entry (same arguments as LedgerService.append) and await its commit."""
+        return await self.submit(**fields)
+
+    def submit(self, **fields: Any) -> asyncio.Future[LedgerEntryDB]:
+        """
+        Queue an entry without waiting for it to be committed.
+
+        Must be called from a running event loop. The returned future
+        resolves to the committed entry, or to the error that rejected it.
+        """
+        loop = asyncio.get_running_loop()
+        if self._drainer is None or self._drainer.done() or self._drainer.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._drainer = loop.create_task(self._drain())
+
+        future: asyncio.Future[LedgerEntryDB] = loop.create_future()
+        self._queue.put_nowait((fields, future))
+        return future
+
+    async def flush(self) -> None:
+        """Wait until every queued write has been committed or has failed."""
+        if self._queue is not None and self._drainer is not None and not self._drainer.done():
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Stop the background drainer."""
+        if self._drainer is not None:
+            self._drainer.cancel()
+            try:
+                await self._drainer
+            except asyncio.CancelledError:
+                pass
+            self._drainer = None
+
+    async def _drain(self) -> None:
+        """Collect one window of writes at a time and commit it as a block."""
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window_seconds
+            while len(batch) < self.max_batch:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except TimeoutError:
+                    break
+
+            try:
+                await self._commit(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _commit(
+        self, batch: list[tuple[dict[str, Any], asyncio.Future[LedgerEntryDB]]]
+    ) -> None:
+        """Append one block, resolving each caller's future with its entry or error."""
+        try:
+            entries = await asyncio.to_thread(
+                self.ledger_service.append_many, [fields for fields, _ in batch]
+            )
+        except Exception as e:
+            if len(batch) == 1:
+                _, future = batch[0]
+                if not future.done():
+                    future.set_exception(e)
+                return
+            # One bad entry aborts the whole block — retry individually so
+            # valid writes are not rejected along with it.
+            for fields, future in batch:
+                try:
+                    entry = await asyncio.to_thread(self.ledger_service.append, **fields)
+                except Exception as single_error:
+                    if not future.done():
+                        future.set_exception(single_error)
+                else:
+                    if not future.done():
+                        future.set_result(entry)
+            return
+
+        for (_, future), entry in zip(batch, entries):
+            if not future.done():
+                future.set_result(entry)
 
 
 # Convenience import alias
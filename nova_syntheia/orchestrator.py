@@ -19,13 +19,14 @@ from uuid import uuid4
 
 import structlog
 
-from nova_syntheia.config import settings
+from nova_syntheia.config import get_settings
 
 logger = logging.getLogger(__name__)
 
 
 def configure_logging() -> None:
     """Configure structured logging."""
+    settings = get_settings()
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
@@ -50,6 +51,7 @@ def configure_logging() -> None:
 
 async def main() -> None:
     """Main orchestrator loop."""
+    settings = get_settings()
     configure_logging()
     log = structlog.get_logger()
 
@@ -70,10 +72,10 @@ async def main() -> None:
 
     # Phase 2: Parse & index constitution
     log.info("nova_syntheia.orchestrator.init_constitution")
-    from nova_syntheia.constitution.parser import index_provisions_to_chromadb, parse_constitution
+    from nova_syntheia.constitution.parser import aindex_provisions_to_chromadb, parse_constitution
 
     provisions = parse_constitution("README.md")
-    index_provisions_to_chromadb(
+    await aindex_provisions_to_chromadb(
         provisions, chroma_host=settings.chroma_host, chroma_port=settings.chroma_port
     )
     log.info(
@@ -106,7 +108,9 @@ async def main() -> None:
 
     agents = {
         "operations_executive": OperationsExecutiveAgent(
-            member_id=uuid4(), model=settings.executive_model
+            member_id=uuid4(),
+            model=settings.executive_model,
+            notification_workers=settings.notification_workers,
         ),
         "portfolio_executive": PortfolioExecutiveAgent(
             member_id=uuid4(), model=settings.executive_model
@@ -152,6 +156,7 @@ async def main() -> None:
             base_url=settings.alpaca_base_url,
         )
         dashboard_state.alpaca_client = alpaca
+        agents["portfolio_executive"].alpaca_client = alpaca
         log.info("nova_syntheia.orchestrator.alpaca_connected")
 
     log.info("nova_syntheia.orchestrator.running", message="All systems operational")
@@ -182,6 +187,11 @@ async def main() -> None:
 
     except KeyboardInterrupt:
         log.info("nova_syntheia.orchestrator.shutdown")
+        await agents["operations_executive"].flush_notifications()
+        await agents["operations_executive"].aclose()
+        for agent in agents.values():
+            await agent.flush_ledger()
+        await agents["portfolio_executive"].aclose()
     except Exception as e:
         log.exception("nova_syntheia.orchestrator.fatal_error", error=str(e))
         sys.exit(1)
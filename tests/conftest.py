@@ -0,0 +1,55 @@
+"""Shared fixtures for Nova Syntheia tests."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+
+from nova_syntheia.agents import base
+from nova_syntheia.dashboard import app as dashboard_app
+from nova_syntheia.integrations import alpaca_client
+from nova_syntheia.ledger.service import LedgerService
+
+# Modules that use orjson when installed and fall back to stdlib json
+_ORJSON_MODULES = (base, alpaca_client, dashboard_app)
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_as_sqlite_json(type_, compiler, **kw):
+    # The ledger tables target PostgreSQL; SQLite stores JSONB columns as JSON
+    return "JSON"
+
+
+@pytest.fixture
+def ledger_service(tmp_path) -> LedgerService:
+    """A LedgerService backed by a throwaway SQLite file, genesis seeded."""
+    service = LedgerService(f"sqlite:///{tmp_path / 'ledger.db'}")
+    service.initialize()
+    yield service
+    service.engine.dispose()
+
+
+@pytest.fixture
+def assert_chain_intact():
+    """Check a ledger holds exactly `count` entries, gap-free and verifiable."""
+
+    def check(service: LedgerService, count: int) -> None:
+        sequences = sorted(e.sequence_number for e in service.get_latest_entries(limit=count + 1))
+        assert sequences == list(range(count)), "sequence numbers must be gap-free"
+        is_valid, verified, message = service.verify_chain()
+        assert is_valid, message
+        assert verified == count
+
+    return check
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch) -> str:
+    """Run a test once with orjson and once with the stdlib json fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        for module in _ORJSON_MODULES:
+            monkeypatch.setattr(module, "orjson", None)
+    return request.param
@@ -0,0 +1,434 @@
+"""
+Tests for the constitutional agent base — Art. II §2–3, Amendment IV.
+
+Validates:
+- Every executed, denied, and escalated action reaches the ledger
+- Executed actions queue their ledger write instead of awaiting the commit
+- The in-memory action history is a bounded ring buffer
+- Concurrent agents sharing one ledger keep the hash chain intact
+- Bulk execution keeps input order and isolates per-action failures
+- Notifications are delivered by a bounded worker pool
+- Prebuilt citations apply only to a role's own authorities
+- Reasoning context renders the same with or without orjson
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import pytest
+
+from nova_syntheia.agents import base
+from nova_syntheia.agents.base import ActionHistoryStore, ActionSpec, ConstitutionalActionError
+from nova_syntheia.agents.custodian.ledger_custodian import LedgerCustodianAgent
+from nova_syntheia.agents.executive import operations
+from nova_syntheia.agents.executive.operations import OperationsExecutiveAgent
+from nova_syntheia.agents.executive.portfolio import PortfolioExecutiveAgent
+from nova_syntheia.constitution.schema import ActionType, Citation, LedgerEntryType
+
+MODEL = "test-model"  # never called: no citation service, no reasoning
+
+
+def _status_check(agent: OperationsExecutiveAgent):
+    return agent.execute_action(
+        ActionType.ROUTINE_OPERATION, "status", "routine check", {"operation": "status_check"}
+    )
+
+
+class TestAgentLedgerWrites:
+    """Action logging through the ledger service's shared writer."""
+
+    async def test_concurrent_agents_record_every_action(
+        self, ledger_service, assert_chain_intact
+    ):
+        agents = [
+            OperationsExecutiveAgent(uuid4(), MODEL, ledger_service=ledger_service)
+            for _ in range(4)
+        ]
+        custodian = LedgerCustodianAgent(uuid4(), MODEL, ledger_service=ledger_service)
+        write = {
+            "entry_type": LedgerEntryType.EXECUTIVE_ACTION.value,
+            "author_role": "operations_executive",
+            "author_member_id": str(uuid4()),
+            "content": {"note": "custodial write"},
+        }
+
+        results = await asyncio.gather(
+            *(_status_check(agent) for agent in agents for _ in range(5)),
+            *(
+                custodian.execute_action(
+                    ActionType.WRITE_LEDGER_ENTRY, "write", "custodial record", write
+                )
+                for _ in range(5)
+            ),
+        )
+
+        assert all(r["ledger_status"] == "queued" for r in results)
+        assert len({r["ledger_entry_id"] for r in results}) == len(results)
+
+        await agents[0].flush_ledger()
+        # genesis + 25 action records + 5 custodial writes
+        assert_chain_intact(ledger_service, 1 + 25 + 5)
+        for r in results:
+            assert ledger_service.get_entry(UUID(r["ledger_entry_id"])) is not None
+
+    async def test_action_does_not_wait_for_commit(self, ledger_service, monkeypatch):
+        release = asyncio.Event()
+        batcher = ledger_service.shared_batcher()
+        commit = batcher._commit
+
+        async def held_commit(batch):
+            await release.wait()
+            await commit(batch)
+
+        monkeypatch.setattr(batcher, "_commit", held_commit)
+        agent = OperationsExecutiveAgent(uuid4(), MODEL, ledger_service=ledger_service)
+
+        result = await asyncio.wait_for(_status_check(agent), timeout=1)
+
+        assert result["ledger_status"] == "queued"
+        assert ledger_service.get_entry_count() == 1  # only genesis so far
+        release.set()
+        await agent.flush_ledger()
+        assert ledger_service.get_entry(UUID(result["ledger_entry_id"])) is not None
+
+    async def test_denied_and_escalated_actions_are_recorded(
+        self, ledger_service, assert_chain_intact
+    ):
+        agent = OperationsExecutiveAgent(uuid4(), MODEL, ledger_service=ledger_service)
+
+        with pytest.raises(ConstitutionalActionError):
+            await agent.execute_action(ActionType.RATIFY_AMENDMENT, "ratify", "test")
+        escalated = await agent.execute_action(ActionType.ADMIT_MEMBER, "admit", "test")
+
+        assert escalated["status"] == "escalated"
+        decisions = [
+            e.content["permission_decision"] for e in ledger_service.get_latest_entries(limit=2)
+        ]
+        assert decisions == ["requires_approval", "forbidden"]
+        assert_chain_intact(ledger_service, 3)
+
+    async def test_ledger_failure_is_logged(self, ledger_service, monkeypatch, caplog):
+        def broken(entries):
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(ledger_service, "append_many", broken)
+        monkeypatch.setattr(ledger_service, "append", lambda **fields: broken([fields]))
+        agent = OperationsExecutiveAgent(uuid4(), MODEL, ledger_service=ledger_service)
+
+        result = await _status_check(agent)
+        await agent.flush_ledger()
+
+        assert result["status"] == "executed"
+        assert result["ledger_status"] == "queued"
+        assert "Failed to log action to ledger" in caplog.text
+        assert "database unavailable" in caplog.text
+
+    async def test_without_ledger_action_is_unrecorded(self):
+        agent = OperationsExecutiveAgent(uuid4(), MODEL)
+
+        result = await _status_check(agent)
+
+        assert result["ledger_status"] == "unrecorded"
+        assert result["ledger_entry_id"] is None
+
+
+class TestActionHistoryStore:
+    """The columnar action history ring buffer."""
+
+    def test_rows_round_trip(self):
+        store = ActionHistoryStore(maxlen=4)
+        action_id = uuid4()
+        at = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+
+        store.record(action_id, ActionType.VERIFY_CHAIN, at)
+
+        assert list(store) == [
+            {"action_id": action_id, "action_type": ActionType.VERIFY_CHAIN, "timestamp": at}
+        ]
+
+    def test_oldest_rows_are_evicted(self):
+        store = ActionHistoryStore(maxlen=3)
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        ids = [uuid4() for _ in range(5)]
+
+        for n, action_id in enumerate(ids):
+            store.record(action_id, ActionType.ROUTINE_OPERATION, start + timedelta(seconds=n))
+
+        assert len(store) == 3
+        assert store.total_recorded == 5
+        rows = list(store)
+        assert [r["action_id"] for r in rows] == ids[2:]
+        assert [r["timestamp"] for r in rows] == [start + timedelta(seconds=n) for n in (2, 3, 4)]
+
+    async def test_agent_records_executed_actions_only(self):
+        agent = OperationsExecutiveAgent(uuid4(), MODEL)
+
+        await _status_check(agent)
+        with pytest.raises(ConstitutionalActionError):
+            await agent.execute_action(ActionType.RATIFY_AMENDMENT, "ratify", "test")
+
+        assert [r["action_type"] for r in agent.action_history] == [
+            ActionType.ROUTINE_OPERATION
+        ]
+
+
+def _routine(operation: str) -> ActionSpec:
+    return ActionSpec(
+        ActionType.ROUTINE_OPERATION, operation, "bulk test", {"operation": operation}
+    )
+
+
+class TestExecuteActionsBulk:
+    """execute_actions_bulk() over mixed batches."""
+
+    async def test_results_follow_input_order(self, monkeypatch):
+        agent = OperationsExecutiveAgent(uuid4(), MODEL)
+
+        async def slow_routine(inputs):
+            # Earlier actions finish last
+            await asyncio.sleep(0.01 * (5 - int(inputs["operation"])))
+            return {"status": "completed", "operation": inputs["operation"]}
+
+        monkeypatch.setattr(agent, "_handle_routine_operation", slow_routine)
+        results = await agent.execute_actions_bulk([_routine(str(i)) for i in range(5)])
+
+        assert [r["outputs"]["operation"] for r in results] == ["0", "1", "2", "3", "4"]
+
+    async def test_partial_failure_does_not_abort_batch(
+        self, monkeypatch, ledger_service, assert_chain_intact
+    ):
+        agent = OperationsExecutiveAgent(uuid4(), MODEL, ledger_service=ledger_service)
+        original = agent._handle_routine_operation
+
+        async def flaky_routine(inputs):
+            if inputs["operation"] == "explode":
+                raise RuntimeError("handler crashed")
+            return await original(inputs)
+
+        monkeypatch.setattr(agent, "_handle_routine_operation", flaky_routine)
+        results = await agent.execute_actions_bulk(
+            [_routine("health_check"), _routine("explode"), _routine("status_check")]
+        )
+
+        assert [r["status"] for r in results] == ["executed", "failed", "executed"]
+        assert results[1]["error"] == "handler crashed"
+        assert results[1]["action_type"] == ActionType.ROUTINE_OPERATION.value
+        # A failed handler is never recorded as executed
+        await agent.flush_ledger()
+        assert_chain_intact(ledger_service, 1 + 2)
+
+    async def test_denied_and_escalated_actions_in_batch(
+        self, ledger_service, assert_chain_intact
+    ):
+        agent = OperationsExecutiveAgent(uuid4(), MODEL, ledger_service=ledger_service)
+
+        results = await agent.execute_actions_bulk([
+            ActionSpec(ActionType.RATIFY_AMENDMENT, "ratify", "bulk test"),
+            _routine("health_check"),
+            ActionSpec(ActionType.ADMIT_MEMBER, "admit", "bulk test"),
+        ])
+
+        assert [r["status"] for r in results] == ["rejected", "executed", "escalated"]
+        assert "ACTION FORBIDDEN" in results[0]["error"]
+        assert results[0]["action_type"] == ActionType.RATIFY_AMENDMENT.value
+        # Denial, execution and escalation are each recorded once
+        assert_chain_intact(ledger_service, 1 + 3)
+
+    async def test_empty_batch(self):
+        agent = OperationsExecutiveAgent(uuid4(), MODEL)
+        assert await agent.execute_actions_bulk([]) == []
+
+
+@pytest.fixture
+async def dispatcher():
+    agent = OperationsExecutiveAgent(uuid4(), MODEL)
+    yield agent
+    await agent.aclose()
+
+
+def _notices(*channels: str) -> dict:
+    return {"notifications": [{"subject": str(i), "channel": c} for i, c in enumerate(channels)]}
+
+
+class TestNotificationDispatch:
+    """The notification worker pool."""
+
+    async def test_batch_is_delivered(self, dispatcher):
+        result = await dispatcher._handle_notification(_notices("dashboard", "dashboard"))
+        await dispatcher.flush_notifications()
+
+        assert result["status"] == "dispatched"
+        assert [n["subject"] for n in result["notifications"]] == ["0", "1"]
+        assert sorted(n["subject"] for n in dispatcher.delivered_notifications) == ["0", "1"]
+        assert dispatcher._notification_stats["dispatched"] == 2
+        assert dispatcher._pending_notifications() == 0
+
+    async def test_slow_channel_does_not_stall_others(self, dispatcher):
+        release = asyncio.Event()
+
+        async def slow(notification):
+            await release.wait()
+
+        dispatcher.notification_channels["slow"] = slow
+        await dispatcher._handle_notification(_notices("slow", "dashboard", "dashboard"))
+        while len(dispatcher.delivered_notifications) < 2:
+            await asyncio.sleep(0)
+
+        assert dispatcher._notification_stats["dispatched"] == 2
+        release.set()
+        await dispatcher.flush_notifications()
+        assert dispatcher._notification_stats["dispatched"] == 3
+
+    async def test_failed_delivery_is_counted(self, dispatcher):
+        async def broken(notification):
+            raise ConnectionError("smtp down")
+
+        dispatcher.notification_channels["email"] = broken
+        await dispatcher._handle_notification(_notices("email", "unknown-channel"))
+        await dispatcher.flush_notifications()
+
+        assert dispatcher._notification_stats["failed"] == 1
+        # Unknown channels fall back to the dashboard
+        assert [n["channel"] for n in dispatcher.delivered_notifications] == ["unknown-channel"]
+
+    async def test_full_queue_applies_backpressure(self, dispatcher, monkeypatch):
+        monkeypatch.setattr(operations, "NOTIFICATION_QUEUE_MAXSIZE", 1)
+        dispatcher.notification_workers = 1
+        release = asyncio.Event()
+
+        async def blocked(notification):
+            await release.wait()
+
+        dispatcher.notification_channels["blocked"] = blocked
+        enqueue = asyncio.ensure_future(
+            dispatcher._handle_notification(_notices("blocked", "blocked", "blocked"))
+        )
+        await asyncio.sleep(0.01)
+        assert not enqueue.done()
+
+        release.set()
+        await enqueue
+        await dispatcher.flush_notifications()
+        assert dispatcher._notification_stats["dispatched"] == 3
+
+    async def test_pool_size_is_configurable(self):
+        agent = OperationsExecutiveAgent(uuid4(), MODEL, notification_workers=3)
+
+        await agent._handle_notification(_notices("dashboard"))
+
+        assert len(agent._notification_workers) == 3
+        await agent.aclose()
+
+    async def test_aclose_stops_workers(self, dispatcher):
+        await dispatcher._handle_notification(_notices("dashboard"))
+        await dispatcher.flush_notifications()
+        workers = list(dispatcher._notification_workers)
+
+        await dispatcher.aclose()
+
+        assert workers and all(w.done() for w in workers)
+        assert dispatcher._notification_workers == []
+        # The pool restarts on the next dispatch
+        await dispatcher._handle_notification(_notices("dashboard"))
+        await dispatcher.flush_notifications()
+        assert len(dispatcher.delivered_notifications) == 2
+
+
+class _StubCitationService:
+    """Records batched requests and answers with one fixed citation."""
+
+    def __init__(self) -> None:
+        self.requests: list[str] = []
+
+    async def generate_citations_batched(self, action_description, action_type, model):
+        self.requests.append(action_type)
+        return [Citation(article="VI", section=6, text_excerpt="stub", relevance="stub")]
+
+
+class TestCitations:
+    """Prebuilt and fallback citations."""
+
+    async def test_static_citations_are_copies(self):
+        agent = OperationsExecutiveAgent(uuid4(), MODEL)
+
+        [citation] = await agent._generate_citations(ActionType.ROUTINE_OPERATION, "o", "j")
+        citation.relevance = "edited by a caller"
+
+        assert citation is not base._BOUNDED_AUTONOMY
+        [again] = await agent._generate_citations(ActionType.ROUTINE_OPERATION, "o", "j")
+        assert again.relevance == base._BOUNDED_AUTONOMY.relevance
+
+    async def test_static_citations_require_role_authority(self):
+        service = _StubCitationService()
+        operations = OperationsExecutiveAgent(uuid4(), MODEL, citation_service=service)
+        portfolio = PortfolioExecutiveAgent(uuid4(), MODEL, citation_service=service)
+        assert ActionType.NOTIFICATION_DISPATCH not in portfolio.role.authorities
+
+        [prebuilt] = await operations._generate_citations(
+            ActionType.NOTIFICATION_DISPATCH, "o", "j"
+        )
+        [generated] = await portfolio._generate_citations(
+            ActionType.NOTIFICATION_DISPATCH, "o", "j"
+        )
+
+        assert prebuilt.text_excerpt == base._BOUNDED_AUTONOMY.text_excerpt
+        assert generated.text_excerpt == "stub"
+        assert service.requests == [ActionType.NOTIFICATION_DISPATCH.value]
+
+    async def test_fallback_citations_are_copies(self):
+        agent = PortfolioExecutiveAgent(uuid4(), MODEL)
+
+        [first] = await agent._generate_citations(ActionType.PORTFOLIO_TRADE, "o", "j")
+        first.relevance = "edited by a caller"
+        [second] = await agent._generate_citations(ActionType.PORTFOLIO_TRADE, "o", "j")
+
+        assert second is not first
+        assert "portfolio_executive" in second.relevance
+
+
+_CONTEXT = {
+    "member": uuid4(),
+    "spec": ActionSpec(ActionType.ROUTINE_OPERATION, "o", "j"),
+    "at": datetime(2026, 10, 1, tzinfo=timezone.utc),
+    "amount": Decimal("12.50"),
+    "rates": [0.1, 1.5e16, -0.0],
+    "excerpt": "Art. VIII §4 — « inspection »",
+    "nested": {"tags": ["a", "b"], "empty": {}},
+}
+
+
+def _stdlib_render(context) -> str:
+    return json.dumps(context, indent=2, ensure_ascii=False, default=str)
+
+
+class TestFormatContext:
+    """_format_context() with and without the optional orjson."""
+
+    def test_orjson_output_matches_stdlib(self):
+        pytest.importorskip("orjson")
+        assert base._format_context(_CONTEXT) == _stdlib_render(_CONTEXT)
+
+    def test_stdlib_used_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(base, "orjson", None)
+        rendered = base._format_context(_CONTEXT)
+
+        assert rendered == _stdlib_render(_CONTEXT)
+        assert "§4 — « inspection »" in rendered
+
+    def test_small_floats_differ_only_in_exponent_format(self):
+        pytest.importorskip("orjson")
+        context = {"spread": 2.5e-7}
+
+        rendered = base._format_context(context)
+
+        assert rendered != _stdlib_render(context)
+        assert json.loads(rendered) == context
+
+    def test_non_str_keys_fall_back_to_stdlib(self):
+        context = {1: "first", "k": "v"}
+        assert base._format_context(context) == _stdlib_render(context)
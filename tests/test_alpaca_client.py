@@ -0,0 +1,92 @@
+"""
+Tests for the Alpaca brokerage client.
+
+Validates:
+- Order requests and responses round-trip with orjson and with stdlib json
+- Concurrent order submission reports each order's outcome in order
+"""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from nova_syntheia.integrations import alpaca_client
+from nova_syntheia.integrations.alpaca_client import AlpacaClient, OrderSide
+
+ORDER_REPLY = {
+    "id": "ord-1",
+    "symbol": "VTI",
+    "qty": None,
+    "side": "buy",
+    "type": "market",
+    "status": "accepted",
+    "filled_qty": "0",
+    "filled_avg_price": None,
+    "submitted_at": "2026-10-01T14:30:00Z",
+    "filled_at": None,
+}
+
+
+@pytest.fixture
+def sent() -> list[bytes]:
+    return []
+
+
+@pytest.fixture
+async def client(sent):
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.content)
+        body = json.loads(request.content)
+        if body["symbol"] == "FAIL":
+            return httpx.Response(422, json={"message": "insufficient buying power"})
+        return httpx.Response(200, json={**ORDER_REPLY, "symbol": body["symbol"]})
+
+    alpaca = AlpacaClient("key", "secret", base_url="https://alpaca.test")
+    alpaca._client = httpx.AsyncClient(
+        base_url=alpaca.base_url, transport=httpx.MockTransport(handler)
+    )
+    yield alpaca
+    await alpaca.close()
+
+
+class TestOrderSerialization:
+    """JSON encoding and decoding with either backend."""
+
+    def test_dumps_is_compact_and_backend_independent(self, json_backend):
+        payload = {"symbol": "VTI", "side": "buy", "notional": "12.5"}
+        assert alpaca_client._dumps(payload) == b'{"symbol":"VTI","side":"buy","notional":"12.5"}'
+
+    def test_loads_parses_response_body(self, json_backend):
+        resp = httpx.Response(200, content=b'{"cash": "50.00", "tags": [1, 2.5, null]}')
+        assert alpaca_client._loads(resp) == {"cash": "50.00", "tags": [1, 2.5, None]}
+
+    async def test_submit_order_round_trip(self, json_backend, client, sent):
+        order = await client.submit_order("VTI", notional=12.499, side=OrderSide.BUY)
+
+        assert json.loads(sent[0]) == {
+            "symbol": "VTI",
+            "side": "buy",
+            "type": "market",
+            "time_in_force": "day",
+            "notional": "12.5",
+        }
+        assert order.id == "ord-1"
+        assert order.qty == 0.0
+        assert order.filled_avg_price is None
+
+
+class TestSubmitOrders:
+    """Concurrent order submission."""
+
+    async def test_outcomes_follow_input_order(self, client):
+        results = await client.submit_orders([
+            {"symbol": "VTI", "notional": 10},
+            {"symbol": "FAIL", "notional": 10},
+            {"symbol": "BND", "qty": 1, "side": OrderSide.SELL},
+        ])
+
+        assert [getattr(r, "symbol", None) for r in results] == ["VTI", None, "BND"]
+        assert isinstance(results[1], httpx.HTTPStatusError)
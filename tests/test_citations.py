@@ -0,0 +1,195 @@
+"""
+Tests for the Constitutional Citation Pipeline — Amendment IV.
+
+Validates:
+- Concurrent LLM citation requests are batched
+- Batching falls back to rule-based citations on failure
+- Rule-based citations are memoized in a bounded LRU
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from nova_syntheia.constitution.parser import save_provisions
+from nova_syntheia.constitution.schema import Citation, ConstitutionalProvision
+from nova_syntheia.governance import citations as citations_module
+from nova_syntheia.governance.citations import CitationBatcher, CitationService
+from nova_syntheia.integrations import llm_router
+
+PROVISIONS = [
+    ConstitutionalProvision(
+        id="article_II_section_2",
+        article="II",
+        section=2,
+        title="Bounded Autonomy",
+        text="Artificial members act independently within clearly defined permission tiers.",
+    ),
+    ConstitutionalProvision(
+        id="article_VI_section_6",
+        article="VI",
+        section=6,
+        title="Portfolio Operations",
+        text="The Portfolio Executive trades within Federal Reserve directives.",
+    ),
+]
+
+
+@pytest.fixture
+def service() -> CitationService:
+    return CitationService(provisions=PROVISIONS)
+
+
+def _llm_reply(payload: dict) -> SimpleNamespace:
+    message = SimpleNamespace(content=json.dumps(payload))
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class TestCitationBatcher:
+    """CitationBatcher coalescing and fallbacks."""
+
+    async def test_concurrent_requests_share_one_batch(self, service, monkeypatch):
+        batches: list[int] = []
+
+        async def complete_batch(self, model, requests):
+            batches.append(len(requests))
+            return [
+                [Citation(article="II", section=2, text_excerpt="x", relevance=r.action_type)]
+                for r in requests
+            ]
+
+        monkeypatch.setattr(CitationBatcher, "_complete_batch", complete_batch)
+        batcher = CitationBatcher(service, max_wait_ms=20)
+
+        results = await asyncio.gather(
+            *(batcher.submit("permission tiers", f"type_{i}", "m") for i in range(3))
+        )
+        await batcher.close()
+
+        assert batches == [3]
+        assert [r[0].relevance for r in results] == ["type_0", "type_1", "type_2"]
+
+    async def test_lone_request_uses_single_prompt(self, service, monkeypatch):
+        calls: list[str] = []
+
+        async def single(action_description, action_type, model):
+            calls.append(action_type)
+            return []
+
+        monkeypatch.setattr(service, "generate_citations_with_llm", single)
+        batcher = CitationBatcher(service, max_wait_ms=1)
+
+        assert await batcher.submit("permission tiers", "routine_operation", "m") == []
+        await batcher.close()
+        assert calls == ["routine_operation"]
+
+    async def test_batch_failure_falls_back_to_rule_based(self, service, monkeypatch):
+        async def broken(self, model, requests):
+            raise RuntimeError("provider unavailable")
+
+        monkeypatch.setattr(CitationBatcher, "_complete_batch", broken)
+        batcher = CitationBatcher(service, max_wait_ms=20)
+
+        results = await asyncio.gather(
+            batcher.submit("act within permission tiers", "routine_operation", "m"),
+            batcher.submit("portfolio directives trades", "portfolio_trade", "m"),
+        )
+        await batcher.close()
+
+        assert results[0] == service.generate_citations(
+            "act within permission tiers", "routine_operation"
+        )
+        assert results[1] == service.generate_citations(
+            "portfolio directives trades", "portfolio_trade"
+        )
+        assert all(results)
+
+    async def test_omitted_action_falls_back_to_rule_based(self, service, monkeypatch):
+        async def acompletion(**kwargs):
+            # The model answered for the first action only
+            return _llm_reply({
+                "results": [{
+                    "index": 1,
+                    "citations": [{
+                        "article": "II",
+                        "section": 2,
+                        "text_excerpt": "act independently",
+                        "relevance": "llm",
+                    }],
+                }]
+            })
+
+        monkeypatch.setattr(llm_router, "acompletion", acompletion)
+        batcher = CitationBatcher(service, max_wait_ms=20)
+
+        first, second = await asyncio.gather(
+            batcher.submit("act within permission tiers", "routine_operation", "m"),
+            batcher.submit("portfolio directives trades", "portfolio_trade", "m"),
+        )
+        await batcher.close()
+
+        assert [c.relevance for c in first] == ["llm"]
+        assert second == service.generate_citations(
+            "portfolio directives trades", "portfolio_trade"
+        )
+
+    async def test_service_reuses_one_batcher(self, service, monkeypatch):
+        async def single(action_description, action_type, model):
+            return []
+
+        monkeypatch.setattr(service, "generate_citations_with_llm", single)
+        await service.generate_citations_batched("permission tiers", "routine_operation")
+        batcher = service._batcher
+        await service.generate_citations_batched("permission tiers", "routine_operation")
+
+        assert service._batcher is batcher
+        await batcher.close()
+
+
+class TestRuleCitationCache:
+    """Memoized rule-based citations."""
+
+    def test_repeat_request_skips_provision_search(self, service, monkeypatch):
+        searches: list[str] = []
+        search = service.search_relevant_provisions
+
+        def counting_search(description, n_results=5):
+            searches.append(description)
+            return search(description, n_results)
+
+        monkeypatch.setattr(service, "search_relevant_provisions", counting_search)
+        first = service.generate_citations("act within permission tiers", "routine_operation")
+        second = service.generate_citations("act within permission tiers", "routine_operation")
+
+        assert searches == ["act within permission tiers"]
+        assert second == first
+        assert second is not first  # callers get their own list
+
+    def test_least_recently_used_entry_is_evicted(self, service, monkeypatch):
+        monkeypatch.setattr(citations_module, "RULE_CITATION_CACHE_SIZE", 2)
+
+        service.generate_citations("permission tiers one", "a")
+        service.generate_citations("permission tiers two", "b")
+        service.generate_citations("permission tiers one", "a")  # refresh "a"
+        service.generate_citations("permission tiers three", "c")
+
+        assert list(service._rule_citation_cache) == [
+            ("a", "permission tiers one"),
+            ("c", "permission tiers three"),
+        ]
+
+    def test_empty_results_are_not_cached(self, service):
+        assert service.generate_citations("zzzz qqqq", "routine_operation") == []
+        assert not service._rule_citation_cache
+
+    def test_reloading_provisions_clears_cache(self, service, tmp_path):
+        service.generate_citations("act within permission tiers", "routine_operation")
+        path = save_provisions(PROVISIONS, tmp_path / "provisions.json")
+
+        service._load_provisions(path)
+
+        assert not service._rule_citation_cache
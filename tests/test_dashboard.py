@@ -0,0 +1,68 @@
+"""
+Tests for the dashboard's JSON API responses.
+
+Validates:
+- JSON bodies are byte-identical with orjson and with the stdlib renderer
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from nova_syntheia.dashboard import app as dashboard
+
+PAYLOAD = {
+    "status": "voted",
+    "text": "Art. VIII §4 — inspection",
+    "counts": [0, 1.5, -3],
+    "nested": {"ok": True, "none": None},
+}
+
+
+class _StubLedger:
+    def get_latest_entries(self, limit):
+        return [
+            SimpleNamespace(
+                id=UUID(int=n),
+                sequence_number=n,
+                entry_type="executive_action",
+                author_role="operations_executive",
+                entry_hash="ab" * 32,
+                timestamp=datetime(2026, 10, 1, tzinfo=timezone.utc),
+            )
+            for n in range(limit)
+        ]
+
+    def get_entry_count(self):
+        return 42
+
+
+class TestJSONResponses:
+    """_JSONResponse rendering with either backend."""
+
+    def test_body_matches_starlette(self, json_backend):
+        assert dashboard._JSONResponse(PAYLOAD).body == JSONResponse(PAYLOAD).body
+
+    def test_ledger_endpoint(self, json_backend, monkeypatch):
+        monkeypatch.setattr(dashboard.state, "ledger_service", _StubLedger())
+
+        resp = TestClient(dashboard.app).get("/api/ledger", params={"limit": 2})
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
+        body = resp.json()
+        assert body["total"] == 42
+        assert [e["sequence_number"] for e in body["entries"]] == [0, 1]
+        assert body["entries"][0]["timestamp"] == "2026-10-01T00:00:00+00:00"
+
+    def test_ledger_endpoint_without_ledger(self, json_backend, monkeypatch):
+        monkeypatch.setattr(dashboard.state, "ledger_service", None)
+
+        resp = TestClient(dashboard.app).get("/api/ledger")
+
+        assert resp.json() == {"entries": [], "message": "Ledger service not initialized"}
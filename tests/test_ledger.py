@@ -6,15 +6,22 @@ Validates:
 - SHA-256 hash chain integrity
 - Chain verification
 - Tamper detection
+- Streamed verification across chunk boundaries
 """
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 
 from nova_syntheia.constitution.schema import LedgerEntry, LedgerEntryType
+from nova_syntheia.ledger import service as service_module
+from nova_syntheia.ledger.models import LedgerEntryDB
+from nova_syntheia.ledger.service import LedgerAppendBatcher, LedgerService, _stored_utc
 
 
 class TestLedgerEntryHash:
@@ -120,3 +127,119 @@ class TestLedgerEntryHash:
         tampered_hash = tampered.compute_hash()
 
         assert original_hash != tampered_hash, "Tampered entry should produce different hash"
+
+
+def _fields(n: int) -> dict:
+    return {
+        "entry_type": LedgerEntryType.EXECUTIVE_ACTION.value,
+        "author_role": "operations_executive",
+        "author_member_id": uuid4(),
+        "content": {"n": n},
+    }
+
+
+class TestLedgerServiceWriters:
+    """Concurrent writers must extend one gap-free, verifiable chain."""
+
+    def test_concurrent_threads_share_one_chain(self, ledger_service, assert_chain_intact):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            blocks = [[_fields(i), _fields(i + 100)] for i in range(24)]
+            list(pool.map(ledger_service.append_many, blocks))
+        assert_chain_intact(ledger_service, 1 + 48)
+
+    def test_append_retries_when_tip_moves(self, ledger_service, monkeypatch):
+        real_block = LedgerService._append_block
+        calls = []
+
+        def flaky_block(self, entries):
+            calls.append(len(entries))
+            if len(calls) == 1:
+                raise IntegrityError("INSERT", {}, Exception("duplicate sequence_number"))
+            return real_block(self, entries)
+
+        monkeypatch.setattr(LedgerService, "_append_block", flaky_block)
+        entry = ledger_service.append(**_fields(1))
+        assert entry.sequence_number == 1
+        assert calls == [1, 1]
+
+    async def test_batchers_on_one_service_do_not_fork_chain(
+        self, ledger_service, assert_chain_intact
+    ):
+        shared = ledger_service.shared_batcher()
+        windowed = LedgerAppendBatcher(ledger_service, window_seconds=0.01)
+        entries = await asyncio.gather(
+            *(shared.append(**_fields(i)) for i in range(20)),
+            *(windowed.append(**_fields(i)) for i in range(20)),
+        )
+        await windowed.close()
+        assert len({e.sequence_number for e in entries}) == 40
+        assert_chain_intact(ledger_service, 41)
+
+    async def test_batcher_isolates_a_bad_entry(self, ledger_service, assert_chain_intact):
+        batcher = ledger_service.shared_batcher()
+        bad = _fields(0)
+        del bad["entry_type"]
+        results = await asyncio.gather(
+            batcher.append(**_fields(1)),
+            batcher.append(**bad),
+            batcher.append(**_fields(2)),
+            return_exceptions=True,
+        )
+        assert isinstance(results[1], Exception)
+        assert [r.content["n"] for r in (results[0], results[2])] == [1, 2]
+        await batcher.flush()
+        assert_chain_intact(ledger_service, 3)
+
+
+def _tamper(service: LedgerService, sequence_number: int, rehash: bool = False, **values) -> None:
+    """Overwrite stored columns of one entry, optionally re-sealing its hash."""
+    with service.SessionLocal() as session:
+        row = session.query(LedgerEntryDB).filter_by(sequence_number=sequence_number).one()
+        for name, value in values.items():
+            setattr(row, name, value)
+        if rehash:
+            row.entry_hash = service._compute_hash(
+                entry_id=row.id,
+                sequence_number=row.sequence_number,
+                previous_hash=row.previous_hash,
+                timestamp=_stored_utc(row.timestamp),
+                entry_type=row.entry_type,
+                author_role=row.author_role,
+                author_member_id=row.author_member_id,
+                content=row.content,
+                supersedes=row.supersedes,
+                emergency_designation=row.emergency_designation,
+            )
+        session.commit()
+
+
+class TestVerifyChain:
+    """verify_chain streams rows in chunks without losing chain state."""
+
+    @pytest.fixture
+    def chunked_ledger(self, ledger_service, monkeypatch):
+        monkeypatch.setattr(service_module, "VERIFY_CHAIN_CHUNK_SIZE", 3)
+        ledger_service.append_many([_fields(n) for n in range(1, 11)])
+        return ledger_service
+
+    def test_chain_spanning_chunks_verifies(self, chunked_ledger, assert_chain_intact):
+        assert_chain_intact(chunked_ledger, 11)
+
+    def test_content_tamper_in_later_chunk(self, chunked_ledger):
+        _tamper(chunked_ledger, 7, content={"n": 999})
+
+        is_valid, verified, message = chunked_ledger.verify_chain()
+
+        assert not is_valid
+        assert verified == 7
+        assert message.startswith("Hash mismatch at sequence 7")
+
+    def test_resealed_entry_breaks_linkage(self, chunked_ledger):
+        # A forger who recomputes the tampered entry's own hash still breaks the chain
+        _tamper(chunked_ledger, 4, rehash=True, previous_hash="f" * 64)
+
+        is_valid, verified, message = chunked_ledger.verify_chain()
+
+        assert not is_valid
+        assert verified == 4
+        assert message.startswith("Chain break at sequence 4")
@@ -0,0 +1,269 @@
+"""
+Tests for the Federal Reserve agent — Art. IX.
+
+Validates:
+- Indicators and directives are built to the constitutional schema
+- Directives must state their stance and report when they expire
+- Directives bind the Portfolio Executive once issued
+- Issued directives are linked to the ledger entry that recorded them
+- Dual-mandate bias follows the return and drawdown thresholds
+- Directive expiry follows the expiry heap
+- Identical analysis prompts are served from a bounded LRU
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from nova_syntheia.agents.executive.portfolio import PortfolioExecutiveAgent
+from nova_syntheia.agents.federal_reserve import monetary_policy
+from nova_syntheia.agents.federal_reserve.monetary_policy import MonetaryPolicyAgent
+from nova_syntheia.constitution.schema import (
+    ActionType,
+    DirectiveType,
+    MacroeconomicIndicator,
+    MonetaryPolicyDirective,
+)
+
+MODEL = "test-model"
+
+CPI = {
+    "name": "CPI YoY",
+    "value": 3.1,
+    "source": "BLS",
+    "as_of": datetime(2026, 9, 1, tzinfo=timezone.utc),
+    "interpretation": "Inflation above target",
+}
+
+
+@pytest.fixture
+def fed(monkeypatch) -> MonetaryPolicyAgent:
+    agent = MonetaryPolicyAgent(uuid4(), MODEL)
+    prompts: list[str] = []
+
+    async def fake_reason(prompt, context=None):
+        prompts.append(prompt)
+        return f"analysis #{len(prompts)}"
+
+    monkeypatch.setattr(agent, "reason", fake_reason)
+    agent.prompts = prompts
+    return agent
+
+
+def _directive_inputs(**overrides):
+    inputs = {
+        "reasoning": "Inflation above target; preserve capital.",
+        "stance": "tightening",
+        "portfolio_constraints": [
+            {
+                "type": "max_allocation",
+                "target": "VTI",
+                "value": 30,
+                "unit": "dollars",
+                "rationale": "Cap single-fund exposure",
+            }
+        ],
+    }
+    inputs.update(overrides)
+    return inputs
+
+
+class TestIndicators:
+    """Indicator recording through indicator monitoring."""
+
+    async def test_monitoring_records_schema_indicators(self, fed):
+        result = await fed._handle_monitor_indicators({"indicators": [CPI]})
+
+        [indicator] = fed._current_indicators
+        assert isinstance(indicator, MacroeconomicIndicator)
+        assert indicator.as_of == CPI["as_of"]
+        assert indicator.interpretation == "Inflation above target"
+        assert result["indicators_count"] == 1
+        assert "CPI YoY: 3.1 (BLS, as of 2026-09-01)" in fed.prompts[0]
+
+    async def test_missing_as_of_defaults_to_now(self, fed):
+        [indicator] = fed._record_indicators([{"name": "Fed Funds Rate", "value": 4.5}])
+        assert indicator.as_of.tzinfo is not None
+
+
+class TestDirectives:
+    """Directive construction through the action handlers."""
+
+    async def test_issue_directive_matches_schema(self, fed):
+        await fed._handle_monitor_indicators({"indicators": [CPI]})
+        result = await fed.execute_action(
+            ActionType.ISSUE_MONETARY_DIRECTIVE, "issue", "test", _directive_inputs()
+        )
+
+        [directive] = fed.get_active_directives()
+        assert isinstance(directive, MonetaryPolicyDirective)
+        assert result["status"] == "executed"
+        assert directive.directive_number == 1
+        assert directive.directive_type is DirectiveType.REGULAR
+        assert directive.stance == "tightening"
+        assert directive.issued_by == fed.member_id
+        assert [i.name for i in directive.indicators_assessed] == ["CPI YoY"]
+        [constraint] = directive.constraints
+        assert constraint.value == Decimal("30")
+        assert constraint.rationale == "Cap single-fund exposure"
+
+    async def test_issued_directive_is_linked_to_its_ledger_entry(self, ledger_service):
+        fed = MonetaryPolicyAgent(uuid4(), MODEL, ledger_service=ledger_service)
+        result = await fed.execute_action(
+            ActionType.ISSUE_MONETARY_DIRECTIVE, "issue", "test", _directive_inputs()
+        )
+
+        assert fed.get_active_directives()[0].ledger_entry_id is None  # not yet committed
+        await fed.flush_ledger()
+
+        [directive] = fed.get_active_directives()
+        assert result["ledger_status"] == "queued"
+        assert str(directive.ledger_entry_id) == result["ledger_entry_id"]
+        assert fed._directive_history[-1] is directive
+
+    async def test_issued_directive_binds_portfolio_executive(self, fed):
+        await fed._handle_issue_directive(_directive_inputs())
+        [directive] = fed.get_active_directives()
+
+        portfolio = PortfolioExecutiveAgent(uuid4(), MODEL)
+        portfolio.set_active_directive(directive)
+
+        assert portfolio._check_directive_compliance({"symbol": "VTI", "notional": 50})[
+            "compliant"
+        ] is False
+        assert portfolio._check_directive_compliance({"symbol": "VTI", "notional": 20})[
+            "compliant"
+        ] is True
+
+    async def test_set_constraints_numbers_directives(self, fed):
+        await fed._handle_issue_directive(_directive_inputs())
+        result = await fed._handle_set_constraints({
+            "stance": "loosening",
+            "constraints": [{"type": "min_cash", "target": "cash", "value": "5.00"}],
+        })
+
+        assert result["constraints"] == [
+            {"type": "min_cash", "target": "cash", "value": "5.00", "unit": "percent"}
+        ]
+        assert [d.directive_number for d in fed.get_active_directives()] == [1, 2]
+
+    @pytest.mark.parametrize("stance", [None, "neutral"])
+    async def test_stance_is_required(self, fed, stance):
+        issued = await fed._handle_issue_directive(_directive_inputs(stance=stance, reasoning=""))
+        constrained = await fed._handle_set_constraints({"stance": stance, "constraints": []})
+
+        assert issued["status"] == constrained["status"] == "rejected"
+        assert repr(stance) in issued["message"]
+        assert fed.get_active_directives() == []
+        assert fed.prompts == []  # rejected before any reasoning is generated
+
+    async def test_expiry_is_reported_for_the_ledger(self, fed):
+        result = await fed._handle_issue_directive(_directive_inputs(duration_hours=2))
+        [directive] = fed.get_active_directives()
+
+        expires_at = datetime.fromisoformat(result["expires_at"])
+        assert expires_at == directive.effective_date + timedelta(hours=2)
+
+    async def test_missing_reasoning_is_generated(self, fed):
+        await fed._handle_issue_directive(_directive_inputs(reasoning=""))
+        [directive] = fed.get_active_directives()
+        assert directive.macroeconomic_justification == "analysis #1"
+
+
+class TestDualMandate:
+    """Dual-mandate bias and urgency (Art. IX §3)."""
+
+    @pytest.mark.parametrize(
+        ("return_pct", "drawdown_pct", "bias", "urgency"),
+        [
+            (-6, 20, "stability", "high"),
+            (11, 20, "growth", "low"),
+            (0, 11, "stability", "medium"),
+            (10, 10, "balanced", "normal"),
+            (-5, 0, "balanced", "normal"),
+        ],
+    )
+    async def test_thresholds(self, fed, return_pct, drawdown_pct, bias, urgency):
+        result = await fed._handle_dual_mandate_analysis(
+            {"return_pct": return_pct, "max_drawdown_pct": drawdown_pct}
+        )
+
+        assert (result["mandate_bias"], result["urgency"]) == (bias, urgency)
+
+
+class TestDirectiveExpiry:
+    """Expiry pruning through the min-heap."""
+
+    async def test_expired_directives_are_pruned_soonest_first(self, fed):
+        for hours in (48, 0, 1, 0):
+            await fed._handle_issue_directive(_directive_inputs(duration_hours=hours))
+
+        active = fed.get_active_directives()
+
+        assert sorted(d.directive_number for d in active) == [1, 3]
+        # The heap root is now the soonest live expiry (the 1-hour directive)
+        _, root_id = fed._active_heap[0]
+        assert fed._active_directives[root_id].directive_number == 3
+        assert set(fed._directive_excerpts) == {d.id for d in active}
+
+    async def test_directives_expire_in_expiry_order(self, fed, monkeypatch):
+        t0 = datetime(2026, 10, 1, tzinfo=timezone.utc)
+        clock = [t0]
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return clock[0]
+
+        monkeypatch.setattr(monetary_policy, "datetime", FrozenDatetime)
+        for hours in (3, 1, 2):
+            await fed._handle_issue_directive(_directive_inputs(duration_hours=hours))
+
+        remaining = []
+        for elapsed in (0.5, 1.5, 2.5, 3.5):
+            clock[0] = t0 + timedelta(hours=elapsed)
+            remaining.append(sorted(d.directive_number for d in fed.get_active_directives()))
+
+        assert remaining == [[1, 2, 3], [1, 3], [1], []]
+        assert fed._active_heap == []
+        assert not fed._directive_excerpts
+
+
+class TestReasonCache:
+    """The prompt-keyed LRU in front of reason()."""
+
+    async def test_identical_prompt_reuses_analysis(self, fed):
+        first = await fed._reason_cached("outlook?")
+        second = await fed._reason_cached("outlook?")
+
+        assert first == second == "analysis #1"
+        assert fed.prompts == ["outlook?"]
+
+    async def test_least_recently_used_prompt_is_evicted(self, fed):
+        fed.set_reason_cache_size(2)
+
+        await fed._reason_cached("a")
+        await fed._reason_cached("b")
+        await fed._reason_cached("a")  # refresh "a"
+        await fed._reason_cached("c")  # evicts "b"
+        await fed._reason_cached("a")
+        await fed._reason_cached("b")
+
+        assert fed.prompts == ["a", "b", "c", "b"]
+
+    async def test_shrinking_and_disabling_the_cache(self, fed):
+        for prompt in ("a", "b", "c"):
+            await fed._reason_cached(prompt)
+
+        fed.set_reason_cache_size(1)
+        assert len(fed._reason_cache) == 1
+
+        fed.set_reason_cache_size(0)
+        await fed._reason_cached("c")
+        await fed._reason_cached("c")
+        assert fed.prompts == ["a", "b", "c", "c", "c"]
+        assert not fed._reason_cache
@@ -0,0 +1,99 @@
+"""
+Tests for the constitution parser's provisions cache.
+
+Validates:
+- parse_constitution_cached reuses a cache built from identical markdown
+- Edited markdown or an unusable cache triggers a fresh parse
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from nova_syntheia.constitution import parser
+from nova_syntheia.constitution.parser import (
+    load_provisions,
+    parse_constitution,
+    parse_constitution_cached,
+    save_provisions,
+)
+
+CONSTITUTION = """PREAMBLE
+We the members establish this polity.
+
+ARTICLE I — The Legislative Assembly
+Section 1 — Composition
+The Assembly consists of all admitted members.
+Section 2 — Sessions
+The Assembly meets in Deliberative Cycles.
+"""
+
+
+@pytest.fixture
+def paths(tmp_path):
+    markdown = tmp_path / "constitution.md"
+    markdown.write_text(CONSTITUTION, encoding="utf-8")
+    return markdown, tmp_path / "cache" / "provisions.json"
+
+
+@pytest.fixture
+def parse_calls(monkeypatch) -> list[str]:
+    calls: list[str] = []
+
+    def counting_parse(markdown_path):
+        calls.append(str(markdown_path))
+        return parse_constitution(markdown_path)
+
+    monkeypatch.setattr(parser, "parse_constitution", counting_parse)
+    return calls
+
+
+class TestParseConstitutionCached:
+    """The SHA-256 keyed provisions cache."""
+
+    def test_unchanged_markdown_is_served_from_cache(self, paths, parse_calls):
+        markdown, cache = paths
+
+        first = parse_constitution_cached(markdown, cache)
+        second = parse_constitution_cached(markdown, cache)
+
+        assert len(parse_calls) == 1
+        assert second == first
+        assert [p.id for p in first] == [
+            "preamble", "article_I", "article_I_section_1", "article_I_section_2",
+        ]
+
+    def test_edited_markdown_is_reparsed(self, paths, parse_calls):
+        markdown, cache = paths
+        parse_constitution_cached(markdown, cache)
+
+        markdown.write_text(CONSTITUTION + "Section 3 — Quorum\nA majority.\n", encoding="utf-8")
+        provisions = parse_constitution_cached(markdown, cache)
+
+        assert len(parse_calls) == 2
+        assert provisions[-1].id == "article_I_section_3"
+        # The rewritten cache now matches the edited markdown
+        parse_constitution_cached(markdown, cache)
+        assert len(parse_calls) == 2
+
+    @pytest.mark.parametrize("contents", [b"{not json", b'{"provisions": []}', b"[]"])
+    def test_unusable_cache_is_rebuilt(self, paths, parse_calls, contents):
+        markdown, cache = paths
+        cache.parent.mkdir()
+        cache.write_bytes(contents)
+
+        provisions = parse_constitution_cached(markdown, cache)
+
+        assert len(parse_calls) == 1
+        assert json.loads(cache.read_bytes())["__source_sha256__"]
+        assert load_provisions(cache) == provisions
+
+    def test_plain_provisions_file_still_loads(self, paths):
+        markdown, cache = paths
+        provisions = parse_constitution(markdown)
+
+        save_provisions(provisions, cache)
+
+        assert load_provisions(cache) == provisions
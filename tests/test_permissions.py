@@ -9,9 +9,12 @@ Validates:
 
 from __future__ import annotations
 
+from decimal import Decimal
+
 import pytest
 
 from nova_syntheia.governance.permissions import (
+    PERMISSION_CACHE_TTL_SECONDS,
     PermissionDecision,
     PermissionEngine,
     permission_engine,
@@ -76,6 +79,49 @@ class TestPermissionEngine:
         )
         assert result.decision == PermissionDecision.AUTHORIZED
 
+    def test_repeated_check_is_memoized(self):
+        """Dollar-free checks for the same (tier, action) reuse one decision."""
+        first = self.engine.check_permission("tier_2", ActionType.ROUTINE_OPERATION)
+        second = self.engine.check_permission("tier_2", ActionType.ROUTINE_OPERATION)
+        assert first is second
+        assert first.decision == PermissionDecision.AUTHORIZED
+
+    def test_update_tier_invalidates_cache(self):
+        """A standing-order tier change must take effect immediately."""
+        before = self.engine.check_permission("tier_2", ActionType.ROUTINE_OPERATION)
+        assert before.decision == PermissionDecision.AUTHORIZED
+
+        tier = self.engine.get_tier("tier_2").model_copy(
+            update={"forbidden_actions": [ActionType.ROUTINE_OPERATION]}
+        )
+        self.engine.update_tier("tier_2", tier)
+
+        after = self.engine.check_permission("tier_2", ActionType.ROUTINE_OPERATION)
+        assert after.decision == PermissionDecision.FORBIDDEN
+
+    def test_cached_decision_expires_after_ttl(self, monkeypatch):
+        """Cached decisions are re-evaluated once the TTL has passed."""
+        now = [1000.0]
+        monkeypatch.setattr("nova_syntheia.governance.permissions.time.monotonic", lambda: now[0])
+        first = self.engine.check_permission("tier_2", ActionType.ROUTINE_OPERATION)
+
+        now[0] += PERMISSION_CACHE_TTL_SECONDS - 1
+        assert self.engine.check_permission("tier_2", ActionType.ROUTINE_OPERATION) is first
+
+        now[0] += 1
+        assert self.engine.check_permission("tier_2", ActionType.ROUTINE_OPERATION) is not first
+
+    def test_dollar_amount_bypasses_cache(self):
+        """Threshold checks are evaluated live for every amount."""
+        small = self.engine.check_permission(
+            "tier_2", ActionType.ROUTINE_OPERATION, dollar_amount=Decimal("10")
+        )
+        large = self.engine.check_permission(
+            "tier_2", ActionType.ROUTINE_OPERATION, dollar_amount=Decimal("100")
+        )
+        assert small.decision == PermissionDecision.AUTHORIZED
+        assert large.decision == PermissionDecision.EXCEEDS_IRREVERSIBLE_THRESHOLD
+
     def test_global_permission_engine_exists(self):
         """The global permission_engine should be initialized."""
         assert permission_engine is not None
@@ -97,6 +143,10 @@ class TestPermissionTiers:
         # tier_0 (Custodial) should have fewer autonomous actions than tier_4 (Monetary)
         assert len(tier_0.autonomous_actions) <= len(tier_4.autonomous_actions)
 
+    def test_tiers_are_hashable(self):
+        tier = FOUNDING_PERMISSION_TIERS["tier_0"]
+        assert hash(tier) == hash(tier.model_copy())
+
     def test_founder_tier_level_highest(self):
         """Founder tier should have the highest level."""
         founder = FOUNDING_PERMISSION_TIERS["tier_founder"]
@@ -0,0 +1,134 @@
+"""
+Tests for the Policy Evaluation Agent's precedent system — Art. III §3.
+
+Validates:
+- Precedent search through the inverted word index
+- Search memoization and its invalidation when precedent grows
+"""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from nova_syntheia.agents.judicial import policy_evaluation
+from nova_syntheia.agents.judicial.policy_evaluation import (
+    PolicyEvaluationAgent,
+    _semantic_overlap,
+)
+
+MODEL = "test-model"
+
+QUESTIONS = [
+    ["May the portfolio executive trade leveraged funds"],
+    ["Does emergency power suspend member voting rights", "Is the ledger custodian bound"],
+    ["Can leveraged funds be held by the portfolio"],
+    ["Who appoints the ledger custodian"],
+]
+
+
+@pytest.fixture
+def court(monkeypatch) -> PolicyEvaluationAgent:
+    agent = PolicyEvaluationAgent(uuid4(), MODEL)
+
+    async def fake_reason(prompt, context=None):
+        return "HOLDING: advisory."
+
+    monkeypatch.setattr(agent, "reason", fake_reason)
+    return agent
+
+
+async def _issue(court: PolicyEvaluationAgent, questions: list[str]) -> dict:
+    return await court._handle_opinion({"constitutional_questions": questions})
+
+
+def _scan(court: PolicyEvaluationAgent, questions: list[str]) -> list[str]:
+    """The pre-index linear search, as case numbers."""
+    return [
+        o.case_number
+        for o in court.opinions
+        if any(
+            _semantic_overlap(q, prior)
+            for q in questions
+            for prior in o.constitutional_questions
+        )
+    ]
+
+
+class TestPrecedentIndex:
+    """Inverted-index precedent search."""
+
+    async def test_search_matches_linear_scan(self, court):
+        for questions in QUESTIONS:
+            await _issue(court, questions)
+
+        for query in (
+            ["Are leveraged funds allowed in the portfolio"],
+            ["Is the ledger custodian appointed or bound"],
+            ["voting rights during emergency power"],
+            ["Unrelated question about weather"],
+        ):
+            found = [p.case_number for p in court._search_precedent(query)]
+            assert found == _scan(court, query)
+
+    async def test_opinion_is_cited_once_in_issuance_order(self, court):
+        for questions in QUESTIONS:
+            await _issue(court, questions)
+
+        refs = court._search_precedent(
+            ["ledger custodian bound by leveraged portfolio funds rules"]
+        )
+
+        assert [p.case_number for p in refs] == [o.case_number for o in court.opinions]
+        assert all(p.relationship == "considered" for p in refs)
+
+    async def test_single_shared_word_is_not_precedent(self, court):
+        await _issue(court, ["May the portfolio executive trade leveraged funds"])
+        assert court._search_precedent(["portfolio allocation"]) == []
+
+    async def test_issued_opinion_records_prior_precedent(self, court):
+        await _issue(court, QUESTIONS[0])
+        result = await _issue(court, QUESTIONS[2])
+
+        assert result["precedents_considered"] == 1
+        assert court.opinions[1].precedents_considered[0].opinion_id == court.opinions[0].id
+
+
+class TestPrecedentCache:
+    """Memoized precedent searches."""
+
+    async def test_repeat_search_is_served_from_cache(self, court):
+        await _issue(court, QUESTIONS[0])
+        query = ["leveraged funds in the portfolio", "ledger custodian"]
+
+        first = court._search_precedent(query)
+        court._word_rows.clear()  # a cache miss would now find nothing
+        again = court._search_precedent(list(reversed(query)))
+
+        assert again == first
+        assert again is not first
+        assert len(first) == 1
+
+    async def test_new_opinion_invalidates_cache(self, court):
+        await _issue(court, QUESTIONS[0])
+        query = ["Who appoints or binds the ledger custodian"]
+        assert court._search_precedent(query) == []
+
+        await _issue(court, QUESTIONS[3])
+
+        assert not court._precedent_cache
+        assert [p.case_number for p in court._search_precedent(query)] == [
+            court.opinions[1].case_number
+        ]
+
+    async def test_cache_is_bounded(self, court, monkeypatch):
+        monkeypatch.setattr(policy_evaluation, "PRECEDENT_CACHE_SIZE", 2)
+        await _issue(court, QUESTIONS[0])
+
+        court._search_precedent(["a"])
+        court._search_precedent(["b"])
+        court._search_precedent(["a"])  # refresh "a"
+        court._search_precedent(["c"])
+
+        assert list(court._precedent_cache) == [("a",), ("c",)]
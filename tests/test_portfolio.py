@@ -0,0 +1,229 @@
+"""
+Tests for the Portfolio Executive Agent — Art. VI §6.
+
+Validates:
+- Directive constraints are compiled into trade checks when bound
+- Dollar caps apply to buys only and reject buys with no dollar amount
+- Dollar amounts convert to integer cents exactly
+- Rebalance legs are submitted concurrently, one result per leg
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from nova_syntheia.agents.executive.portfolio import PortfolioExecutiveAgent, _to_cents
+from nova_syntheia.constitution.schema import MonetaryPolicyDirective, PortfolioConstraint
+from nova_syntheia.integrations.alpaca_client import AlpacaClient
+
+MODEL = "test-model"
+
+
+def _constraint(constraint_type: str, target: str, value: str = "0", unit: str = "dollars"):
+    return PortfolioConstraint(
+        constraint_type=constraint_type,
+        target=target,
+        value=Decimal(value),
+        unit=unit,
+        rationale="test",
+    )
+
+
+def _directive(*constraints: PortfolioConstraint, number: int = 1) -> MonetaryPolicyDirective:
+    return MonetaryPolicyDirective(
+        directive_number=number,
+        macroeconomic_justification="test",
+        stance="tightening",
+        constraints=list(constraints),
+    )
+
+
+@pytest.fixture
+def portfolio() -> PortfolioExecutiveAgent:
+    return PortfolioExecutiveAgent(uuid4(), MODEL)
+
+
+class TestDirectiveCompliance:
+    """Compiled directive checks."""
+
+    def test_no_directive_is_compliant(self, portfolio):
+        assert portfolio._check_directive_compliance({"symbol": "VTI", "notional": 1e6}) == {
+            "compliant": True,
+            "reason": "No active directive",
+        }
+
+    async def test_dollar_cap_blocks_trade(self, portfolio):
+        portfolio.active_directive = _directive(
+            _constraint("max_allocation", "VTI", "20.00"), number=7
+        )
+
+        blocked = await portfolio._handle_trade({"symbol": "VTI", "notional": 20.01})
+        allowed = await portfolio._handle_trade({"symbol": "VTI", "notional": "20.00"})
+        other = await portfolio._handle_trade({"symbol": "BND", "notional": 45})
+
+        assert blocked["status"] == "blocked_by_directive"
+        assert blocked["directive_number"] == 7
+        assert blocked["message"] == "max_allocation: VTI capped at $20.00"
+        assert allowed["status"] == other["status"] == "simulated"
+
+    def test_dollar_cap_applies_only_to_buys(self, portfolio):
+        portfolio.set_active_directive(_directive(_constraint("max_allocation", "VTI", "20")))
+
+        sell = {"symbol": "VTI", "side": "sell", "notional": 500}
+        buy = {"symbol": "VTI", "side": "buy", "notional": 500}
+
+        assert portfolio._check_directive_compliance(sell)["compliant"]
+        assert not portfolio._check_directive_compliance(buy)["compliant"]
+
+    def test_qty_only_buy_is_rejected_under_dollar_cap(self, portfolio):
+        portfolio.set_active_directive(_directive(_constraint("max_allocation", "VTI", "20")))
+
+        buy = portfolio._check_directive_compliance({"symbol": "VTI", "qty": 3})
+        sell = portfolio._check_directive_compliance({"symbol": "VTI", "side": "sell", "qty": 3})
+        other = portfolio._check_directive_compliance({"symbol": "BND", "qty": 3})
+
+        assert buy == {
+            "compliant": False,
+            "reason": "max_allocation: VTI buys must be sized by notional",
+        }
+        assert sell["compliant"] and other["compliant"]
+
+    def test_forbidden_asset_class(self, portfolio):
+        portfolio.set_active_directive(_directive(_constraint("forbidden_asset_class", "crypto")))
+
+        result = portfolio._check_directive_compliance({"symbol": "BTC", "asset_class": "crypto"})
+
+        assert result == {
+            "compliant": False,
+            "reason": "forbidden_asset_class: crypto may not be traded",
+        }
+
+    def test_uncompiled_constraint_types_are_skipped(self, portfolio):
+        portfolio.set_active_directive(_directive(_constraint("duration_target", "bonds", "5")))
+
+        assert portfolio._compiled_checks == []
+        assert portfolio._check_directive_compliance({"symbol": "BND"})["compliant"]
+
+    def test_rebinding_recompiles(self, portfolio):
+        portfolio.set_active_directive(_directive(_constraint("max_allocation", "VTI", "10")))
+        portfolio.set_active_directive(_directive(_constraint("max_allocation", "BND", "10")))
+
+        assert portfolio._check_directive_compliance({"symbol": "VTI", "notional": 30})["compliant"]
+        assert not portfolio._check_directive_compliance({"symbol": "BND", "notional": 30})[
+            "compliant"
+        ]
+
+        portfolio.active_directive = None
+        assert portfolio._compiled_checks == []
+
+    def test_percent_cap_is_logged_not_enforced(self, portfolio, caplog):
+        with caplog.at_level(logging.WARNING):
+            portfolio.set_active_directive(
+                _directive(_constraint("max_allocation", "VTI", "40", unit="percent"))
+            )
+
+        assert portfolio._compiled_checks == []
+        assert "max_allocation on VTI is 40 percent" in caplog.text
+
+    def test_unknown_unit_is_rejected(self, portfolio):
+        bound = _directive(_constraint("max_allocation", "VTI", "10"))
+        portfolio.set_active_directive(bound)
+
+        with pytest.raises(ValueError, match="unsupported unit 'shares'"):
+            portfolio.set_active_directive(
+                _directive(_constraint("max_allocation", "VTI", "3", unit="shares"), number=2)
+            )
+
+        # The earlier directive and its checks stay in force
+        assert portfolio.active_directive is bound
+        assert not portfolio._check_directive_compliance({"symbol": "VTI", "notional": 11})[
+            "compliant"
+        ]
+
+
+class _FakeAlpaca:
+    """
+    Records submitted orders; every order waits until all legs are in flight.
+
+    Batches go through the real AlpacaClient.submit_orders.
+    """
+
+    def __init__(self, legs: int, failing: frozenset[str] = frozenset()) -> None:
+        self.submitted: list[tuple[str, str, float]] = []
+        self.failing = failing
+        self._all_in_flight = asyncio.Barrier(legs)
+
+    async def submit_order(self, symbol, qty, notional, side):
+        self.submitted.append((symbol, side.value, notional))
+        # Deadlocks (and times out) unless the legs are submitted concurrently
+        await asyncio.wait_for(self._all_in_flight.wait(), timeout=1)
+        if symbol in self.failing:
+            raise ConnectionError("order rejected")
+        return SimpleNamespace(id=f"ord-{symbol}", symbol=symbol, side=side.value, status="new")
+
+    submit_orders = AlpacaClient.submit_orders
+
+
+class TestRebalance:
+    """Batched rebalance submission."""
+
+    async def test_without_alpaca_only_plans(self, portfolio):
+        result = await portfolio._handle_rebalance({"target_allocations": {"VTI": 10}})
+        assert result["status"] == "rebalance_planned"
+
+    async def test_legs_are_submitted_concurrently(self, portfolio):
+        portfolio.alpaca_client = _FakeAlpaca(legs=2, failing=frozenset({"BND"}))
+
+        result = await portfolio._handle_rebalance(
+            {"target_allocations": {"VTI": "12.50", "BND": -5, "VXUS": 0}}
+        )
+
+        assert result["status"] == "rebalance_submitted"
+        assert sorted(portfolio.alpaca_client.submitted) == [
+            ("BND", "sell", Decimal("5.00")),
+            ("VTI", "buy", Decimal("12.50")),
+        ]
+        assert result["legs"]["VTI"]["status"] == "executed"
+        assert result["legs"]["VTI"]["order"]["order_id"] == "ord-VTI"
+        assert all(isinstance(n, Decimal) for _, _, n in portfolio.alpaca_client.submitted)
+        assert result["legs"]["BND"] == {"status": "failed", "error": "order rejected"}
+        assert "VXUS" not in result["legs"]  # zero-amount legs are not traded
+
+    async def test_non_compliant_leg_is_not_submitted(self, portfolio):
+        portfolio.alpaca_client = _FakeAlpaca(legs=1)
+        portfolio.set_active_directive(_directive(_constraint("max_allocation", "VTI", "10")))
+
+        result = await portfolio._handle_rebalance(
+            {"target_allocations": {"VTI": 25, "BND": 5}}
+        )
+
+        assert [s for s, _, _ in portfolio.alpaca_client.submitted] == ["BND"]
+        assert result["legs"]["VTI"]["status"] == "blocked_by_directive"
+        assert result["legs"]["BND"]["status"] == "executed"
+
+
+class TestToCents:
+    """Dollar → integer cent conversion."""
+
+    @pytest.mark.parametrize(
+        ("amount", "cents"),
+        [
+            (0.29, 29),  # float(0.29) * 100 == 28.999999999999996
+            (1.005, 101),  # half cent rounds up; the float is 1.00499999...
+            ("19.995", 2000),
+            (Decimal("20.004"), 2000),
+            (50, 5000),
+            ("-2.50", -250),
+        ],
+    )
+    def test_conversion(self, amount, cents):
+        assert _to_cents(amount) == cents
+
+    def test_large_amounts_are_exact(self):
+        assert _to_cents("12345678901234.56") == 1234567890123456
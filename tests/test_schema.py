@@ -6,6 +6,7 @@ Validates:
 - Model instantiation
 - Founding roles and permission tiers
 - Computed fields
+- Memoized computed fields stay consistent with their inputs
 """
 
 from __future__ import annotations
@@ -19,6 +20,7 @@ from nova_syntheia.constitution.schema import (
     ActionType,
     Branch,
     Citation,
+    ConstitutionalProvision,
     ConstitutionalRole,
     FOUNDING_PERMISSION_TIERS,
     FOUNDING_ROLES,
@@ -96,13 +98,18 @@ class TestFoundingRoles:
         portfolio = FOUNDING_ROLES["portfolio_executive"]
         assert portfolio.branch == Branch.EXECUTIVE
 
+    def test_founding_roles_are_read_only(self):
+        with pytest.raises(TypeError):
+            FOUNDING_ROLES["rogue"] = FOUNDING_ROLES["human_founder"]
+        assert hash(FOUNDING_ROLES["portfolio_executive"])
+
 
 class TestFoundingPermissionTiers:
     """Test the predefined Founding Era permission tiers."""
 
     def test_all_tiers_have_autonomous_actions(self):
         for tier_id, tier in FOUNDING_PERMISSION_TIERS.items():
-            assert isinstance(tier.autonomous_actions, list), f"Tier {tier_id} missing autonomous_actions"
+            assert isinstance(tier.autonomous_actions, frozenset), f"Tier {tier_id} missing autonomous_actions"
 
     def test_founder_tier_is_most_permissive(self):
         founder_tier = FOUNDING_PERMISSION_TIERS["tier_founder"]
@@ -132,6 +139,62 @@ class TestCitationModel:
         )
         assert "4" in c.reference or "IV" in c.reference
 
+    def test_trusted_matches_validated(self):
+        fields = {"article": "II", "section": 2, "text_excerpt": "t", "relevance": "r"}
+        trusted = Citation.trusted(**fields)
+        assert trusted == Citation(**fields)
+        assert trusted.model_dump() == Citation(**fields).model_dump()
+
+
+class TestMemoizedComputedFields:
+    """cached_property computed fields are invalidated by every change path."""
+
+    def test_citation_reference_follows_assignment(self):
+        c = Citation(article="II", section=2, text_excerpt="t", relevance="r")
+        assert c.reference == "Article II §2"
+        assert c.cached_dump()["reference"] == "Article II §2"
+
+        c.section = 3
+
+        assert c.reference == "Article II §3"
+        assert c.cached_dump()["reference"] == "Article II §3"
+
+    def test_citation_copy_with_update_recomputes(self):
+        c = Citation(article="II", section=2, text_excerpt="t", relevance="r")
+        assert c.reference == "Article II §2"
+
+        copied = c.model_copy(update={"article": None, "section": None, "amendment": 4})
+
+        assert copied.reference == "Amendment 4"
+        assert copied.model_dump()["reference"] == "Amendment 4"
+        assert c.reference == "Article II §2"
+
+    def test_member_instantiation_recomputed_on_copy(self):
+        m = Member(
+            name="Operations Agent",
+            member_type=MemberType.ARTIFICIAL,
+            has_role_definition=True,
+            has_permission_tier=True,
+            has_citation_capability=True,
+        )
+        assert m.is_constitutionally_instantiated is False
+
+        admitted = m.model_copy(update={"instantiation_ledger_entry": uuid4()})
+
+        assert admitted.is_constitutionally_instantiated is True
+        assert admitted.model_dump()["is_constitutionally_instantiated"] is True
+
+    def test_provision_reference_is_cached(self):
+        p = ConstitutionalProvision(
+            id="article_II_section_2",
+            article="II",
+            section=2,
+            title="Bounded Autonomy",
+            text="Act independently within clearly defined permission tiers.",
+        )
+        assert p.reference is p.reference
+        assert p.model_copy(update={"section": 5}).reference != p.reference
+
 
 class TestMemberModel:
     """Test the Member model — Art. I §4 constitutional instantiation."""